@@ -1,69 +1,148 @@
 """Sparksmetrics Flask application factory."""
+import time
 from datetime import datetime
-from pathlib import Path
 
-from dotenv import load_dotenv
-from flask import Flask, render_template, request
+from flask import Flask, current_app, render_template, request
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
 
+from app.config import _ENV_EXISTS, BASE_DIR, SQLITE_FALLBACK_URI, _read_env_file
 from app.models import db
-from app.routes.main import CASE_STUDIES, CASE_STUDY_ORDER, main_bp
+from app.routes.main import _case_study_cards, main_bp
 from app.youtube import get_latest_video_ids
 
-# Load .env from project root (parent of app/) so it works regardless of cwd
-_env_path = Path(__file__).resolve().parent.parent / ".env"
-load_dotenv(_env_path)
-
-
-def _read_env_var(path: Path, key: str) -> str:
-    """Read a single KEY from .env file; return value or empty string."""
-    if not path.exists():
-        return ""
-    try:
-        for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-            line = line.strip().replace("\r", "")
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            k, _, v = line.partition("=")
-            if k.strip() == key:
-                return v.strip().strip("'\"").replace("\r", "") or ""
-    except Exception:
-        pass
-    return ""
+# Load .env from project root (parent of app/) so it works regardless of cwd.
+# Production gets its env from the process manager, so skip importing dotenv when there is no file.
+_env_path = BASE_DIR / ".env"
+if _ENV_EXISTS:
+    from dotenv import load_dotenv
+
+    load_dotenv(_env_path)
+
+# Parsed .env, read once; create_app looks keys up here instead of re-scanning the file per key
+_env_cache = _read_env_file(_env_path) if _ENV_EXISTS else {}
+
+
+# Default video IDs when nothing is configured (so gallery always shows something)
+_DEFAULT_YT_IDS = ["vbUI7BW8PNI", "BKN3rEt45Sk", "qEd0zrqFYeg"]
+
+# Template context for inject_now; the callable never changes, so share one dict
+_NOW_CTX = {"now": datetime.utcnow}
+
+# Month names for the primary bar (avoids strftime)
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Static responses: long-lived cache headers (checked on every response, so keep the literals hoisted)
+_STATIC_PREFIX = "/static/"
+_CACHE_CTRL = "public, max-age=31536000"  # 1 year
+_NOSNIFF = "nosniff"
+
+# Database URIs whose schema has been checked in this process (repeat create_app calls skip the probe).
+# In-memory SQLite is never recorded: every app gets a fresh, empty database under the same URI.
+_schema_ready: set[str] = set()
+
+# (UTC day number, context dict) for the primary bar; only changes when the day rolls over
+_primary_bar_cache: tuple[int, dict] = (-1, {})
+
+
+def _is_memory_sqlite(uri: str) -> bool:
+    """True for sqlite://, sqlite:///:memory: and file:...?mode=memory URIs."""
+    url = make_url(uri)
+    if url.get_backend_name() != "sqlite":
+        return False
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _inject_now():
+    """Expose now() (UTC) to templates, e.g. for the footer year."""
+    return _NOW_CTX
+
+
+def _inject_primary_bar():
+    """Primary bar: month name + slots (3 on days 1–10, 2 on 11–20, 1 on 21–31)."""
+    global _primary_bar_cache
+    # Days since the epoch (UTC): integer compare per request, datetime only on rollover
+    bucket = int(time.time() // 86400)
+    if bucket == _primary_bar_cache[0]:
+        return _primary_bar_cache[1]
+    today = datetime.utcnow().date()
+    day = today.day
+    if day <= 10:
+        slots = 3
+    elif day <= 20:
+        slots = 2
+    else:
+        slots = 1
+    ctx = {
+        "primary_bar_month": _MONTHS[today.month - 1],
+        "primary_bar_slots": slots,
+    }
+    _primary_bar_cache = (bucket, ctx)
+    return ctx
+
+
+def _inject_youtube_videos():
+    """Inject YouTube video IDs for gallery: config list, else channel RSS, else default IDs."""
+    manual_ids = current_app.config.get("YOUTUBE_VIDEO_IDS") or ()
+    if manual_ids:
+        # Slice first, then copy: templates concatenate this with a list
+        video_ids = list(manual_ids[:12])
+    else:
+        channel_id = current_app.config.get("YOUTUBE_CHANNEL_ID") or ""
+        # app.youtube caches the feed (TTL, stale-while-refresh, short failure cache) and returns a fresh list
+        video_ids = get_latest_video_ids(channel_id, max_results=8) if channel_id else []
+    if not video_ids:
+        video_ids = _DEFAULT_YT_IDS
+    return {"youtube_video_ids": video_ids}
+
+
+def _inject_case_studies():
+    """Inject ordered case studies for cards (homepage + results). Single source of truth."""
+    return {"case_studies_list": _case_study_cards()}
 
 
 def create_app(config_object="app.config.Config") -> Flask:
     """Create and configure the Flask application."""
     app = Flask(__name__, template_folder="templates", static_folder="static")
     app.config.from_object(config_object)
+    cfg = app.config
 
     # Ensure BREVO/Slack from .env (avoids import-order issues with config module)
-    if not (app.config.get("BREVO_API_KEY") or "").strip():
-        app.config["BREVO_API_KEY"] = _read_env_var(_env_path, "BREVO_API_KEY")
-    if not (app.config.get("SLACK_WEBHOOK_URL") or "").strip():
-        app.config["SLACK_WEBHOOK_URL"] = _read_env_var(_env_path, "SLACK_WEBHOOK_URL")
-
-    # Ensure DATABASE_URL is set when running from script/certain environments (config may load from elsewhere)
-    if not app.config.get("SQLALCHEMY_DATABASE_URI") and _env_path.exists():
-        try:
-            for line in _env_path.read_text(encoding="utf-8", errors="replace").splitlines():
-                if "DATABASE_URL=" in line:
-                    v = line.split("=", 1)[1].strip().strip("'\"").replace("\r", "")
-                    if v:
-                        app.config["SQLALCHEMY_DATABASE_URI"] = v.replace("postgres://", "postgresql://", 1)
-                    break
-        except Exception:
-            pass
+    if not (cfg.get("BREVO_API_KEY") or "").strip():
+        cfg["BREVO_API_KEY"] = _env_cache.get("BREVO_API_KEY", "")
+    if not (cfg.get("SLACK_WEBHOOK_URL") or "").strip():
+        cfg["SLACK_WEBHOOK_URL"] = _env_cache.get("SLACK_WEBHOOK_URL", "")
 
+    # DATABASE_URL is resolved once in app.config (file, then environment); only custom configs can leave it unset
+    db_uri = (cfg.get("SQLALCHEMY_DATABASE_URI") or "").strip()
     # Fallback: local SQLite so the app runs without DATABASE_URL (e.g. local dev)
-    if not (app.config.get("SQLALCHEMY_DATABASE_URI") or "").strip():
-        _base = Path(__file__).resolve().parent.parent
-        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{(_base / 'local.db').as_posix()}"
+    if not db_uri:
+        db_uri = SQLITE_FALLBACK_URI
+    cfg["SQLALCHEMY_DATABASE_URI"] = db_uri
 
     db.init_app(app)
-    with app.app_context():
-        if app.config.get("SQLALCHEMY_DATABASE_URI"):
-            from app.models import Lead  # noqa: F401
-            db.create_all()
+    if db_uri not in _schema_ready:
+        with app.app_context():
+            from app.models import Lead
+            if not inspect(db.engine).has_table(Lead.__tablename__):
+                db.create_all()
+        if not _is_memory_sqlite(db_uri):
+            _schema_ready.add(db_uri)
+
+    if not app.debug:
+        # Templates only change on deploy: skip the per-render stat() and keep compiled bytecode across restarts
+        # (set via jinja_options: cache_size only takes effect when the environment is created)
+        cfg["TEMPLATES_AUTO_RELOAD"] = False
+        app.jinja_options = {
+            **app.jinja_options,
+            "auto_reload": False,
+            "cache_size": 400,
+            "bytecode_cache": FileSystemBytecodeCache(),
+        }
 
     app.register_blueprint(main_bp)
 
@@ -74,55 +153,18 @@ def create_app(config_object="app.config.Config") -> Flask:
     @app.after_request
     def static_cache_and_embed(response):
         """Static files: cacheable and safe to load from elsewhere (e.g. email signature images)."""
-        if request.path.startswith("/static/"):
-            response.headers.set("Cache-Control", "public, max-age=31536000")  # 1 year
-            # Don’t restrict who can load the resource (email clients, external referrers)
-            if "Content-Security-Policy" not in response.headers:
-                response.headers.set("X-Content-Type-Options", "nosniff")
+        if request.environ.get("PATH_INFO", "")[:8] != _STATIC_PREFIX:
+            return response
+        hdrs = response.headers
+        # Overwrite: send_file already set "no-cache", so setdefault would keep that
+        hdrs["Cache-Control"] = _CACHE_CTRL
+        # Don’t restrict who can load the resource (email clients, external referrers)
+        hdrs.setdefault("X-Content-Type-Options", _NOSNIFF)
         return response
 
-    @app.context_processor
-    def inject_now():
-        return {"now": datetime.utcnow}
-
-    @app.context_processor
-    def inject_primary_bar():
-        """Primary bar: month name + slots (3 on days 1–10, 2 on 11–20, 1 on 21–31)."""
-        utc = datetime.utcnow()
-        day = utc.day
-        if day <= 10:
-            slots = 3
-        elif day <= 20:
-            slots = 2
-        else:
-            slots = 1
-        return {
-            "primary_bar_month": utc.strftime("%B"),
-            "primary_bar_slots": slots,
-        }
-
-    # Default video IDs when nothing is configured (so gallery always shows something)
-    _DEFAULT_YT_IDS = ["vbUI7BW8PNI", "BKN3rEt45Sk", "qEd0zrqFYeg"]
-
-    @app.context_processor
-    def inject_youtube_videos():
-        """Inject YouTube video IDs for gallery: config list, else channel RSS, else default IDs."""
-        manual_ids = app.config.get("YOUTUBE_VIDEO_IDS") or []
-        if manual_ids:
-            video_ids = list(manual_ids)[:12]
-        else:
-            channel_id = app.config.get("YOUTUBE_CHANNEL_ID") or ""
-            video_ids = get_latest_video_ids(channel_id, max_results=8) if channel_id else []
-        if not video_ids:
-            video_ids = _DEFAULT_YT_IDS
-        return {"youtube_video_ids": video_ids}
-
-    @app.context_processor
-    def inject_case_studies():
-        """Inject ordered case studies for cards (homepage + results). Single source of truth."""
-        case_studies_list = [
-            (slug, CASE_STUDIES[slug]) for slug in CASE_STUDY_ORDER if slug in CASE_STUDIES
-        ]
-        return {"case_studies_list": case_studies_list}
+    app.context_processor(_inject_now)
+    app.context_processor(_inject_primary_bar)
+    app.context_processor(_inject_youtube_videos)
+    app.context_processor(_inject_case_studies)
 
     return app
@@ -1,13 +1,25 @@
 """Main (public) routes."""
+import functools
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timezone
 from flask import abort, Blueprint, current_app, jsonify, redirect, render_template, request, url_for, Response
+from werkzeug.http import generate_etag
 
 from app.models import Lead, db
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ModuleNotFoundError:  # Brevo/Slack sync is optional
+    requests = None
+
 BREVO_CONTACTS_URL = "https://api.brevo.com/v3/contacts"
+# Lead form email check (something@domain.tld, no whitespace); used with fullmatch
+_EMAIL_RE = re.compile(r"[^\s@]+@[^\s@]+\.[^\s@]+")
 
 main_bp = Blueprint("main", __name__)
 
@@ -18,243 +30,50 @@ def inject_enable_gtm():
     # Default to True so GTM is enabled unless explicitly turned off in config
     return {"ENABLE_GTM": current_app.config.get("ENABLE_GTM", True)}
 
-# Individual case study data (slug -> case dict for case_study.html)
-CASE_STUDIES = {
-    "global-restaurant-bookings": {
-        "meta_title": "62% Increase in Booking Conversions | Sparksmetrics",
-        "result_headline": "62% Increase in Booking Conversions",
-        "subtitle": "Redesigning key pages turned more visitors into paying guests.",
-        "updated_date": "13 October 2025",
-        "project_items": [
-            ("Industry", "Entertainment"),
-            ("Product Type", "Physical Service (Fine-Dining Experience)"),
-            ("Website Type", "Custom-Built"),
-            ("Testing Platform", "Convert.com"),
-            ("Goal", "Increase bookings"),
-            ("Duration", "5 months"),
-            ("Traffic Volume", "~1M visitors per month"),
-        ],
-        "challenge": [
-            "This global entertainment brand offers immersive fine-dining shows that blend food, theater, and technology. Despite massive social buzz and strong traffic from paid and organic channels, their site wasn't converting as it should.",
-            "Visitors loved the concept but were confused by the offer. The value proposition wasn't clear, the booking flow was cluttered with too many options, and social proof—one of the brand's strongest assets—was buried.",
-            "The result: high interest, low bookings, and wasted ad spend.",
-        ],
-        "approach": [
-            "We started with data. Session recordings, heatmaps, and analytics revealed where users hesitated and why. Three priorities emerged: simplify the message, remove friction, and make trust visible.",
-            "We redesigned the location page around a single promise: an unforgettable dining experience worth sharing. We clarified what the event is, who it's for, and what to expect—backed by social proof and strong CTAs. Next, we restructured the checkout to guide users step by step. Essential elements stayed visible; optional extras were moved deeper into the flow to reduce overwhelm.",
-            "Finally, we revamped the homepage, filling it with real guest photos, press mentions, and reviews—emotional proof that built trust before users ever clicked \"Book Now.\"",
-        ],
-        "tests": [
-            "Each change was validated through controlled A/B testing. The redesigned location page was tested against the original version using a 50/50 traffic split, with clear primary goals: booking start and completed transactions.",
-            "The checkout improvements were tested separately to measure drop-off reduction, and the homepage enhancements were validated through behavior metrics—engagement rate, time on page, and click-through to booking. All experiments ran until full statistical confidence was reached, ensuring the uplift wasn't by chance.",
-        ],
-        "result_metric": "+62.48% booking start conversions (100% statistical confidence)",
-        "result": [
-            "The redesigned location page achieved a +62.48% increase in booking start conversions, with 100% statistical confidence.",
-            "Checkout completion rates improved significantly, and bounce rates on the homepage dropped.",
-            "No new traffic. No extra ad spend. Just a refined user journey that helped people say \"yes\" faster.",
-            "By clarifying the offer and removing hesitation points, the brand turned existing visitors into paying guests—unlocking more revenue from the traffic they already had.",
-        ],
-        "card_title": "Global Dining & Entertainment Brand",
-        "card_metrics": [{"value": "8.53x", "label": "Return on Investment"}, {"value": "+63%", "label": "Conversion Rate"}],
-        "main_image": "images/location-page.jpg",
-        "results_image": "images/test-results.png",
-        "gallery_images": [
-            {"src": "images/location-page-figma.jpg", "caption": "Location page — Figma design"},
-            {"src": "images/screenshot-15-29.png", "caption": "Test setup"},
-            {"src": "images/screenshot-15-43.png", "caption": "Test results detail"},
-        ],
-    },
-    "shopify-premium-home-wellness-brand": {
-        "meta_title": "22% Lift in Conversion Rate for a Shopify Premium Home-Wellness Brand | Sparksmetrics",
-        "result_headline": "22% Lift in Conversion Rate for a Shopify Premium Home-Wellness Brand",
-        "subtitle": "Data-backed PDP experiments improved revenue per visitor.",
-        "updated_date": "13 October 2025",
-        "project_items": [
-            ("Industry", "Home wellness brand"),
-            ("Product Type", "Physical product"),
-            ("Website Type", "Shopify"),
-            ("Testing Platform", "Visually"),
-            ("Goal", "Increase revenue per session"),
-            ("Duration", "6 months"),
-            ("Traffic Volume", "~1M visitors per month"),
-        ],
-        "challenge": [
-            "The site was well-designed and functioned smoothly, but performance had plateaued. The low-hanging fruit was already gone.",
-            "To move the needle, we needed to understand why visitors hesitated, what details mattered most to them, and how to guide them toward higher-value behaviors—not just a single purchase, but ongoing subscription engagement.",
-            "Our challenge was twofold: (1) Identify micro-optimizations that could make a measurable difference on a mature site. (2) Ensure every improvement supported higher LTV, not just AOV or CR.",
-        ],
-        "approach": [
-            "We collaborated closely with the brand's designer and developer to plan and execute a series of high-impact A/B tests using Visually.io. Our process combined data analysis, UX research, and customer insight to form clear hypotheses for each test.",
-            "We mapped the entire user journey—from browsing to checkout—and identified opportunities to: strengthen the visual hierarchy of subscription options; simplify decision-making on the PDP; bring trust and social proof closer to conversion moments; improve content flow above and below the fold.",
-            "Every idea was implemented with design precision and technical accuracy, ensuring visual consistency while maintaining site speed and stability.",
-        ],
-        "tests": [
-            "Over several months, we tested multiple sections of the site: Collection Page (clarified product positioning and improved filter hierarchy); Product Pages above and below the fold (refined messaging, restructured variants, repositioned testimonials); Add-to-Cart options (simplified subscriptions, made recurring benefits more prominent); Checkout testimonials (added persuasive elements to reduce last-minute drop-offs).",
-            "Not every variant won—that's exactly how we validated what truly influenced conversions and retention. The most successful tests showed +22.5% to +10% lifts in conversion rate, with corresponding increases in revenue per visitor and subscription adoption.",
-        ],
-        "result_metric": "+10% to +22.5% conversion lift on product pages",
-        "result": [
-            "The experiments confirmed a strong return on testing investment: +10%–+22.5% conversion lift on the product pages; increased subscription selection and retention rates across tested products.",
-            "By focusing on behavior-driven design and LTV-oriented testing, we helped the brand convert more visitors and create longer-lasting customer relationships—without increasing ad spend.",
-        ],
-        "card_title": "Shopify Subscription-Based Wellness Brand",
-        "card_metrics": [{"value": "+6%", "label": "Subscriptions"}, {"value": "+22%", "label": "Conversion Rate"}, {"value": "+5%", "label": "Average Order Value"}],
-        "main_image": "images/wellness-main.jpg",
-        "results_images": [
-            {"src": "images/wellness-results-1.png", "caption": "A/B test results"},
-            {"src": "images/wellness-results-2.png", "caption": "Test results detail"},
-        ],
-        "gallery_images": [
-            {"src": "images/wellness-figma.jpg", "caption": "Figma design"},
-            {"src": "images/wellness-screenshot-1.png", "caption": "Test setup"},
-            {"src": "images/wellness-screenshot-2.png", "caption": "Screenshot"},
-            {"src": "images/wellness-screenshot-3.png", "caption": "Screenshot"},
-        ],
-    },
-    "ai-brand-redesign": {
-        "meta_title": "Redesigning an AI Brand for Higher Credibility and Lead Growth | Sparksmetrics",
-        "result_headline": "Redesigning an AI Brand for Higher Credibility and Lead Growth",
-        "subtitle": "Elevated trust, clarity, and conversions.",
-        "updated_date": "13 October 2025",
-        "project_items": [
-            ("Client", "AI technology company"),
-            ("Website Type", "WordPress"),
-            ("Goal", "Generate more qualified leads"),
-        ],
-        "challenge": [
-            "The existing website faced two main challenges: perception and structure.",
-            "From a visual standpoint, the design felt dated and failed to convey the sophistication of the company's technology. Structurally, the site lacked a logical flow from problem to solution to proof, making it difficult for visitors to understand the value proposition and take action.",
-            "As a result, potential clients were leaving without engaging further—not because of low-quality traffic, but because the experience did not inspire confidence.",
-        ],
-        "approach": [
-            "We focused on three key pillars: clarity, credibility, and conversion intent.",
-            "The new structure guided visitors through a clear and persuasive journey: a focused value proposition above the fold (outcomes rather than features); content reorganized to present the problem, the solution, and the evidence that builds trust; a refined visual language, cohesive typography, and modern layout that convey confidence and professionalism.",
-            "Every design and copy element worked together to build trust and encourage meaningful conversions.",
-        ],
-        "tests": [
-            "Full redesign and launch—no A/B tests; the new site replaced the existing experience.",
-        ],
-        "result_metric": "Higher credibility, stronger engagement, increased lead generation",
-        "result": [
-            "The redesign fundamentally changed how the brand is perceived online. The new website presents a modern, credible, and trustworthy image aligned with the company's position in the AI sector.",
-            "Through improved storytelling, structure, and visual execution, the site now drives stronger engagement, increased lead generation, and a higher level of confidence among prospective clients.",
-        ],
-        "card_title": "AI Brand Redesign for Lead Growth",
-        "card_metrics": [],
-        "main_image": "images/ai-main.jpg",
-        "gallery_images": [
-            {"src": "images/ai-figma-1.jpg", "caption": "Figma design"},
-            {"src": "images/ai-figma-2.jpg", "caption": "Figma design"},
-            {"src": "images/ai-figma-3.jpg", "caption": "Figma design"},
-            {"src": "images/ai-figma-4.jpg", "caption": "Figma design"},
-        ],
-    },
-    "shopify-bidet-brand": {
-        "meta_title": "20% Increase in Conversion Rate for a Shopify Home-Essentials Brand | Sparksmetrics",
-        "result_headline": "20% Increase in Conversion Rate for a Shopify Home-Essentials Brand",
-        "subtitle": "Redesigning the product page and homepage to improve engagement.",
-        "updated_date": "13 October 2025",
-        "project_items": [
-            ("Client", "Shopify home-essentials brand (bidet products)"),
-            ("Website Type", "Shopify"),
-            ("Testing Platform", "Visually.io"),
-            ("Goal", "Increase add-to-cart rate and product discovery"),
-        ],
-        "challenge": [
-            "The original website was functional and visually appealing but underperforming in two areas: user engagement and conversion clarity. The homepage did not effectively drive visitors toward products, and the product detail page lacked focus above the fold—forcing users to scroll before understanding why the product was worth purchasing.",
-            "Our challenge was to improve how quickly visitors understood the value proposition and how easily they could act on it.",
-        ],
-        "approach": [
-            "We focused on two high-impact areas: the homepage and the product detail page (PDP).",
-            "On the homepage, we restructured content to prioritize product discovery—surfacing key categories earlier and aligning the visual hierarchy around the main call-to-action. On the PDP, we redesigned the above-the-fold section to communicate trust and utility faster: simplified messaging, highlighted top differentiators (universal fit, savings, DIY installation), and improved the visual balance between product imagery, reviews, and purchase options.",
-            "All tests were implemented and measured on Shopify using Visually.io in close collaboration with the brand's design and development teams.",
-        ],
-        "tests": [
-            "A/B tests on the redesigned PDP and homepage—measured for conversion rate, add-to-cart rate, and revenue per visitor.",
-        ],
-        "result_metric": "+20% conversion rate (99% confidence); revenue per visitor and add-to-cart up",
-        "result": [
-            "The redesigned PDP achieved a +20% increase in conversion rate, with a 99% confidence level. Revenue per visitor and add-to-cart rates followed a similar upward trend.",
-            "By combining design clarity with data-driven experimentation, we helped the brand turn more visitors into buyers—improving efficiency and revenue without additional ad spend.",
-        ],
-        "card_title": "Leading Shopify Home-Essentials Brand",
-        "card_metrics": [{"value": "+20%", "label": "Conversion Rate"}, {"value": "+15%", "label": "Per Session Value"}],
-        "main_image": "images/bidet-main.jpg",
-        "gallery_images": [
-            {"src": "images/bidet-gallery.jpg", "caption": "Product page design"},
-        ],
-    },
-    "global-tour-brand": {
-        "meta_title": "Improving Booking Experience for a Global Tour Brand | Sparksmetrics",
-        "result_headline": "Improving Booking Experience for a Global Tour Brand",
-        "subtitle": "A custom-built redesign focused on clarity, simplicity, and user confidence.",
-        "updated_date": "13 October 2025",
-        "project_items": [
-            ("Client", "Global tour operator (travel & culinary experiences)"),
-            ("Website Type", "Custom-built booking platform"),
-            ("Goal", "Increase booking rate; make process intuitive, fast, trustworthy"),
-        ],
-        "challenge": [
-            "While the platform was technically robust, the user journey was complex. Visitors struggled to understand key booking details—tour availability, pricing options, and what to expect at each step.",
-            "The design lacked visual hierarchy, and the booking widget felt heavy, creating friction that discouraged users from completing reservations. We needed to create a flow that reduced decision fatigue and built confidence in booking directly through the site.",
-        ],
-        "approach": [
-            "We began by mapping the full user journey from discovery to confirmation, identifying where users hesitated or dropped off. Our approach focused on three principles: Clarity (simplified information architecture so visitors immediately understood the offer, inclusions, and next steps); Trust (highlighted social proof—reviews, partner logos, booking guarantees—near action points); Ease of Use (redesigned the PDP booking module for better flow on desktop and mobile, making date, guest, and location selection frictionless).",
-            "Every design decision was guided by data from prior analytics and user behavior insights, ensuring we addressed genuine pain points rather than assumptions.",
-        ],
-        "tests": [
-            "Redesign and launch of the PDP booking experience—no A/B test metrics specified; focus on clarity, trust, and ease of use.",
-        ],
-        "result_metric": "Cleaner, more confident booking experience aligned with global reputation",
-        "result": [
-            "The new design delivers a cleaner, more confident booking experience that aligns with the brand's global reputation.",
-            "By improving clarity, reducing friction, and reinforcing trust at every step, the new PDPs are set to convert a higher share of visitors into paying guests—particularly on high-intent traffic from search and retargeting campaigns.",
-        ],
-        "card_title": "Global Food Tour Brand",
-        "card_metrics": [],
-        "main_image": "images/tour-main.jpg",
-        "gallery_images": [
-            {"src": "images/tour-gallery-1.jpg", "caption": "Booking experience"},
-            {"src": "images/tour-gallery-2.jpg", "caption": "PDP design"},
-        ],
-    },
-    "national-fitness-franchise": {
-        "meta_title": "High-Conversion Product Pages for a National Kids Fitness Franchise | Sparksmetrics",
-        "result_headline": "Designing High-Conversion Product Pages for a National Kids Fitness Franchise",
-        "subtitle": "A custom-built solution to showcase safety, trust, and fun.",
-        "updated_date": "13 October 2025",
-        "project_items": [
-            ("Client", "U.S. franchise — children's fitness and movement programs"),
-            ("Scope", "Design and custom development of product pages"),
-            ("Goal", "Drive class bookings; convert parents into trial sign-ups"),
-        ],
-        "challenge": [
-            "The existing site successfully explained the concept but did not effectively convert visitors into bookings. Parents wanted reassurance that classes were safe, structured, and taught by professionals—but the original content hierarchy buried unique benefits and left key questions unanswered.",
-            "Our challenge was to redesign the experience to clearly highlight the program's USPs: certified instructors, small class sizes, expert safety standards, and developmental benefits—all while keeping the layout engaging and easy to navigate.",
-        ],
-        "approach": [
-            "We focused on clarity, credibility, and emotional appeal. Each new product page was designed to mirror the excitement of the in-person experience while addressing parents' core concerns: a clear above-the-fold section with strong visuals, age group targeting, and direct CTAs; content structured around benefit-driven storytelling (safety, learning, fun); visual proof points such as ratings, parent testimonials, and instructor credentials; a warm, energetic color palette and photography consistent with the brand's family-oriented image.",
-            "The pages were fully custom-built, optimized for scalability, and integrated with the franchise's booking system to streamline sign-ups.",
-        ],
-        "tests": [
-            "Custom design and build; pages launched to support trial sign-ups and franchise replication.",
-        ],
-        "result_metric": "Trusted national leader in kids' fitness; stronger engagement, more trial requests",
-        "result": [
-            "The new design positions the brand as a trusted national leader in kids' fitness, balancing professionalism with playfulness.",
-            "Parents now understand what makes the program unique within seconds—leading to stronger engagement, more trial requests, and higher conversion potential across all franchise locations.",
-        ],
-        "card_title": "USA National Kids Fitness Franchise",
-        "card_metrics": [],
-        "main_image": "images/fitness-main.jpg",
-        "gallery_images": [
-            {"src": "images/fitness-gallery-1.jpg", "caption": "Product page design"},
-            {"src": "images/fitness-gallery-2.jpg", "caption": "Figma design"},
-            {"src": "images/fitness-gallery-3.jpg", "caption": "Figma design"},
-        ],
-    },
-}
+# GET pages whose HTML is the same for every visitor: short shared cache + ETag so CDNs/browsers can revalidate (304)
+_CACHEABLE_ENDPOINTS = frozenset({
+    "main.index",
+    "main.cro",
+    "main.analytics",
+    "main.results",
+    "main.case_study",
+    "main.privacy_policy",
+    "main.terms",
+    "main.sitemap",
+    "main.cro_ebook",
+    "main.schedule_a_call",
+})
+_PAGE_MAX_AGE = 300  # 5 minutes
+_PAGE_STALE_WHILE_REVALIDATE = 86400  # 1 day
+
+
+@main_bp.after_request
+def cache_public_pages(response):
+    """Add Cache-Control + ETag to cacheable GET pages and answer If-None-Match with 304."""
+    if (
+        request.endpoint not in _CACHEABLE_ENDPOINTS
+        or request.method not in ("GET", "HEAD")
+        or response.status_code != 200
+    ):
+        return response
+    response.cache_control.public = True
+    response.cache_control.max_age = _PAGE_MAX_AGE
+    response.cache_control.stale_while_revalidate = _PAGE_STALE_WHILE_REVALIDATE
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+# Individual case study data (slug -> case dict for case_study.html); the prose lives in
+# app/data/case_studies.json so it is only read by workers that actually render case studies
+_CASE_STUDIES_PATH = Path(__file__).resolve().parents[1] / "data" / "case_studies.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_case_studies() -> MappingProxyType:
+    """Case studies keyed by slug, read once on first use. Read-only: views and templates share it."""
+    with _CASE_STUDIES_PATH.open(encoding="utf-8") as fh:
+        return MappingProxyType(json.load(fh))
+
 
 # Display order for case study cards (homepage + results). Add new slugs here to show everywhere.
 CASE_STUDY_ORDER = [
@@ -266,6 +85,14 @@ CASE_STUDY_ORDER = [
     "national-fitness-franchise",
 ]
 
+
+@functools.lru_cache(maxsize=1)
+def _case_study_cards() -> tuple:
+    """Ordered (slug, case) pairs for the case study cards, built once."""
+    cases = _load_case_studies()
+    return tuple((slug, cases[slug]) for slug in CASE_STUDY_ORDER if slug in cases)
+
+
 def _load_blog_posts() -> list[dict]:
     """Load blog posts metadata from app/blog_posts.json (cron-friendly)."""
     path = Path(__file__).resolve().parents[1] / "blog_posts.json"
@@ -371,10 +198,25 @@ def index():
     return render_template("landing_alt.html")
 
 
+_FAVICON_CACHE_CTRL = "public, max-age=31536000, immutable"  # 1 year
+
+
+@main_bp.record_once
+def _load_favicon(state) -> None:
+    """Read the SVG favicon once so /favicon.ico can answer without a redirect."""
+    try:
+        state.app.extensions["favicon_svg"] = (Path(state.app.static_folder) / "favicon.svg").read_bytes()
+    except OSError:
+        state.app.extensions["favicon_svg"] = None
+
+
 @main_bp.route("/favicon.ico")
 def favicon():
-    """Redirect to SVG favicon so browsers that request .ico get the icon."""
-    return redirect(url_for("static", filename="favicon.svg"))
+    """Serve the SVG favicon directly so browsers that request .ico get the icon in one round-trip."""
+    svg = current_app.extensions["favicon_svg"]
+    if svg is None:
+        return redirect(url_for("static", filename="favicon.svg"))
+    return Response(svg, mimetype="image/svg+xml", headers={"Cache-Control": _FAVICON_CACHE_CTRL})
 
 
 @main_bp.route("/cro")
@@ -404,10 +246,46 @@ RESOURCE_DOWNLOADS = {
     "cro-checklist": {"filename": "13-bulletproof-strategies-conversions-sparksmetrics.pdf"},
 }
 
+# Shared HTTP session for Brevo/Slack so keep-alive reuses the TLS connection across leads (created on first use)
+_HTTP = None
+
+
+def _get_http():
+    """Return the shared requests.Session (requires requests to be installed)."""
+    global _HTTP
+    if _HTTP is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        _HTTP = session
+    return _HTTP
+
+
+@main_bp.record_once
+def _precompute_lead_settings(state) -> None:
+    """Resolve lead integration settings once at registration; config doesn't change after startup."""
+    cfg = state.app.config
+    # Enabled flags, so disabled integrations (the usual case in dev) cost one dict read per lead
+    state.app.extensions["integrations"] = {
+        "db": bool(cfg.get("SQLALCHEMY_DATABASE_URI")),
+        "brevo": bool((cfg.get("BREVO_API_KEY") or "").strip()),
+        "slack": bool((cfg.get("SLACK_WEBHOOK_URL") or "").strip()),
+    }
+    # Brevo list IDs per lead kind
+    base = list(cfg.get("BREVO_LIST_IDS") or [])
+
+    def with_extra(extra_id) -> list[int]:
+        return base + [extra_id] if extra_id and extra_id not in base else list(base)
+
+    state.app.extensions["brevo_list_ids"] = {
+        "audit": with_extra(cfg.get("BREVO_AUDIT_LIST_ID")),
+        "cro-checklist": with_extra(cfg.get("BREVO_CRO_EBOOK_LIST_ID")),
+        "default": base,
+    }
+
 
 def _save_lead(fname: str, email: str, submission_type: str, resource_slug: str | None = None) -> None:
     """Persist lead to Postgres if DATABASE_URL is set. Logs errors, does not raise."""
-    if not current_app.config.get("SQLALCHEMY_DATABASE_URI"):
+    if not current_app.extensions["integrations"]["db"]:
         return
     try:
         lead = Lead(
@@ -423,23 +301,24 @@ def _save_lead(fname: str, email: str, submission_type: str, resource_slug: str
         db.session.rollback()
 
 
+def _brevo_list_kind(submission_type: str, resource_slug: str | None) -> str:
+    """Key into app.extensions["brevo_list_ids"] for this submission."""
+    if submission_type == "audit":
+        return "audit"
+    if submission_type == "resource" and resource_slug == "cro-checklist":
+        return "cro-checklist"
+    return "default"
+
+
 def _sync_lead_to_brevo(
     fname: str, email: str, submission_type: str, resource_slug: str | None = None
 ) -> None:
     """Add or update contact in Brevo if BREVO_API_KEY is set. Logs errors, does not raise."""
-    api_key = (current_app.config.get("BREVO_API_KEY") or "").strip()
-    if not api_key:
+    if not current_app.extensions["integrations"]["brevo"]:
         current_app.logger.info("Brevo: BREVO_API_KEY not set in .env, skipping contact sync")
         return
-    list_ids = list(current_app.config.get("BREVO_LIST_IDS") or [])
-    if submission_type == "resource" and resource_slug == "cro-checklist":
-        cro_ebook_id = current_app.config.get("BREVO_CRO_EBOOK_LIST_ID")
-        if cro_ebook_id and cro_ebook_id not in list_ids:
-            list_ids.append(cro_ebook_id)
-    if submission_type == "audit":
-        audit_list_id = current_app.config.get("BREVO_AUDIT_LIST_ID")
-        if audit_list_id and audit_list_id not in list_ids:
-            list_ids.append(audit_list_id)
+    api_key = current_app.config["BREVO_API_KEY"].strip()
+    list_ids = current_app.extensions["brevo_list_ids"][_brevo_list_kind(submission_type, resource_slug)]
     payload = {
         "email": email,
         "attributes": {"FNAME": fname},
@@ -447,15 +326,13 @@ def _sync_lead_to_brevo(
     }
     if list_ids:
         payload["listIds"] = list_ids
-    try:
-        import requests
-    except ModuleNotFoundError:
+    if requests is None:
         current_app.logger.warning(
             "Brevo sync skipped: install requests with: pip install requests"
         )
         return
     try:
-        r = requests.post(
+        r = _get_http().post(
             BREVO_CONTACTS_URL,
             json=payload,
             headers={"api-key": api_key, "Content-Type": "application/json"},
@@ -475,9 +352,9 @@ def _notify_slack_lead(
     fname: str, email: str, submission_type: str, resource_slug: str | None = None
 ) -> None:
     """Post a short message to Slack when a lead is submitted. Logs errors, does not raise."""
-    webhook_url = (current_app.config.get("SLACK_WEBHOOK_URL") or "").strip()
-    if not webhook_url:
+    if not current_app.extensions["integrations"]["slack"]:
         return
+    webhook_url = current_app.config["SLACK_WEBHOOK_URL"].strip()
     if submission_type == "audit":
         label = "Free CRO audit"
     elif submission_type == "resource" and resource_slug == "cro-checklist":
@@ -485,13 +362,11 @@ def _notify_slack_lead(
     else:
         label = "Resource download"
     text = "New lead: *{}* <{}> – {}".format(fname, email, label)
-    try:
-        import requests
-    except ModuleNotFoundError:
+    if requests is None:
         current_app.logger.warning("Slack notify skipped: install requests (pip install requests)")
         return
     try:
-        r = requests.post(
+        r = _get_http().post(
             webhook_url,
             json={"text": text},
             headers={"Content-Type": "application/json"},
@@ -503,6 +378,32 @@ def _notify_slack_lead(
         current_app.logger.warning("Slack notify error: %s", e)
 
 
+# Lead side effects (DB, Brevo, Slack) run off the request thread so form POSTs return right after validation
+_LEAD_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lead-sync")
+
+
+def _run_lead_tasks(
+    app, fname: str, email: str, submission_type: str, resource_slug: str | None, notify_slack: bool
+) -> None:
+    """Save, sync and notify for one lead inside an app context (executor thread)."""
+    with app.app_context():
+        try:
+            _save_lead(fname, email, submission_type, resource_slug=resource_slug)
+            _sync_lead_to_brevo(fname, email, submission_type, resource_slug=resource_slug)
+            if notify_slack:
+                _notify_slack_lead(fname, email, submission_type, resource_slug=resource_slug)
+        except Exception as e:
+            app.logger.warning("Lead background task failed: %s", e)
+
+
+def _dispatch_lead(
+    fname: str, email: str, submission_type: str, resource_slug: str | None = None, notify_slack: bool = False
+) -> None:
+    """Queue lead persistence/sync on the background executor; returns immediately."""
+    app = current_app._get_current_object()
+    _LEAD_EXECUTOR.submit(_run_lead_tasks, app, fname, email, submission_type, resource_slug, notify_slack)
+
+
 @main_bp.route("/client-event", methods=["POST"])
 def client_event():
     """Receive lightweight client-side diagnostic events (beacon/POST)."""
@@ -611,6 +512,17 @@ def admin_client_events():
         abort(500)
 
 
+# Lead form error bodies never change, so encode them once; each call still returns a fresh Response
+_ERR_FNAME = json.dumps({"success": False, "error": "First name required"}, separators=(",", ":")).encode()
+_ERR_EMAIL = json.dumps({"success": False, "error": "Invalid email"}, separators=(",", ":")).encode()
+_ERR_RESOURCE = json.dumps({"success": False, "error": "Unknown resource"}, separators=(",", ":")).encode()
+_OK_BODY = b'{"success":true}'
+
+
+def _json_body(body: bytes, status: int = 200) -> Response:
+    return Response(body, status=status, mimetype="application/json")
+
+
 @main_bp.route("/request-audit", methods=["POST"])
 def request_audit():
     """Collect fname and email for free CRO audit request; returns success (no file)."""
@@ -618,12 +530,11 @@ def request_audit():
     fname = (data.get("fname") or "").strip()
     email = (data.get("email") or "").strip()
     if not fname:
-        return jsonify({"success": False, "error": "First name required"}), 400
-    if not email or not re.match(r"^[^\s@]+@[^\s@]+\.[^\s@]+$", email):
-        return jsonify({"success": False, "error": "Invalid email"}), 400
-    _save_lead(fname, email, "audit", resource_slug=None)
-    _sync_lead_to_brevo(fname, email, "audit", resource_slug=None)
-    return jsonify({"success": True})
+        return _json_body(_ERR_FNAME, 400)
+    if not email or not _EMAIL_RE.fullmatch(email):
+        return _json_body(_ERR_EMAIL, 400)
+    _dispatch_lead(fname, email, "audit", resource_slug=None)
+    return _json_body(_OK_BODY)
 
 
 @main_bp.route("/download-resource", methods=["POST"])
@@ -634,15 +545,13 @@ def download_resource():
     email = (data.get("email") or "").strip()
     slug = (data.get("resource") or "").strip()
     if not fname:
-        return jsonify({"success": False, "error": "First name required"}), 400
-    if not email or not re.match(r"^[^\s@]+@[^\s@]+\.[^\s@]+$", email):
-        return jsonify({"success": False, "error": "Invalid email"}), 400
+        return _json_body(_ERR_FNAME, 400)
+    if not email or not _EMAIL_RE.fullmatch(email):
+        return _json_body(_ERR_EMAIL, 400)
     resource = RESOURCE_DOWNLOADS.get(slug) if slug else None
     if not resource:
-        return jsonify({"success": False, "error": "Unknown resource"}), 400
-    _save_lead(fname, email, "resource", resource_slug=slug or None)
-    _sync_lead_to_brevo(fname, email, "resource", resource_slug=slug or None)
-    _notify_slack_lead(fname, email, "resource", resource_slug=slug or None)
+        return _json_body(_ERR_RESOURCE, 400)
+    _dispatch_lead(fname, email, "resource", resource_slug=slug or None, notify_slack=True)
     download_url = url_for("static", filename="downloads/" + resource["filename"])
     return jsonify({"success": True, "download_url": download_url})
 
@@ -662,7 +571,7 @@ def results():
 @main_bp.route("/results/<slug>")
 def case_study(slug):
     """Individual portfolio / case study page."""
-    case = CASE_STUDIES.get(slug)
+    case = _load_case_studies().get(slug)
     if not case:
         abort(404)
     return render_template("case_study.html", case=case)
@@ -706,8 +615,8 @@ def terms():
 
 @main_bp.route("/terms-and-conditions")
 def terms_and_conditions():
-    """Terms and conditions (alternate URL)."""
-    return render_template("terms.html")
+    """Terms and conditions (alternate URL) — redirect to the canonical /terms."""
+    return redirect(url_for("main.terms"), code=301)
 
 
 @main_bp.route("/earnings-disclaimer")
@@ -716,59 +625,79 @@ def earnings_disclaimer():
     return render_template("placeholder.html", title="Earnings Disclaimer")
 
 
+# Sitemap: static pages (endpoint, url_for kwargs); case study and blog post URLs are appended after these.
+_SITEMAP_PAGES = (
+    ("main.index", {}),
+    ("main.cro", {}),
+    ("main.analytics", {}),
+    ("main.results", {}),
+    ("main.blog_index", {}),
+    ("main.schedule_a_call", {}),
+    ("main.cro_ebook", {}),
+    ("main.privacy_policy", {}),
+    ("main.terms", {}),
+    ("main.earnings_disclaimer", {}),
+)
+_BLOG_POSTS_PATH = Path(__file__).resolve().parents[1] / "blog_posts.json"
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"})
+_SITEMAP_HEAD = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+_SITEMAP_URL = "  <url>\n    <loc>{}</loc>\n  </url>\n"
+_SITEMAP_TAIL = "</urlset>"
+
+
+def _iter_sitemap():
+    """Yield the sitemap XML in fragments: head, one <url> entry per page, tail."""
+    yield _SITEMAP_HEAD
+    # Endpoints all live in this blueprint, so url_for can't fail here; a BuildError is a deploy bug
+    for endpoint, kwargs in _SITEMAP_PAGES:
+        yield _SITEMAP_URL.format(url_for(endpoint, _external=True, **kwargs).translate(_XML_ESCAPE))
+    for slug in _load_case_studies():
+        yield _SITEMAP_URL.format(url_for("main.case_study", slug=slug, _external=True).translate(_XML_ESCAPE))
+    # blog_posts.json is written by cron jobs: skip entries without a slug instead of guarding each call
+    for post in _load_blog_posts():
+        if isinstance(post, dict) and post.get("slug"):
+            yield _SITEMAP_URL.format(url_for("main.blog_post", slug=post["slug"], _external=True).translate(_XML_ESCAPE))
+    yield _SITEMAP_TAIL
+
+
+@functools.lru_cache(maxsize=4)
+def _build_sitemap_xml(url_root: str, posts_mtime_ns: int) -> tuple[bytes, str]:
+    """Render the sitemap body and its ETag for one host. Cached per url_root; blog_posts.json mtime invalidates it."""
+    body = "".join(_iter_sitemap()).encode("utf-8")
+    return body, generate_etag(body)
+
+
 @main_bp.route("/sitemap.xml")
 def sitemap():
     """Generate sitemap XML with all public pages and case study URLs."""
-    pages = [
-        ("main.index", {}),
-        ("main.cro", {}),
-        ("main.analytics", {}),
-        ("main.results", {}),
-        ("main.blog_index", {}),
-        ("main.schedule_a_call", {}),
-        ("main.cro_ebook", {}),
-        ("main.privacy_policy", {}),
-        ("main.terms", {}),
-        ("main.earnings_disclaimer", {}),
-    ]
-    urls = []
-    for endpoint, kwargs in pages:
-        try:
-            urls.append(url_for(endpoint, _external=True, **kwargs))
-        except Exception:
-            pass
-    for slug in CASE_STUDIES:
-        try:
-            urls.append(url_for("main.case_study", slug=slug, _external=True))
-        except Exception:
-            pass
-    for post in _load_blog_posts():
-        try:
-            urls.append(url_for("main.blog_post", slug=post["slug"], _external=True))
-        except Exception:
-            pass
-    def escape_loc(s: str) -> str:
-        return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;").replace("'", "&apos;")
-
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
-    for loc in urls:
-        xml_lines.append("  <url>")
-        xml_lines.append(f"    <loc>{escape_loc(loc)}</loc>")
-        xml_lines.append("  </url>")
-    xml_lines.append("</urlset>")
-    return Response("\n".join(xml_lines), mimetype="application/xml")
+    try:
+        posts_mtime_ns = _BLOG_POSTS_PATH.stat().st_mtime_ns
+    except OSError:
+        posts_mtime_ns = 0
+    body, etag = _build_sitemap_xml(request.url_root, posts_mtime_ns)
+    resp = Response(body, mimetype="application/xml")
+    resp.content_length = len(body)
+    # Set here so cache_public_pages' add_etag() doesn't re-hash the same bytes on every request
+    resp.set_etag(etag)
+    return resp
 
 
-@main_bp.route("/robots.txt")
-def robots():
-    """Serve robots.txt allowing crawlers and pointing to sitemap."""
-    base = request.url_root.rstrip("/")
-    body = f"""User-agent: *
+_ROBOTS_CACHE_CTRL = "public, max-age=86400"  # 1 day
+
+
+@functools.lru_cache(maxsize=8)
+def _robots_body(base: str) -> bytes:
+    """robots.txt for one host; only the sitemap URL varies."""
+    return f"""User-agent: *
 Allow: /
 
 Sitemap: {base}/sitemap.xml
-"""
-    return Response(body, mimetype="text/plain")
+""".encode("utf-8")
+
+
+@main_bp.route("/robots.txt")
+def robots():
+    """Serve robots.txt allowing crawlers and pointing to sitemap."""
+    # host_url skips url_root's script-root join; the app is served at "/" (see deploy/nginx-sparksmetrics.conf)
+    body = _robots_body(request.host_url.rstrip("/"))
+    return Response(body, mimetype="text/plain", headers={"Cache-Control": _ROBOTS_CACHE_CTRL})
@@ -1,12 +1,177 @@
 """Fetch latest YouTube channel videos via RSS (no API key required)."""
+import functools
+import gzip
+import json
+import os
 import re
+import sys
+import threading
 import time
 import urllib.request
-import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from cachetools import TTLCache
+
+from app.config import BASE_DIR
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# lxml parses in C (libxml2); the stdlib ElementTree API is the same, so fall back to it when lxml is absent
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Atom feed tags in Clark notation ({namespace}local): matched directly, no prefix lookup per find()
+_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+_LINK_TAG = "{http://www.w3.org/2005/Atom}link"
+_VIDEOID_TAG = "{http://www.youtube.com/xml/schemas/2015}videoId"
+# Video ID from a watch URL (...?v=VIDEO_ID), used when an entry has no yt:videoId
+_V_PARAM_RE = re.compile(r"[?&]v=([a-zA-Z0-9_-]{11})")
+
+# Atom XML compresses well; urllib3 decodes gzip on read, the urlopen fallback unwraps it explicitly
+_FEED_HEADERS = {"User-Agent": "Sparksmetrics/1.0", "Accept-Encoding": "gzip"}
+# Pooled keep-alive connections to youtube.com, so cache misses skip a fresh TCP+TLS handshake (urlopen fallback)
+_http = urllib3.PoolManager(num_pools=2, maxsize=4) if urllib3 is not None else None
+# Separate budgets so a stuck handshake fails fast; together they stay within the old 10 s
+_FEED_TIMEOUT = urllib3.Timeout(connect=3, read=7) if urllib3 is not None else None
+_FEED_TIMEOUT_FALLBACK = 10  # urlopen takes one timeout for connect and each read
 
-# In-memory cache: (channel_id, max_results) -> (timestamp, list of video_ids)
-_yt_cache = {}
 _CACHE_SECONDS = 900  # 15 minutes
+# After _CACHE_SECONDS an entry is stale: still served (up to _STALE_SECONDS old) while a background thread refreshes it
+_STALE_SECONDS = 3600
+# In-memory cache: (channel_id, max_results) -> (expires_at, tuple of video_ids). Bounded, dropped after _STALE_SECONDS.
+_yt_cache: TTLCache = TTLCache(maxsize=256, ttl=_STALE_SECONDS)
+# Keys with a background refresh in flight (at most one thread per key)
+_yt_refreshing: set[tuple[str, int]] = set()
+# Failed fetches, remembered briefly so an outage doesn't cost every page load a fresh 10 s timeout
+_FAILURE_CACHE_SECONDS = 60
+_yt_neg_cache: TTLCache = TTLCache(maxsize=128, ttl=_FAILURE_CACHE_SECONDS)
+# TTLCache isn't thread-safe; the lock only guards lookups/stores, never the network fetch
+_yt_cache_lock = threading.Lock()
+
+# On-disk copy of successful fetches, shared by all workers and kept across restarts/deploys.
+# One small JSON file per key; the file mtime is the fetch time.
+# Lives in the project's own (gitignored) .cache/, created owner-only: a shared /tmp directory could be
+# pre-created or written by other local users to plant video IDs.
+_DISK_CACHE_DIR = BASE_DIR / ".cache" / "youtube"
+# Channel IDs go into file names, so only plain IDs (UC..., letters/digits/-/_) use the disk cache
+_SAFE_CID_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _disk_cache_path(cid: str, max_results: int) -> Path | None:
+    if not _SAFE_CID_RE.fullmatch(cid):
+        return None
+    return _DISK_CACHE_DIR / f"{cid}-{max_results}.json"
+
+
+def _read_disk_cache(cid: str, max_results: int) -> tuple[float, tuple[str, ...]] | None:
+    """(expires_at, video IDs) from the disk cache if fresh (younger than _CACHE_SECONDS), else None."""
+    path = _disk_cache_path(cid, max_results)
+    if path is None:
+        return None
+    try:
+        expires_at = path.stat().st_mtime + _CACHE_SECONDS
+        if time.time() >= expires_at:
+            return None
+        return expires_at, tuple(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_disk_cache(cid: str, max_results: int, video_ids: list[str]) -> None:
+    """Store video IDs on disk (write to a temp file, then rename, so readers never see a partial file)."""
+    path = _disk_cache_path(cid, max_results)
+    if path is None:
+        return
+    try:
+        _DISK_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(video_ids), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _parse_feed(stream, max_results: int) -> list[str]:
+    """Video IDs from an Atom feed stream, newest first; stops reading once max_results are found."""
+    video_ids = []
+    # Stream the feed: handle each <entry> as it closes, free it, and stop once we have enough
+    for _event, entry in ET.iterparse(stream, events=("end",)):
+        if entry.tag != _ENTRY_TAG:
+            continue
+        # One pass over the entry's children: yt:videoId wins, the first link is the fallback
+        vid = href = None
+        for child in entry:
+            tag = child.tag
+            if tag == _VIDEOID_TAG:
+                vid = (child.text or "").strip()
+                if vid:
+                    break
+            elif tag == _LINK_TAG and href is None:
+                href = child.get("href") or ""
+        if vid:
+            video_ids.append(vid)
+        elif href:
+            # Fallback: get from link href="...?v=VIDEO_ID"
+            match = _V_PARAM_RE.search(href)
+            if match:
+                video_ids.append(match.group(1))
+        entry.clear()
+        if len(video_ids) >= max_results:
+            break
+    return video_ids
+
+
+@functools.lru_cache(maxsize=256)
+def _feed_url(cid: str) -> str:
+    """RSS feed URL for a channel, built once per channel ID."""
+    return f"https://www.youtube.com/feeds/videos.xml?channel_id={cid}"
+
+
+def _fetch_and_store(cid: str, max_results: int) -> list[str] | None:
+    """Fetch the feed and update the caches. Returns None (and records the failure) if fetch or parse fails."""
+    cache_key = (cid, max_results)
+    url = _feed_url(cid)
+    try:
+        if _http is not None:
+            resp = _http.request(
+                "GET", url, headers=_FEED_HEADERS, preload_content=False, retries=False, timeout=_FEED_TIMEOUT
+            )
+            try:
+                if resp.status != 200:
+                    raise OSError(f"YouTube feed HTTP {resp.status}")
+                video_ids = _parse_feed(resp, max_results)
+            finally:
+                # Read off whatever iterparse left so the connection can go back to the pool
+                resp.drain_conn()
+                resp.release_conn()
+        else:
+            req = urllib.request.Request(url, headers=_FEED_HEADERS)
+            with urllib.request.urlopen(req, timeout=_FEED_TIMEOUT_FALLBACK) as resp:
+                stream = gzip.GzipFile(fileobj=resp) if resp.headers.get("Content-Encoding") == "gzip" else resp
+                video_ids = _parse_feed(stream, max_results)
+    except Exception:
+        with _yt_cache_lock:
+            _yt_neg_cache[cache_key] = ()
+        return None
+
+    with _yt_cache_lock:
+        _yt_cache[cache_key] = (time.time() + _CACHE_SECONDS, tuple(video_ids))
+    _write_disk_cache(cid, max_results, video_ids)
+    return video_ids
+
+
+def _refresh_in_background(cid: str, max_results: int) -> None:
+    """Re-fetch a stale entry; on failure the stale IDs stay in place until they age out."""
+    try:
+        _fetch_and_store(cid, max_results)
+    finally:
+        with _yt_cache_lock:
+            _yt_refreshing.discard((cid, max_results))
 
 
 def get_latest_video_ids(channel_id: str | None, max_results: int = 8) -> list[str]:
@@ -18,36 +183,31 @@ def get_latest_video_ids(channel_id: str | None, max_results: int = 8) -> list[s
     if not channel_id or not channel_id.strip():
         return []
 
-    cache_key = (channel_id.strip(), max_results)
-    if cache_key in _yt_cache:
-        ts, ids = _yt_cache[cache_key]
-        if time.time() - ts < _CACHE_SECONDS:
-            return ids
-    url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id.strip()}"
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "Sparksmetrics/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            tree = ET.parse(resp)
-            root = tree.getroot()
-    except Exception:
+    # Interned: the handful of channel IDs hash and compare by pointer on every cache lookup
+    cid = sys.intern(channel_id.strip())
+    cache_key = (cid, max_results)
+    refresh = False
+    with _yt_cache_lock:
+        cached = _yt_cache.get(cache_key)
+        recently_failed = cache_key in _yt_neg_cache
+        stale = cached is not None and cached[0] <= time.time()
+        if stale and not recently_failed and cache_key not in _yt_refreshing:
+            _yt_refreshing.add(cache_key)
+            refresh = True
+    if cached is not None:
+        if refresh:
+            # Stale: serve what we have now, refresh off the request path
+            threading.Thread(target=_refresh_in_background, args=(cid, max_results), daemon=True).start()
+        # Hand out a copy: templates concatenate this with a list, and callers must not mutate the cache
+        return list(cached[1])
+    if recently_failed:
         return []
+    # Another worker (or this one before a restart) may have fetched it recently
+    cached = _read_disk_cache(cid, max_results)
+    if cached is not None:
+        with _yt_cache_lock:
+            _yt_cache[cache_key] = cached
+        return list(cached[1])
+    video_ids = _fetch_and_store(cid, max_results)
+    return video_ids if video_ids is not None else []
 
-    # Atom: root is {http://www.w3.org/2005/Atom}feed, entries are {http://www.w3.org/2005/Atom}entry
-    # yt:videoId is in {http://www.youtube.com/xml/schemas/2015}videoId
-    ns = {"atom": "http://www.w3.org/2005/Atom", "yt": "http://www.youtube.com/xml/schemas/2015"}
-    entries = root.findall("atom:entry", ns)
-    video_ids = []
-    for entry in entries[:max_results]:
-        vid_el = entry.find("yt:videoId", ns)
-        if vid_el is not None and vid_el.text:
-            video_ids.append(vid_el.text.strip())
-        else:
-            # Fallback: get from link href="...?v=VIDEO_ID"
-            link = entry.find("atom:link", ns)
-            if link is not None:
-                href = link.get("href") or ""
-                match = re.search(r"[?&]v=([a-zA-Z0-9_-]{11})", href)
-                if match:
-                    video_ids.append(match.group(1))
-    _yt_cache[cache_key] = (time.time(), video_ids)
-    return video_ids
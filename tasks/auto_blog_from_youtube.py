@@ -11,6 +11,9 @@ What it does:
 Cron example (every hour):
 0 * * * * cd /path/to/sparksmetrics-website && ./.venv/bin/python tasks/auto_blog_from_youtube.py --channel UCkwylcLXJiV-kQxCZMRR-tw >> /var/log/sm_blog_cron.log 2>&1
 
+Backfills: add --batch to draft all new videos through the OpenAI Batch API (half the price; waits up to
+--batch-timeout seconds for the job, then drafts any remaining videos online).
+
 Env vars (in sparksmetrics-website/.env):
 - SLACK_WEBHOOK_URL=...
 - SITE_BASE_URL=https://sparksmetrics.com
@@ -20,32 +23,92 @@ Env vars (in sparksmetrics-website/.env):
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import io
+import itertools
 import json
 import os
+import random
 import re
+import sqlite3
 import time
+import uuid
+import urllib.error
 import urllib.request
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
 import ssl
 try:
     import requests  # type: ignore
 except Exception:
     requests = None
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+# JSON decoding for the post archive and model responses (orjson when installed; both accept str or bytes)
+_json_loads = orjson.loads if orjson is not None else json.loads
 # Hard-coded settings (non-secret)
 BLOG_MIN_WORDS_DEFAULT = 1000
 BLOG_PUBLISH_THRESHOLD_DEFAULT = 70
 OPENAI_MODEL_DEFAULT = "gpt-4.1-mini"
+# --batch: how often to poll the OpenAI batch job, and how long to wait before drafting online instead
+OPENAI_BATCH_POLL_SECONDS = 30
+OPENAI_BATCH_TIMEOUT_DEFAULT = 3600
+# Part of the spec cache key: bump whenever the spec, summary or repair prompts change so old specs are ignored
+PROMPT_VERSION = 1
+# Article specs returned by the model, keyed by a hash of their inputs (re-runs after a failure reuse them)
+SPEC_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "specs"
+
+# Video id in youtube.com/watch?v=..., youtu.be/..., /embed/... and /shorts/... URLs
+_YT_URL_ID_RE = re.compile(r"(?:v=|youtu\.be/|/embed/|/shorts/)([A-Za-z0-9_-]{11})")
+# A bare video id, as --video also accepts
+_RE_VIDEO_ID = re.compile(r"[A-Za-z0-9_-]{11}")
+
+# Text-processing patterns, compiled once (they run over 10-12 KB transcripts and full article HTML)
+_RE_WS = re.compile(r"\s+")
+_RE_TAGS = re.compile(r"<[^>]+>")
+_RE_WORD = re.compile(r"\w+")
+# Sentence end = terminator plus the whitespace after it: a plain forward scan, no lookbehind at every position
+_RE_SENT_END = re.compile(r"[.!?]\s+")
+_RE_ALNUM_RUN = re.compile(r"[A-Za-z0-9]+")
+_RE_LDJSON_SCRIPT = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>.*?</script>', re.I | re.S)
+_RE_LDJSON_OBJ = re.compile(r'\{\s*"@context"[\s\S]*?\}')
+
+# score_article checks
+_RE_FIRST_P = re.compile(r"<p\b[^>]*>(.*?)</p>", re.I | re.S)
+_RE_INTERNAL_HREF = re.compile(r'href=["\'](/[^"\']+)["\']')
+_RE_EXTERNAL_HREF = re.compile(r'href=["\']https?://([^"\']+)["\']')
+_RE_IMG = re.compile(r"<img\b[^>]*>", re.I)
+_RE_IMG_ALT = re.compile(r'\balt=["\'].*?["\']', re.I)
+# TOC markup; the "table of contents" text itself is a plain substring check on the lowercased HTML
+_RE_TOC_MARKUP = re.compile(r"(<nav[^>]+toc|id=[\"']toc[\"'])", re.I)
+_RE_AUTHOR = re.compile(r'author|byline|class=["\']author', re.I)
+_RE_REFERENCES = re.compile(r"references|sources|cite", re.I)
+_AI_PHRASES = ("as an ai", "as an ai language model", "in this article we will", "in this post i")
+# All phrases in one case-insensitive alternation: a single scan of the HTML, no lowercased copy
+_RE_AI_PHRASES = re.compile("|".join(map(re.escape, _AI_PHRASES)), re.I)
+
+
+# (path, mtime) of each .env already applied to os.environ; every task script calls _load_env, some more than once
+_ENV_LOADED: set[tuple[str, int]] = set()
 
 
 def _load_env(project_root: Path) -> None:
-    """Load .env if python-dotenv is installed; no-op otherwise."""
+    """Load .env if python-dotenv is installed; no-op otherwise. Repeat calls for an unchanged file return at once."""
     env_path = project_root / ".env"
-    if not env_path.exists():
+    try:
+        loaded_key = (str(env_path), env_path.stat().st_mtime_ns)
+    except OSError:
+        return
+    if loaded_key in _ENV_LOADED:
         return
+    _ENV_LOADED.add(loaded_key)
     try:
         from dotenv import load_dotenv  # type: ignore
 
@@ -71,10 +134,117 @@ def _load_env(project_root: Path) -> None:
             pass
 
 
-def _http_get(url: str, timeout: int = 15) -> bytes:
-    req = urllib.request.Request(url, headers={"User-Agent": "SparksmetricsBlogBot/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+_USER_AGENT = "SparksmetricsBlogBot/1.0"
+# One keep-alive session for the run's feed and OpenAI requests; created on first use
+_SESSION = None
+# TLS context for urllib calls when requests is not installed (loading the CA bundle per call is not free)
+_SSL_CTX = ssl.create_default_context()
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None and requests is not None:
+        _SESSION = requests.Session()
+        _SESSION.headers["User-Agent"] = _USER_AGENT
+    return _SESSION
+
+
+# Responses worth retrying (rate limit, transient server errors), and the cap on a server-sent Retry-After
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_AFTER_MAX = 120.0
+
+
+def _retry_delay(attempt: int, retry_after: str | None = None, base: float = 0.5) -> float:
+    """Seconds to sleep before the next attempt: the server's Retry-After (delta-seconds) when given,
+    else exponential backoff from base; plus a little jitter so parallel workers don't retry in lockstep."""
+    try:
+        delay = min(float(retry_after), _RETRY_AFTER_MAX) if retry_after else 0.0
+    except ValueError:  # HTTP-date form; fall back to backoff
+        delay = 0.0
+    if delay <= 0:
+        delay = base * (2 ** attempt)
+    return delay + random.uniform(0, 0.3)
+
+
+def _retry(fn, retries: int = 4, base: float = 0.5):
+    """Call fn(), retrying HTTP 429/5xx errors (requests or urllib) up to retries attempts in total."""
+    for attempt in range(retries):
+        try:
+            return fn()
+        except Exception as e:  # noqa: BLE001
+            resp = getattr(e, "response", None)  # requests.HTTPError
+            status = getattr(resp, "status_code", None) if resp is not None else getattr(e, "code", None)
+            headers = getattr(resp, "headers", None) if resp is not None else getattr(e, "headers", None)
+            if status not in _RETRY_STATUSES or attempt == retries - 1:
+                raise
+            time.sleep(_retry_delay(attempt, (headers or {}).get("Retry-After"), base))
+
+
+def _http_get(url: str, timeout: int = 15, headers: dict[str, str] | None = None) -> tuple[int, bytes, dict[str, str]]:
+    """GET url; returns (status, body, response headers). 304/4xx/5xx are returned, not raised."""
+    session = _get_session()
+    if session is not None:
+        r = session.get(url, headers=headers, timeout=timeout)
+        return r.status_code, r.content, dict(r.headers)
+    req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT, **(headers or {})})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read(), dict(resp.headers)
+    except urllib.error.HTTPError as e:
+        return e.code, b"", dict(e.headers or {})
+
+
+def load_feed_cache(cache_path: Path) -> dict[str, dict[str, str]]:
+    """Per-channel ETag/Last-Modified and last feed body (see _fetch_feed)."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_feed_cache(cache_path: Path, cache: dict[str, dict[str, str]]) -> None:
+    tmp = cache_path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(cache_path)
+
+
+def _fetch_feed(url: str, cached: dict[str, str] | None, timeout: int = 15) -> tuple[bytes, dict[str, str]]:
+    """
+    Conditional GET for a feed: sends the cached ETag/Last-Modified and reuses the cached body on 304.
+    The body is kept (not just the validators) because videos skipped in one run must still be seen in the next.
+    Retries 429/5xx, honoring Retry-After. Returns (body, cache entry to store).
+    """
+    headers = {}
+    if cached and cached.get("body"):
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    for attempt in range(4):
+        status, body, resp_headers = _http_get(url, timeout=timeout, headers=headers)
+        if status not in _RETRY_STATUSES or attempt == 3:
+            break
+        time.sleep(_retry_delay(attempt, resp_headers.get("Retry-After"), base=1.0))
+    if status == 304 and cached:
+        return cached["body"].encode("utf-8"), cached
+    if status != 200:
+        raise RuntimeError(f"HTTP {status} for {url}")
+    entry = {
+        "etag": resp_headers.get("ETag") or "",
+        "last_modified": resp_headers.get("Last-Modified") or "",
+        "body": body.decode("utf-8", errors="replace"),
+    }
+    return body, entry
+
+
+# Feed tags in Clark notation ({namespace}local), compared directly while streaming the feed
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ATOM_ENTRY = _ATOM_NS + "entry"
+_ATOM_TITLE = _ATOM_NS + "title"
+_ATOM_LINK = _ATOM_NS + "link"
+_ATOM_PUBLISHED = _ATOM_NS + "published"
+_YT_VIDEO_ID = "{http://www.youtube.com/xml/schemas/2015}videoId"
 
 
 @dataclass(frozen=True)
@@ -85,49 +255,138 @@ class YouTubeVideo:
     published: str  # human string, e.g. "11 Feb 2026"
 
 
-def fetch_latest_videos(channel_id: str, max_results: int = 5) -> list[YouTubeVideo]:
-    """Fetch latest videos (id/title/url/published) from a channel RSS feed."""
-    url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id.strip()}"
-    raw = _http_get(url, timeout=15)
+# Month abbreviations for post dates (avoids strftime and the locale)
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _format_date(dt: datetime) -> str:
+    """e.g. "11 Feb 2026" (no leading zero on the day)."""
+    return f"{dt.day} {_MONTH_ABBR[dt.month - 1]} {dt.year}"
+
+
+def _human_date(raw: str, default: str | None = None) -> str:
+    """Feed/API timestamp such as 2026-02-11T12:34:56+00:00 as "11 Feb 2026"; default (else today) if unparseable."""
+    # fromisoformat is C-implemented; older Pythons reject a trailing "Z", so rewrite only that suffix
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    try:
+        return _format_date(datetime.fromisoformat(raw))
+    except ValueError:
+        return default if default is not None else _format_date(datetime.now(timezone.utc))
+
+
+def _video_from_entry(entry: ET.Element) -> YouTubeVideo | None:
+    """One feed <entry> as a YouTubeVideo, or None when it has no video id."""
+    vid_el = entry.find(_YT_VIDEO_ID)
+    video_id = (vid_el.text or "").strip() if vid_el is not None else ""
+    if not video_id:
+        return None
+    title_el = entry.find(_ATOM_TITLE)
+    link_el = entry.find(_ATOM_LINK)
+    pub_el = entry.find(_ATOM_PUBLISHED)
+    title = (title_el.text or "").strip() if title_el is not None else video_id
+    href = (link_el.get("href") or "").strip() if link_el is not None else f"https://youtu.be/{video_id}"
+
+    published_raw = (pub_el.text or "").strip() if pub_el is not None else ""
+    return YouTubeVideo(video_id=video_id, title=title, url=href, published=_human_date(published_raw))
+
+
+def fetch_latest_videos(
+    channel_id: str, max_results: int = 5, feed_cache: dict[str, dict[str, str]] | None = None
+) -> list[YouTubeVideo]:
+    """Fetch latest videos (id/title/url/published) from a channel RSS feed.
+
+    With feed_cache, the request is conditional and the cache entry for the channel is updated in place.
+    """
+    channel_id = channel_id.strip()
+    url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+    cached = feed_cache.get(channel_id) if feed_cache is not None else None
+    raw, entry = _fetch_feed(url, cached, timeout=15)
+    if feed_cache is not None:
+        feed_cache[channel_id] = entry
 
-    root = ET.fromstring(raw)
-    ns = {"atom": "http://www.w3.org/2005/Atom", "yt": "http://www.youtube.com/xml/schemas/2015"}
     videos: list[YouTubeVideo] = []
-    for entry in root.findall("atom:entry", ns)[:max_results]:
-        vid_el = entry.find("yt:videoId", ns)
-        title_el = entry.find("atom:title", ns)
-        link_el = entry.find("atom:link", ns)
-        pub_el = entry.find("atom:published", ns)
-        if vid_el is None or not (vid_el.text or "").strip():
+    seen = 0
+    # Stream the feed and stop after max_results entries instead of building the whole tree
+    for _, el in ET.iterparse(io.BytesIO(raw), events=("end",)):
+        if el.tag != _ATOM_ENTRY:
             continue
-        video_id = (vid_el.text or "").strip()
-        title = (title_el.text or "").strip() if title_el is not None else video_id
-        href = (link_el.get("href") or "").strip() if link_el is not None else f"https://youtu.be/{video_id}"
+        video = _video_from_entry(el)
+        if video is not None:
+            videos.append(video)
+        el.clear()
+        seen += 1
+        if seen >= max_results:
+            break
+    return videos
 
-        published_raw = (pub_el.text or "").strip() if pub_el is not None else ""
-        published_human = ""
-        try:
-            # Example: 2026-02-11T12:34:56+00:00
-            dt = datetime.fromisoformat(published_raw.replace("Z", "+00:00"))
-            published_human = dt.strftime("%d %b %Y").lstrip("0")
-        except Exception:
-            published_human = datetime.now(timezone.utc).strftime("%d %b %Y").lstrip("0")
 
-        videos.append(YouTubeVideo(video_id=video_id, title=title, url=href, published=published_human))
+def fetch_latest_videos_many(
+    channel_ids: list[str], max_results: int = 5, feed_cache: dict[str, dict[str, str]] | None = None
+) -> list[YouTubeVideo]:
+    """Fetch several channel feeds concurrently (network-bound, so threads overlap the waits).
+
+    Results keep the order of channel_ids; a channel whose feed fails is reported and skipped.
+    """
+    if not channel_ids:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(channel_ids))) as ex:
+        futures = [ex.submit(fetch_latest_videos, cid, max_results, feed_cache) for cid in channel_ids]
+    videos: list[YouTubeVideo] = []
+    for cid, fut in zip(channel_ids, futures):
+        try:
+            videos.extend(fut.result())
+        except Exception as e:  # noqa: BLE001
+            print(f"RSS fetch failed for {cid}: {type(e).__name__}: {e}")
     return videos
 
 
+class _SlugTable(dict):
+    """str.translate table for slugify: keeps a-z, 0-9 and "-", maps whitespace to "-", drops everything else.
+
+    Code points are classified on first sight and remembered, so each title is one C-level translate pass.
+    """
+
+    def __missing__(self, code: int) -> str | None:
+        ch = chr(code)
+        if "a" <= ch <= "z" or "0" <= ch <= "9" or ch == "-":
+            out: str | None = ch
+        elif ch.isspace():  # same set as \s in a str pattern
+            out = "-"
+        else:
+            out = None
+        self[code] = out
+        return out
+
+
+_SLUG_TABLE = _SlugTable()
+
+
 def slugify(text: str) -> str:
     text = text.strip().lower()
     text = text.replace("&", " and ")
-    text = re.sub(r"[^a-z0-9\s-]", "", text)
-    text = re.sub(r"\s+", "-", text).strip("-")
-    text = re.sub(r"-{2,}", "-", text)
+    text = text.translate(_SLUG_TABLE)
+    while "--" in text:
+        text = text.replace("--", "-")
+    text = text.strip("-")
     return text[:80] or f"post-{int(time.time())}"
 
 
-def estimate_reading_time(text: str, wpm: int = 200) -> str:
-    words = len(re.findall(r"\w+", text))
+@functools.lru_cache(maxsize=4)
+def _summarize_text(text: str) -> tuple[str, int, str]:
+    """(whitespace-normalized text, word count, <=160-char description) from one split() of text.
+
+    Cached on the transcript, so the draft fallback and the reading-time estimate share a single pass.
+    """
+    words = text.split()
+    normalized = " ".join(words)
+    short = normalized[:700].strip()
+    description = (short[:157] + "...") if len(short) > 160 else short
+    return normalized, len(words), description
+
+
+def estimate_reading_time(text: str, wpm: int = 200, word_count: int | None = None) -> str:
+    words = word_count if word_count is not None else len(_RE_WORD.findall(text))
     minutes = max(1, int(round(words / float(wpm))))
     return f"{minutes} min read"
 
@@ -135,7 +394,7 @@ def estimate_reading_time(text: str, wpm: int = 200) -> str:
 def load_blog_posts(posts_path: Path) -> list[dict[str, Any]]:
     if not posts_path.exists():
         return []
-    data = json.loads(posts_path.read_text(encoding="utf-8"))
+    data = _json_loads(posts_path.read_bytes())
     if isinstance(data, dict):
         return list(data.get("posts") or [])
     return list(data or [])
@@ -144,17 +403,100 @@ def load_blog_posts(posts_path: Path) -> list[dict[str, Any]]:
 def save_blog_posts(posts_path: Path, posts: list[dict[str, Any]]) -> None:
     payload: Any = {"posts": posts}
     tmp = posts_path.with_suffix(".json.tmp")
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if orjson is not None:
+        # Same layout as json.dumps(indent=2, ensure_ascii=False), several times faster on a large archive
+        tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     tmp.replace(posts_path)
+    if _INDEX_CONN is not None:
+        _reindex_posts(_INDEX_CONN, posts, _posts_stamp(posts_path))
+
+
+def _extract_id(url: str) -> str:
+    """YouTube video id from a watch/short/embed URL, or "" if none."""
+    m = _YT_URL_ID_RE.search(url or "")
+    return m.group(1) if m else ""
 
 
-def has_post_for_video(posts: list[dict[str, Any]], video_id: str) -> bool:
+# SQLite index of video ids that already have a post, kept next to blog_posts.json (the JSON stays the source
+# of truth). The cron checks candidates against it without parsing the whole archive on every run.
+_INDEX_CONN: sqlite3.Connection | None = None
+
+
+def _posts_stamp(posts_path: Path) -> str:
+    """mtime/size of blog_posts.json; the index is rebuilt whenever this changes (e.g. after a manual edit)."""
+    try:
+        st = posts_path.stat()
+    except OSError:
+        return ""
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _reindex_posts(conn: sqlite3.Connection, posts: list[dict[str, Any]], stamp: str) -> None:
+    rows = []
     for p in posts:
-        if (p.get("video_id") or "").strip() == video_id:
-            return True
-        if video_id and video_id in (p.get("youtube_url") or ""):
-            return True
-    return False
+        slug = p.get("slug") or ""
+        url = p.get("youtube_url") or ""
+        published = p.get("published_date") or ""
+        # A post counts for its video_id and for the id in its youtube_url
+        for vid in {(p.get("video_id") or "").strip(), _extract_id(url)} - {""}:
+            rows.append((vid, slug, url, published))
+    with conn:
+        conn.execute("DELETE FROM posts_index")
+        conn.executemany("INSERT OR REPLACE INTO posts_index VALUES (?, ?, ?, ?)", rows)
+        conn.execute("INSERT OR REPLACE INTO posts_index_meta VALUES ('source', ?)", (stamp,))
+
+
+def open_posts_index(posts_path: Path, persist: bool = True) -> sqlite3.Connection:
+    """Connection to the posts index (one per process), rebuilt from blog_posts.json if that file changed.
+
+    persist=False keeps the index in memory (dry runs write no files).
+    """
+    global _INDEX_CONN
+    if _INDEX_CONN is None:
+        conn = sqlite3.connect(posts_path.with_name("posts_index.sqlite") if persist else ":memory:")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts_index (video_id TEXT PRIMARY KEY, slug TEXT, youtube_url TEXT, published_at TEXT)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS posts_index_meta (key TEXT PRIMARY KEY, value TEXT)")
+        _INDEX_CONN = conn
+    stamp = _posts_stamp(posts_path)
+    row = _INDEX_CONN.execute("SELECT value FROM posts_index_meta WHERE key = 'source'").fetchone()
+    if row is None or row[0] != stamp:
+        _reindex_posts(_INDEX_CONN, load_blog_posts(posts_path), stamp)
+    return _INDEX_CONN
+
+
+def has_post_for_video(index: sqlite3.Connection, video_id: str) -> bool:
+    return index.execute("SELECT 1 FROM posts_index WHERE video_id = ? LIMIT 1", (video_id,)).fetchone() is not None
+
+
+# Transcript providers, resolved once per process (the cron loops over several videos per run)
+_YT_API: Any = None
+_SUPADATA_CLIENT: Any = None
+_SUPADATA_CLIENT_KEY = ""
+
+
+def _get_yt_transcript_api() -> Any:
+    """YouTubeTranscriptApi class; raises if youtube-transcript-api is not installed."""
+    global _YT_API
+    if _YT_API is None:
+        from youtube_transcript_api import YouTubeTranscriptApi  # type: ignore
+
+        _YT_API = YouTubeTranscriptApi
+    return _YT_API
+
+
+def _get_supadata_client(api_key: str) -> Any:
+    """Supadata client for api_key, reused until the key changes."""
+    global _SUPADATA_CLIENT, _SUPADATA_CLIENT_KEY
+    if _SUPADATA_CLIENT is None or _SUPADATA_CLIENT_KEY != api_key:
+        from supadata import Supadata  # type: ignore
+
+        _SUPADATA_CLIENT = Supadata(api_key=api_key)
+        _SUPADATA_CLIENT_KEY = api_key
+    return _SUPADATA_CLIENT
 
 
 def fetch_transcript(video_id: str) -> str:
@@ -166,9 +508,7 @@ def fetch_transcript(video_id: str) -> str:
     supa_key = (os.environ.get("SUPADATA_KEY") or "").strip()
     if supa_key:
         try:
-            from supadata import Supadata  # type: ignore
-
-            client = Supadata(api_key=supa_key)
+            client = _get_supadata_client(supa_key)
             # Request plain text transcript when possible
             resp = client.youtube.transcript(video_id=video_id, text=True)
             # Some SDK responses expose .content
@@ -184,51 +524,42 @@ def fetch_transcript(video_id: str) -> str:
 
     # Fallback: try youtube-transcript-api (local dependency)
     try:
-        from youtube_transcript_api import YouTubeTranscriptApi  # type: ignore
+        yt_api = _get_yt_transcript_api()
     except Exception as e:
         raise RuntimeError("No transcript provider available. Install youtube-transcript-api or set SUPADATA_KEY.") from e
 
     last_err: Exception | None = None
     for langs in (["en"], ["en-US", "en"], ["en-GB", "en"]):
         try:
-            parts = YouTubeTranscriptApi.get_transcript(video_id, languages=langs)
-            return " ".join((p.get("text") or "").strip() for p in parts if (p.get("text") or "").strip()).strip()
+            parts = yt_api.get_transcript(video_id, languages=langs)
+            # One pass: str.split() drops empty snippets and collapses whitespace inside each one
+            return " ".join(w for p in parts for w in (p.get("text") or "").split())
         except Exception as e:  # noqa: BLE001
             last_err = e
     raise RuntimeError(f"No transcript available for {video_id}.") from last_err
 
 
-def generate_article_html(title: str, transcript: str, video_url: str, provider: str = "openai") -> dict[str, str]:
-    """
-    Returns dict with keys: title, description, category, html
-    - If OPENAI_API_KEY is set and provider=openai, uses OpenAI API for better writing.
-    - Otherwise returns a simple deterministic draft based on transcript.
+def fetch_transcripts_batch(video_ids: list[str]) -> tuple[dict[str, str], dict[str, Exception]]:
+    """Fetch transcripts for several videos concurrently (each provider call is one blocking HTTPS request).
+
+    Returns (transcripts by video id, errors by video id); every id lands in exactly one of the two.
     """
-    provider = (provider or "").strip().lower()
-    # Support either OPENAI_API_KEY or OPEN_AI_KEY (user-friendly)
-    api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
-    # Prefer structured JSON spec from the richer spec endpoint/flow when OpenAI is available.
-    if provider == "openai" and api_key:
+    texts: dict[str, str] = {}
+    errors: dict[str, Exception] = {}
+    if not video_ids:
+        return texts, errors
+    with ThreadPoolExecutor(max_workers=min(4, len(video_ids))) as ex:
+        futures = [ex.submit(fetch_transcript, vid) for vid in video_ids]
+    for vid, fut in zip(video_ids, futures):
         try:
-            # Ask the LLM to produce a structured JSON spec, then render it to html.
-            spec = expand_article_to_json_spec(title=title, transcript=transcript, existing_html="")
-            if isinstance(spec, dict):
-                rendered = render_article_from_spec(spec)
-                return {
-                    "title": (spec.get("title") or title).strip(),
-                    "description": (spec.get("description") or "").strip(),
-                    "category": (spec.get("category") or "CRO").strip(),
-                    "html": rendered,
-                }
-        except Exception:
-            # If the structured flow fails, fall back to deterministic draft below.
-            pass
+            texts[vid] = fut.result()
+        except Exception as e:  # noqa: BLE001
+            errors[vid] = e
+    return texts, errors
 
-    # Deterministic fallback: create a simple structured draft.
-    cleaned = re.sub(r"\s+", " ", transcript).strip()
-    short = cleaned[:700].strip()
-    description = (short[:157] + "...") if len(short) > 160 else short
-    html = f"""
+
+# Deterministic draft used when no writer is available; only the lead paragraph varies
+_FALLBACK_HTML_TMPL = """
 <p>{description}</p>
 <div class="callout">
   <p class="callout-title">Want help implementing?</p>
@@ -248,25 +579,124 @@ def generate_article_html(title: str, transcript: str, video_url: str, provider:
   <li>Choose big swings vs small iterations based on site maturity.</li>
 </ul>
 """.strip()
+
+
+def _article_from_spec(spec: dict, title: str) -> dict[str, str]:
+    """Render an article spec into the title/description/category/html dict generate_article_html returns."""
+    return {
+        "title": (spec.get("title") or title).strip(),
+        "description": (spec.get("description") or "").strip(),
+        "category": (spec.get("category") or "CRO").strip(),
+        "html": render_article_from_spec(spec),
+    }
+
+
+def draft_specs_batch(videos: list[YouTubeVideo], transcripts: dict[str, str], timeout: int, model: str = OPENAI_MODEL_DEFAULT) -> dict[str, dict]:
+    """Article specs for videos via the OpenAI Batch API, keyed by video id.
+
+    Specs already in the spec cache are not resubmitted. Returned specs under 1000 words get the same online repair
+    call as expand_article_to_json_spec before they are cached. Returns whatever is available; videos missing from the
+    result (batch timeout or failure) are drafted online by the caller.
+    """
+    api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
+    if not api_key or not videos:
+        return {}
+    specs: dict[str, dict] = {}
+    cache_paths = {
+        v.video_id: _spec_cache_path(v.title, transcripts.get(v.video_id, ""), "", model, batch=True) for v in videos
+    }
+    for v in videos:
+        cached = _load_cached_spec(cache_paths[v.video_id])
+        if cached is not None:
+            specs[v.video_id] = cached
+    videos = [v for v in videos if v.video_id not in specs]
+    if not videos:
+        return specs
+    try:
+        # (prompt, transcript section) per video; the section is reused by the repair prompt below
+        built = {v.video_id: _spec_prompt(v.title, transcripts.get(v.video_id, ""), "") for v in videos}
+        prompts = [(vid, prompt) for vid, (prompt, _) in built.items()]
+        batch_id = openai_batch_submit(prompts, model, api_key)
+        print(f"Submitted OpenAI batch {batch_id} for {len(prompts)} video(s); waiting up to {timeout}s")
+        results = dict(openai_batch_collect(batch_id, api_key, timeout=timeout))
+    except Exception as e:  # noqa: BLE001
+        print(f"OpenAI batch unavailable, drafting online instead: {type(e).__name__}: {e}")
+        return specs
+    titles = {v.video_id: v.title for v in videos}
+    done = [(vid, spec) for vid, spec in results.items() if vid in titles and isinstance(spec, dict)]
+    for vid, spec in done:
+        _fill_spec_defaults(spec, titles[vid], transcripts.get(vid, ""), "")
+    if not done:
+        return specs
+
+    def _finish(item: tuple[str, dict]) -> dict:
+        vid, spec = item
+        spec = _repair_short_spec(spec, built[vid][1], model, api_key)
+        _fill_spec_defaults(spec, titles[vid], transcripts.get(vid, ""), "")
+        return spec
+
+    # The repair calls are independent blocking requests: overlap them like fetch_transcripts_batch does
+    with ThreadPoolExecutor(max_workers=min(4, len(done))) as ex:
+        for (vid, _), spec in zip(done, ex.map(_finish, done)):
+            _store_cached_spec(cache_paths[vid], spec)
+            specs[vid] = spec
+    return specs
+
+
+def generate_article_html(
+    title: str,
+    transcript: str,
+    video_url: str,
+    provider: str = "openai",
+    use_cache: bool = True,
+    dry_run: bool = False,
+) -> dict[str, str]:
+    """
+    Returns dict with keys: title, description, category, html
+    - If OPENAI_API_KEY is set and provider=openai, uses OpenAI API for better writing.
+    - Otherwise returns a simple deterministic draft based on transcript.
+    use_cache=False asks the model for a new spec instead of replaying a cached one (rewrite attempts);
+    dry_run=True leaves the spec cache untouched.
+    """
+    provider = (provider or "").strip().lower()
+    # Support either OPENAI_API_KEY or OPEN_AI_KEY (user-friendly)
+    api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
+    # Prefer structured JSON spec from the richer spec endpoint/flow when OpenAI is available.
+    if provider == "openai" and api_key:
+        try:
+            # Ask the LLM to produce a structured JSON spec, then render it to html.
+            spec = expand_article_to_json_spec(
+                title=title, transcript=transcript, existing_html="", use_cache=use_cache, dry_run=dry_run
+            )
+            if isinstance(spec, dict):
+                return _article_from_spec(spec, title)
+        except Exception:
+            # If the structured flow fails, fall back to deterministic draft below.
+            pass
+
+    # Deterministic fallback: create a simple structured draft.
+    _, _, description = _summarize_text(transcript)
+    html = _FALLBACK_HTML_TMPL.format(description=description)
     return {"title": title.strip(), "description": description, "category": "CRO", "html": html}
 
 
-def _strip_tags(text: str) -> str:
-    return re.sub(r"<[^>]+>", " ", text)
+def _strip_tags(text: str, sep: str = " ") -> str:
+    """Drop HTML tags with the shared compiled pattern; sep="" for inline text such as a heading or first paragraph."""
+    return _RE_TAGS.sub(sep, text)
 
 
 def _build_rich_spec_from_text(title: str, transcript: str, existing_html: str) -> dict:
     """Deterministic rich spec generator when LLM is unavailable."""
     # Remove any embedded JSON-LD fragments from the existing HTML/transcript
     raw = (transcript or existing_html or "") or ""
-    raw = re.sub(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>.*?</script>', "", raw, flags=re.I | re.S)
-    raw = re.sub(r'\{\s*"@context"[\s\S]*?\}', "", raw)
+    raw = _RE_LDJSON_SCRIPT.sub("", raw)
+    raw = _RE_LDJSON_OBJ.sub("", raw)
     plain = _strip_tags(raw)
     short = (plain.strip() or title).strip()
     description = (short[:157] + "...") if len(short) > 160 else short
 
     # Simple heuristics to create sections from title keywords
-    keywords = [w.capitalize() for w in re.findall(r"[A-Za-z0-9]+", title)][:6]
+    keywords = [w.capitalize() for w in _RE_ALNUM_RUN.findall(title)][:6]
     intro = f"<p>{description or 'An actionable guide based on the video content.'}</p>"
 
     sections = []
@@ -321,67 +751,88 @@ def _build_rich_spec_from_text(title: str, transcript: str, existing_html: str)
     }
 
 
+@functools.lru_cache(maxsize=32)
 def _word_count_html(html: str) -> int:
+    """Words in html with tags removed. Memoized: main() counts a draft, then score_article counts it again."""
     text = _strip_tags(html)
-    return len(re.findall(r"\w+", text))
+    return len(_RE_WORD.findall(text))
+
+
+def _openai_base_url() -> str:
+    return os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+
+
+def _responses_payload(prompt: str, model: str) -> dict:
+    """Request body for POST /responses (also the body of each --batch JSONL line)."""
+    return {
+        "model": model,
+        "input": [
+            {"role": "system", "content": "You are a helpful SEO writing assistant."},
+            {"role": "user", "content": prompt},
+        ],
+        "text": {"format": {"type": "json_object"}},
+        # Request a larger response budget when available
+        "max_output_tokens": 8000,
+        "temperature": 0.0,
+    }
+
+
+def _openai_request(
+    method: str, path: str, api_key: str, body: bytes | None = None, content_type: str = "application/json", timeout: int = 60
+) -> bytes:
+    """One authenticated call to the OpenAI REST API; returns the raw response body, raises on HTTP errors.
+
+    Goes through the shared session, so the spec, summary, repair and batch calls of a run reuse one connection.
+    """
+    url = f"{_openai_base_url()}{path}"
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if body is not None:
+        headers["Content-Type"] = content_type
+    session = _get_session()
+
+    def _once() -> bytes:
+        if session is not None:
+            r = session.request(method, url, data=body, headers=headers, timeout=timeout)
+            r.raise_for_status()
+            return r.content
+        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+        with urllib.request.urlopen(req, timeout=timeout, context=_SSL_CTX) as resp:
+            return resp.read()
+
+    # Rate limits and 5xx are retried with backoff (Retry-After when OpenAI sends one)
+    return _retry(_once)
+
+
+def _openai_post_json(path: str, payload: dict, api_key: str, timeout: int) -> dict:
+    data = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+    return _json_loads(_openai_request("POST", path, api_key, data, timeout=timeout))
 
 
 def _call_openai_responses(prompt: str, model: str, api_key: str, timeout: int = 120) -> dict:
-    base = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
     # First: try the Responses API (preferred)
     try:
-        url = f"{base}/responses"
+        return _openai_post_json("/responses", _responses_payload(prompt, model), api_key, timeout)
+    except Exception:
+        # Fallback: try Chat Completions (more widely supported)
         payload = {
             "model": model,
-            "input": [
+            "messages": [
                 {"role": "system", "content": "You are a helpful SEO writing assistant."},
                 {"role": "user", "content": prompt},
             ],
-            "text": {"format": {"type": "json_object"}},
-            # Request a larger response budget when available
-            "max_output_tokens": 8000,
             "temperature": 0.0,
+            "max_tokens": 8000,
         }
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}, method="POST")
-        ctx = ssl.create_default_context()
-        with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-            return json.load(resp)
-    except Exception:
-        # Fallback: try Chat Completions (more widely supported)
-        try:
-            try:
-                import requests as _requests  # type: ignore
-            except Exception:
-                _requests = None
-            if _requests is None:
-                raise
-            url = f"{base}/chat/completions"
-            payload = {
-                "model": model,
-                "messages": [
-                    {"role": "system", "content": "You are a helpful SEO writing assistant."},
-                    {"role": "user", "content": prompt},
-                ],
-                "temperature": 0.0,
-                "max_tokens": 8000,
-            }
-            headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
-            r = _requests.post(url, json=payload, headers=headers, timeout=timeout)
-            r.raise_for_status()
-            data = r.json()
-            # Normalize to a shape _parse_responses_output expects
-            msg = ""
-            choices = data.get("choices") or []
-            if isinstance(choices, list) and choices:
-                first = choices[0]
-                if isinstance(first, dict):
-                    # Chat-style
-                    msg = (first.get("message") or {}).get("content") or first.get("text") or ""
-            return {"output_text": msg, "output": [{"content": msg}]}
-        except Exception:
-            # Re-raise original failure to surface to caller
-            raise
+        data = _openai_post_json("/chat/completions", payload, api_key, timeout)
+        # Normalize to a shape _parse_responses_output expects
+        msg = ""
+        choices = data.get("choices") or []
+        if isinstance(choices, list) and choices:
+            first = choices[0]
+            if isinstance(first, dict):
+                # Chat-style
+                msg = (first.get("message") or {}).get("content") or first.get("text") or ""
+        return {"output_text": msg, "output": [{"content": msg}]}
 
 
 def _parse_responses_output(resp: dict) -> dict | None:
@@ -390,7 +841,7 @@ def _parse_responses_output(resp: dict) -> dict | None:
     out_text = resp.get("output_text") or ""
     if out_text:
         try:
-            return json.loads(out_text)
+            return _json_loads(out_text)
         except Exception:
             # Attempt to extract a JSON object from the text (first "{" .. last "}")
             try:
@@ -398,7 +849,7 @@ def _parse_responses_output(resp: dict) -> dict | None:
                 last = out_text.rfind("}")
                 if first != -1 and last != -1 and last > first:
                     candidate = out_text[first : last + 1]
-                    return json.loads(candidate)
+                    return _json_loads(candidate)
             except Exception:
                 pass
             return {"html": out_text}
@@ -415,7 +866,7 @@ def _parse_responses_output(resp: dict) -> dict | None:
     if not joined:
         return None
     try:
-        return json.loads(joined)
+        return _json_loads(joined)
     except Exception:
         # Try to extract JSON substring if the model wrapped it in text
         try:
@@ -423,12 +874,84 @@ def _parse_responses_output(resp: dict) -> dict | None:
             last = joined.rfind("}")
             if first != -1 and last != -1 and last > first:
                 candidate = joined[first : last + 1]
-                return json.loads(candidate)
+                return _json_loads(candidate)
         except Exception:
             pass
         return {"html": joined}
 
 
+def openai_batch_submit(prompts: list[tuple[str, str]], model: str, api_key: str) -> str:
+    """Submit (custom_id, prompt) pairs as one OpenAI batch job against /v1/responses; returns the batch id.
+
+    Batch jobs cost half the online price and finish within the 24h completion window (usually much sooner).
+    """
+    jsonl = "\n".join(
+        json.dumps({"custom_id": cid, "method": "POST", "url": "/v1/responses", "body": _responses_payload(prompt, model)}, ensure_ascii=False)
+        for cid, prompt in prompts
+    ).encode("utf-8")
+    boundary = uuid.uuid4().hex
+    upload = b"".join(
+        (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="purpose"\r\n\r\nbatch\r\n'.encode(),
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="auto_blog_batch.jsonl"\r\n'.encode(),
+            b"Content-Type: application/jsonl\r\n\r\n",
+            jsonl,
+            f"\r\n--{boundary}--\r\n".encode(),
+        )
+    )
+    file_obj = json.loads(_openai_request("POST", "/files", api_key, upload, f"multipart/form-data; boundary={boundary}", timeout=120))
+    batch_req = {"input_file_id": file_obj["id"], "endpoint": "/v1/responses", "completion_window": "24h"}
+    batch_obj = json.loads(_openai_request("POST", "/batches", api_key, json.dumps(batch_req).encode("utf-8")))
+    return batch_obj["id"]
+
+
+def _responses_output_text(body: dict) -> str:
+    """Concatenated output text of a raw /responses body (the REST shape has no output_text shortcut)."""
+    if body.get("output_text"):
+        return body["output_text"]
+    texts = []
+    for item in body.get("output") or []:
+        for part in (item.get("content") or []) if isinstance(item, dict) else []:
+            if isinstance(part, dict) and part.get("type") == "output_text":
+                texts.append(part.get("text") or "")
+    return "".join(texts)
+
+
+def openai_batch_collect(
+    batch_id: str, api_key: str, timeout: int = OPENAI_BATCH_TIMEOUT_DEFAULT, poll_seconds: int = OPENAI_BATCH_POLL_SECONDS
+) -> Iterator[tuple[str, dict | None]]:
+    """Wait for a batch job, then yield (custom_id, parsed JSON or None) per request.
+
+    Raises TimeoutError when the job is still running after timeout seconds, RuntimeError if it failed.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        batch_obj = json.loads(_openai_request("GET", f"/batches/{batch_id}", api_key))
+        status = batch_obj.get("status")
+        if status == "completed":
+            break
+        if status in ("failed", "expired", "cancelling", "cancelled"):
+            raise RuntimeError(f"OpenAI batch {batch_id} ended with status {status}")
+        if time.monotonic() + poll_seconds > deadline:
+            raise TimeoutError(f"OpenAI batch {batch_id} still {status} after {timeout}s")
+        time.sleep(poll_seconds)
+
+    output_file_id = batch_obj.get("output_file_id")
+    if not output_file_id:
+        return
+    raw = _openai_request("GET", f"/files/{output_file_id}/content", api_key, timeout=120)
+    for line in raw.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        response = row.get("response") or {}
+        body = response.get("body")
+        if response.get("status_code") != 200 or not isinstance(body, dict):
+            yield row.get("custom_id") or "", None
+            continue
+        yield row.get("custom_id") or "", _parse_responses_output({"output_text": _responses_output_text(body)})
+
+
 def expand_article_with_openai(title: str, transcript: str, existing_html: str, model: str = "gpt-4.1-mini") -> dict:
     api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
     if not api_key:
@@ -449,16 +972,63 @@ Existing article HTML (for reference):
     return parsed
 
 
-def expand_article_to_json_spec(title: str, transcript: str, existing_html: str, model: str = OPENAI_MODEL_DEFAULT) -> dict:
-    """Ask the LLM to return a structured JSON spec for the article (hero, sections, tips, stats, checklist, faqs)."""
-    api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
-    if not api_key:
-        raise RuntimeError("OpenAI key not set")
-    max_chunk = 12000
-    chunks = [transcript[i:i+max_chunk] for i in range(0, len(transcript), max_chunk)] if transcript else []
-    transcript_parts = ""
-    for idx, c in enumerate(chunks, 1):
-        transcript_parts += f"\n\n--- TRANSCRIPT PART {idx}/{len(chunks)} ---\n{c}\n"
+# Transcript parts sent to the model: 12k characters each, at most 6 (~72k characters). Anything past the cap
+# (the tail of a multi-hour podcast) is left out rather than growing the prompt and the summary fan-out.
+_TRANSCRIPT_CHUNK_CHARS = 12000
+_TRANSCRIPT_MAX_CHUNKS = 6
+
+
+def _iter_chunks(text: str, size: int) -> Iterator[str]:
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Slices of text split after ., ! or ? followed by whitespace (same cuts as re.split(r"(?<=[.!?])\s+"))."""
+    start = 0
+    for m in _RE_SENT_END.finditer(text):
+        yield text[start : m.start() + 1]
+        start = m.end()
+    yield text[start:]
+
+
+def _transcript_chunks(transcript: str) -> list[str]:
+    return list(itertools.islice(_iter_chunks(transcript, _TRANSCRIPT_CHUNK_CHARS), _TRANSCRIPT_MAX_CHUNKS))
+
+
+def _summarize_chunk(chunk: str, idx: int, total: int, model: str, api_key: str) -> str:
+    """~150-word summary of one transcript part; the part itself if the call fails or returns nothing usable."""
+    prompt = (
+        f"Summarize part {idx}/{total} of a video transcript in about 150 words for an article writer. "
+        "Keep every concrete tip, number, tool and example; drop filler and small talk.\n"
+        f'Return strictly valid JSON: {{"part_id": {idx}, "summary": "..."}}\n\n'
+        f"Transcript part:\n{chunk}"
+    )
+    try:
+        parsed = _parse_responses_output(_call_openai_responses(prompt, model, api_key))
+    except Exception:
+        return chunk
+    summary = parsed.get("summary") if isinstance(parsed, dict) else None
+    return summary.strip() if isinstance(summary, str) and summary.strip() else chunk
+
+
+def _summarize_chunks(chunks: list[str], model: str, api_key: str) -> list[str]:
+    """Summaries of all transcript parts, requested concurrently; order matches chunks."""
+    with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as ex:
+        futures = [ex.submit(_summarize_chunk, c, idx, len(chunks), model, api_key) for idx, c in enumerate(chunks, 1)]
+    return [f.result() for f in futures]
+
+
+def _spec_prompt(title: str, transcript: str, existing_html: str, chunks: list[str] | None = None) -> tuple[str, str]:
+    """Prompt for the structured article spec, plus the transcript section it embeds (reused by the repair prompt).
+
+    chunks overrides the transcript split (e.g. per-part summaries of a long transcript).
+    """
+    if chunks is None:
+        chunks = _transcript_chunks(transcript)
+    transcript_parts = "".join(
+        f"\n\n--- TRANSCRIPT PART {idx}/{len(chunks)} ---\n{c}\n" for idx, c in enumerate(chunks, 1)
+    )
     # Build prompt template and substitute transcript/existing_html/title to avoid f-string brace interpolation issues.
     spec_template = """
 You are an expert SEO content strategist and conversion copywriter. Produce a structured JSON specification for a long-form, publication-ready article based on the video transcript and existing draft.
@@ -513,56 +1083,135 @@ Return strictly valid JSON. Use only the site's CSS classes for HTML fragments.
     spec_prompt = spec_template.replace("TRANSCRIPT_PARTS_PLACEHOLDER", transcript_parts).replace(
         "EXISTING_HTML_PLACEHOLDER", existing_html[:4000]
     ).replace("TITLE_PLACEHOLDER", title)
-    resp = _call_openai_responses(spec_prompt, model, api_key)
-    parsed = _parse_responses_output(resp)
-    if not parsed:
-        # Use deterministic rich spec generator for reliable, styled content
-        return _build_rich_spec_from_text(title=title, transcript=transcript, existing_html=existing_html)
+    return spec_prompt, transcript_parts
 
-    # Ensure minimal required fields exist and fall back to provided title/description when missing
-    if isinstance(parsed, dict):
-        if not parsed.get("title"):
-            parsed["title"] = title
-        if not parsed.get("description"):
-            # Derive short description from transcript or title
-            plain = re.sub(r"<[^>]+>", " ", (transcript or existing_html or title))
-            snippet = (plain.strip() or title)[:157]
-            parsed["description"] = (snippet + "...") if len(snippet) >= 160 else snippet
-        # Ensure sections list exists
-        if not isinstance(parsed.get("sections"), list):
-            parsed["sections"] = []
-    # If the returned spec is too short, attempt one automatic rewrite request to reach >=1000 words.
+
+@functools.lru_cache(maxsize=8)
+def _default_description(source: str, title: str) -> str:
+    """Short description from the transcript/draft text. Memoized so the first-pass and post-repair spec
+    fixes strip the same (long) transcript once."""
+    plain = _strip_tags(source)
+    snippet = (plain.strip() or title)[:157]
+    return (snippet + "...") if len(snippet) >= 160 else snippet
+
+
+def _fill_spec_defaults(spec: dict, title: str, transcript: str, existing_html: str) -> None:
+    """Fill a missing title/description/sections on an LLM spec in place."""
+    if not spec.get("title"):
+        spec["title"] = title
+    if not spec.get("description"):
+        # Derive short description from transcript or title
+        spec["description"] = _default_description(transcript or existing_html or title, title)
+    # Ensure sections list exists
+    if not isinstance(spec.get("sections"), list):
+        spec["sections"] = []
+
+
+def _spec_cache_path(title: str, transcript: str, existing_html: str, model: str, batch: bool = False) -> Path:
+    h = hashlib.sha256()
+    # --batch specs come from a different pipeline (raw transcript parts, no chunk summaries): keyed apart
+    pipeline = "batch" if batch else "online"
+    for part in (model, str(PROMPT_VERSION), pipeline, title, existing_html, transcript):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return SPEC_CACHE_DIR / f"{h.hexdigest()}.json"
+
+
+def _load_cached_spec(path: Path) -> dict | None:
+    try:
+        spec = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return spec if isinstance(spec, dict) else None
+
+
+def _store_cached_spec(path: Path, spec: dict) -> None:
+    """Write the spec atomically (temp file + rename); a failed write only costs a future cache miss."""
     try:
-        if isinstance(parsed, dict):
-            rendered = render_article_from_spec(parsed)
-            wc = _word_count_html(rendered)
-            if wc < 1000:
-                # Ask the LLM to expand the JSON spec to reach >=1000 words, returning valid JSON.
-                repair_prompt = (
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(spec, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def _repair_short_spec(spec: dict, transcript_parts: str, model: str, api_key: str) -> dict:
+    """spec, or the model's expanded version when spec renders under 1000 words (one extra call, best-effort)."""
+    try:
+        rendered = render_article_from_spec(spec)
+        wc = _word_count_html(rendered)
+        if wc < 1000:
+            # Ask the LLM to expand the JSON spec to reach >=1000 words, returning valid JSON.
+            repair_prompt = (
     'Please produce an improved structured JSON specification for the article that is at least 1000 words when rendered.\n'
     'Use the same keys as before (title, description, hero, stats, sections, checklist, faqs, closing_html).\n'
-    'Here is the previous JSON spec (improve it, keep structure):\n' + json.dumps(parsed, ensure_ascii=False) + '\n\n'
+    'Here is the previous JSON spec (improve it, keep structure):\n' + json.dumps(spec, ensure_ascii=False) + '\n\n'
     'Transcript for reference:\n' + transcript_parts + '\n\n'
     'Rules:\n- Return strictly valid JSON only.\n- Make sections substantially longer: each section should contain 3-6 paragraphs of ~40-80 words each, including examples and actionable steps.\n'
 )
 
-                resp2 = _call_openai_responses(repair_prompt, model, api_key)
-                parsed2 = _parse_responses_output(resp2)
-                if isinstance(parsed2, dict):
-                    parsed = parsed2
+            resp2 = _call_openai_responses(repair_prompt, model, api_key)
+            parsed2 = _parse_responses_output(resp2)
+            if isinstance(parsed2, dict):
+                return parsed2
     except Exception:
-        # Best-effort: ignore repair failures and return original parsed
+        # Best-effort: ignore repair failures and return original spec
         pass
+    return spec
+
+
+def _evict_cached_spec(title: str, transcript: str, existing_html: str = "", model: str = OPENAI_MODEL_DEFAULT) -> None:
+    """Drop the cached specs (online and --batch) for these inputs, so a rejected draft is not replayed by the next run."""
+    for batch in (False, True):
+        try:
+            _spec_cache_path(title, transcript, existing_html, model, batch=batch).unlink()
+        except OSError:
+            pass
+
+
+def expand_article_to_json_spec(
+    title: str,
+    transcript: str,
+    existing_html: str,
+    model: str = OPENAI_MODEL_DEFAULT,
+    use_cache: bool = True,
+    dry_run: bool = False,
+) -> dict:
+    """Ask the LLM to return a structured JSON spec for the article (hero, sections, tips, stats, checklist, faqs).
+
+    A cached spec for the same inputs is returned without a call unless use_cache is False; the new spec
+    replaces the cached one either way, except on a dry run, which writes nothing.
+    """
+    api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
+    if not api_key:
+        raise RuntimeError("OpenAI key not set")
+    cache_path = _spec_cache_path(title, transcript, existing_html, model)
+    if use_cache:
+        cached = _load_cached_spec(cache_path)
+        if cached is not None:
+            return cached
+    chunks = _transcript_chunks(transcript)
+    if len(chunks) > 1:
+        # Long transcript: condense the parts in parallel, then write the spec (and any repair) from the summaries
+        chunks = _summarize_chunks(chunks, model, api_key)
+    spec_prompt, transcript_parts = _spec_prompt(title, transcript, existing_html, chunks)
+    resp = _call_openai_responses(spec_prompt, model, api_key)
+    parsed = _parse_responses_output(resp)
+    if not parsed:
+        # Use deterministic rich spec generator for reliable, styled content
+        return _build_rich_spec_from_text(title=title, transcript=transcript, existing_html=existing_html)
+
+    # Ensure minimal required fields exist and fall back to provided title/description when missing
+    if isinstance(parsed, dict):
+        _fill_spec_defaults(parsed, title, transcript, existing_html)
+        # If the returned spec is too short, attempt one automatic rewrite request to reach >=1000 words.
+        parsed = _repair_short_spec(parsed, transcript_parts, model, api_key)
     # Final sanity fixes (ensure required fields exist)
     if isinstance(parsed, dict):
-        if not parsed.get("title"):
-            parsed["title"] = title
-        if not parsed.get("description"):
-            plain = re.sub(r"<[^>]+>", " ", (transcript or existing_html or title))
-            snippet = (plain.strip() or title)[:157]
-            parsed["description"] = (snippet + "...") if len(snippet) >= 160 else snippet
-        if not isinstance(parsed.get("sections"), list):
-            parsed["sections"] = []
+        _fill_spec_defaults(parsed, title, transcript, existing_html)
+        if not dry_run:
+            _store_cached_spec(cache_path, parsed)
     return parsed
 
 def render_article_from_spec(spec: dict) -> str:
@@ -642,8 +1291,8 @@ def render_article_from_spec(spec: dict) -> str:
 def _html_text_snippets(html: str, n_chars: int = 1000) -> str:
     """Roughly strip tags to get first text snippet (naive)."""
     # Remove tags
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _strip_tags(html)
+    text = _RE_WS.sub(" ", text).strip()
     return text[:n_chars]
 
 
@@ -654,9 +1303,14 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     """
     breakdown: dict[str, int] = {}
     total = 0
+    html = html or ""
+    # Lowercase once; the keyword checks below reuse it
+    title_lower = (title or "").lower()
+    # Empty draft (e.g. no transcript): the HTML checks all score their empty value, so skip the regex scans
+    has_html = bool(html.strip())
 
     # Word count -> up to 15 points (700+ words full points)
-    words = len(re.findall(r"\w+", re.sub(r"<[^>]+>", " ", html)))
+    words = _word_count_html(html) if has_html else 0
     wc_pts = min(15, int(15 * min(1.0, words / 700)))
     breakdown["word_count"] = wc_pts
     total += wc_pts
@@ -673,8 +1327,20 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     breakdown["meta_description"] = meta_pts
     total += meta_pts
 
+    if not has_html:
+        kw = (threshold_keyword or "").strip().lower()
+        kw_pts = (5 if kw in title_lower else 0) if kw else (5 if title else 0)
+        breakdown.update(
+            h2_count=0, keyword_presence=kw_pts, internal_links=0, external_links=0, images_alt=0,
+            toc=0, ai_phrases=5, schema=0, mobile=5, trust_signals=0,
+        )
+        return min(100, total + kw_pts + 10), breakdown
+
+    # Literal markers (<h2, schema type, TOC heading) are found with C substring search on one lowercased copy
+    html_lower = html.lower()
+
     # H2 count -> 10 points if >=3
-    h2_count = len(re.findall(r"<h2\b", html, flags=re.I))
+    h2_count = html_lower.count("<h2")
     h2_pts = 10 if h2_count >= 3 else (5 if h2_count == 2 else 0)
     breakdown["h2_count"] = h2_pts
     total += h2_pts
@@ -682,10 +1348,10 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     # Keyword presence in title + first paragraph -> 10 points
     kw = (threshold_keyword or "").strip().lower()
     first_para = ""
-    m = re.search(r"<p\b[^>]*>(.*?)</p>", html, flags=re.I | re.S)
+    m = _RE_FIRST_P.search(html)
     if m:
-        first_para = re.sub(r"<[^>]+>", "", m.group(1) or "").strip().lower()
-    title_has = kw and kw in (title or "").lower()
+        first_para = _strip_tags(m.group(1) or "", "").strip().lower()
+    title_has = kw and kw in title_lower
     para_has = kw and kw in first_para
     kw_pts = 0
     if kw:
@@ -700,42 +1366,44 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     total += kw_pts
 
     # Internal links (to / pages) -> 10 points if >=1
-    internal_links = re.findall(r'href=["\'](/[^"\']+)["\']', html)
-    int_pts = 10 if len(internal_links) >= 1 else 0
+    int_pts = 10 if _RE_INTERNAL_HREF.search(html) else 0
     breakdown["internal_links"] = int_pts
     total += int_pts
 
     # External authoritative links -> 5 points if >=1
-    external_links = re.findall(r'href=["\']https?://([^"\']+)["\']', html)
-    # exclude links to own domain (heuristic)
-    external_filtered = [u for u in external_links if "sparksmetrics" not in u.lower()]
-    ext_pts = 5 if len(external_filtered) >= 1 else 0
+    # exclude links to own domain (heuristic); the first other domain is enough
+    ext_pts = 0
+    for m in _RE_EXTERNAL_HREF.finditer(html):
+        if "sparksmetrics" not in m.group(1).lower():
+            ext_pts = 5
+            break
     breakdown["external_links"] = ext_pts
     total += ext_pts
 
     # Images with alt -> 5 points if all images have alt and at least 1 image
-    img_tags = re.findall(r"<img\b[^>]*>", html, flags=re.I)
-    img_with_alt = [t for t in img_tags if re.search(r'\balt=["\'].*?["\']', t, flags=re.I)]
     img_pts = 0
-    if img_tags:
-        img_pts = 5 if len(img_with_alt) == len(img_tags) else 2
+    for m in _RE_IMG.finditer(html):
+        if not _RE_IMG_ALT.search(m.group(0)):
+            # One image without alt settles it; no need to look at the rest
+            img_pts = 2
+            break
+        img_pts = 5
     breakdown["images_alt"] = img_pts
     total += img_pts
 
     # Table of contents presence (simple check for <nav id="toc" or "Table of contents")
-    toc = 5 if re.search(r"(Table of contents|<nav[^>]+toc|id=[\"']toc[\"'])", html, flags=re.I) else 0
+    toc = 5 if "table of contents" in html_lower or _RE_TOC_MARKUP.search(html) else 0
     breakdown["toc"] = toc
     total += toc
 
     # Avoid generic AI phrases (naive): penalize if found
-    ai_phrases = ["as an ai", "as an ai language model", "in this article we will", "in this post i"]
-    ai_found = any(p in html.lower() for p in ai_phrases)
+    ai_found = _RE_AI_PHRASES.search(html) is not None
     ai_pts = 0 if ai_found else 5
     breakdown["ai_phrases"] = ai_pts
     total += ai_pts
 
     # Schema presence (article JSON-LD) -> 5 points
-    schema_pts = 5 if re.search(r"application/ld\+json", html, flags=re.I) else 0
+    schema_pts = 5 if "application/ld+json" in html_lower else 0
     breakdown["schema"] = schema_pts
     total += schema_pts
 
@@ -744,8 +1412,8 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     total += 5
 
     # Engagement/trust signals (author, references) -> 10 points if author or references found
-    author_found = bool(re.search(r'author|byline|class=["\']author', html, flags=re.I))
-    references_found = bool(re.search(r"references|sources|cite", html, flags=re.I))
+    author_found = bool(_RE_AUTHOR.search(html))
+    references_found = bool(_RE_REFERENCES.search(html))
     trust_pts = 10 if author_found and references_found else (5 if author_found or references_found else 0)
     breakdown["trust_signals"] = trust_pts
     total += trust_pts
@@ -755,32 +1423,30 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     return score, breakdown
 
 
-def build_post_template(video_id: str, post: dict[str, Any], article_html: str) -> str:
-    """Return full Jinja template for a video-based post."""
-    # Use post dict fields for head tags. Video embed uses post.video_id to keep template reusable.
-    return f"""{{% extends "base.html" %}}
-{{% block title %}}{{{{ post.title }}}} | Sparksmetrics{{% endblock %}}
-{{% block meta_description %}}{{{{ post.description }}}}{{% endblock %}}
-{{% block og_title %}}{{{{ post.title }}}}{{% endblock %}}
-{{% block twitter_title %}}{{{{ post.title }}}}{{% endblock %}}
-{{% block og_description %}}{{{{ post.description }}}}{{% endblock %}}
-{{% block twitter_description %}}{{{{ post.description }}}}{{% endblock %}}
-
-{{% block content %}}
+# build_post_template skeleton, split around the two values it splices in (video ID, article body)
+_POST_TEMPLATE_HEAD = """{% extends "base.html" %}
+{% block title %}{{ post.title }} | Sparksmetrics{% endblock %}
+{% block meta_description %}{{ post.description }}{% endblock %}
+{% block og_title %}{{ post.title }}{% endblock %}
+{% block twitter_title %}{{ post.title }}{% endblock %}
+{% block og_description %}{{ post.description }}{% endblock %}
+{% block twitter_description %}{{ post.description }}{% endblock %}
+
+{% block content %}
 <section class="bg-light-base py-10 md:py-14 border-b border-gray-100">
   <div class="content-narrow px-6">
-    <a href="{{{{ url_for('main.blog_index') }}}}" class="inline-flex items-center gap-2 text-[10px] font-black uppercase tracking-widest text-gray-500 hover:text-primary transition-colors min-h-[44px]">
+    <a href="{{ url_for('main.blog_index') }}" class="inline-flex items-center gap-2 text-[10px] font-black uppercase tracking-widest text-gray-500 hover:text-primary transition-colors min-h-[44px]">
       <span class="material-symbols-outlined text-base" aria-hidden="true">arrow_back</span>
       Back to blog
     </a>
 
     <header class="mt-6">
-      <p class="text-primary font-bold text-sm uppercase tracking-[0.4em] mb-4">{{{{ post.category }}}}</p>
-      <h1 class="normal-case text-3xl md:text-5xl font-display font-black tracking-tight text-deep-charcoal mb-4">{{{{ post.title }}}}</h1>
-      <p class="text-gray-600 text-base md:text-lg mb-0">{{{{ post.description }}}}</p>
+      <p class="text-primary font-bold text-sm uppercase tracking-[0.4em] mb-4">{{ post.category }}</p>
+      <h1 class="normal-case text-3xl md:text-5xl font-display font-black tracking-tight text-deep-charcoal mb-4">{{ post.title }}</h1>
+      <p class="text-gray-600 text-base md:text-lg mb-0">{{ post.description }}</p>
       <div class="mt-6 flex flex-wrap gap-2">
-        <span class="inline-flex items-center px-3 py-2 rounded-lg bg-white border border-gray-200 text-gray-500 text-[10px] font-bold uppercase tracking-widest">Published {{{{ post.published_date }}}}</span>
-        <span class="inline-flex items-center px-3 py-2 rounded-lg bg-white border border-gray-200 text-gray-500 text-[10px] font-bold uppercase tracking-widest">{{{{ post.reading_time }}}}</span>
+        <span class="inline-flex items-center px-3 py-2 rounded-lg bg-white border border-gray-200 text-gray-500 text-[10px] font-bold uppercase tracking-widest">Published {{ post.published_date }}</span>
+        <span class="inline-flex items-center px-3 py-2 rounded-lg bg-white border border-gray-200 text-gray-500 text-[10px] font-bold uppercase tracking-widest">{{ post.reading_time }}</span>
       </div>
     </header>
   </div>
@@ -791,7 +1457,8 @@ def build_post_template(video_id: str, post: dict[str, Any], article_html: str)
     <div class="aspect-video w-full rounded-2xl overflow-hidden bg-black border border-black/10">
       <iframe
         class="w-full h-full"
-        src="https://www.youtube.com/embed/{{{{ post.video_id or '{video_id}' }}}}"
+        src="https://www.youtube.com/embed/{{ post.video_id or '"""
+_POST_TEMPLATE_MID = """' }}"
         title="YouTube video player"
         frameborder="0"
         loading="lazy"
@@ -802,14 +1469,26 @@ def build_post_template(video_id: str, post: dict[str, Any], article_html: str)
     </div>
 
     <article class="blog-prose mt-10">
-{article_html}
+"""
+_POST_TEMPLATE_TAIL = """
     </article>
   </div>
 </section>
-{{% endblock %}}
+{% endblock %}
 """
 
 
+def build_post_template(video_id: str, post: dict[str, Any], article_html: str) -> str:
+    """Return full Jinja template for a video-based post."""
+    # Use post dict fields for head tags. Video embed uses post.video_id to keep template reusable.
+    return _POST_TEMPLATE_HEAD + video_id + _POST_TEMPLATE_MID + article_html + _POST_TEMPLATE_TAIL
+
+
+def write_post_template(out: TextIO, video_id: str, post: dict[str, Any], article_html: str) -> None:
+    """Write the template build_post_template would return straight to out, without building the full string."""
+    out.writelines((_POST_TEMPLATE_HEAD, video_id, _POST_TEMPLATE_MID, article_html, _POST_TEMPLATE_TAIL))
+
+
 def slack_notify(webhook_url: str, text: str) -> None:
     webhook_url = (webhook_url or "").strip()
     if not webhook_url:
@@ -826,12 +1505,14 @@ def slack_notify(webhook_url: str, text: str) -> None:
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Auto-generate blog posts from new YouTube videos.")
-    parser.add_argument("--channel", default="", help="YouTube channel ID (starts with UC...)")
+    parser.add_argument("--channel", default="", help="YouTube channel ID (starts with UC...); comma-separate to poll several")
     parser.add_argument("--video", default="", help="YouTube video ID or URL to process a single video")
     parser.add_argument("--max-results", type=int, default=5, help="How many latest videos to check")
     parser.add_argument("--dry-run", action="store_true", help="Do not write files; just print what would happen")
     parser.add_argument("--force", action="store_true", help="Force publish even if SEO score is below threshold")
     parser.add_argument("--provider", default=os.environ.get("BLOG_WRITER_PROVIDER", "openai"), help="Writer provider: openai|none")
+    parser.add_argument("--batch", action="store_true", help="Draft new videos through the OpenAI Batch API (half price, slower); for backfills")
+    parser.add_argument("--batch-timeout", type=int, default=OPENAI_BATCH_TIMEOUT_DEFAULT, help="Seconds to wait for --batch results before drafting online")
     args = parser.parse_args()
 
     project_root = Path(__file__).resolve().parents[1]
@@ -843,18 +1524,18 @@ def main() -> int:
     posts_path = project_root / "app" / "blog_posts.json"
     templates_dir = project_root / "app" / "templates"
 
-    posts = load_blog_posts(posts_path)
+    # blog_posts.json is only parsed when the index is stale or a post is published
+    posts_index = open_posts_index(posts_path, persist=not args.dry_run)
 
     videos: list[YouTubeVideo] = []
     if video_arg:
-        # Extract video id if a full URL was provided
-        m = re.search(r"(?:v=|youtu\\.be/|/embed/)([A-Za-z0-9_-]{11})", video_arg)
-        vid = m.group(1) if m else (video_arg if re.fullmatch(r"[A-Za-z0-9_-]{11}", video_arg) else "")
+        # Extract video id if a full URL was provided (same extractor as the posts index, so /shorts/ works too)
+        vid = _extract_id(video_arg) or (video_arg if _RE_VIDEO_ID.fullmatch(video_arg) else "")
         if not vid:
             raise SystemExit("Invalid video id or URL passed to --video")
         # Try to fetch metadata via Supadata if available, else fall back
         title = vid
-        published = datetime.now(timezone.utc).strftime("%d %b %Y").lstrip("0")
+        published = _format_date(datetime.now(timezone.utc))
         supa_key = (os.environ.get("SUPADATA_KEY") or "").strip()
         if supa_key:
             try:
@@ -866,31 +1547,62 @@ def main() -> int:
                 title = getattr(info, "title", None) or info.get("title") if isinstance(info, dict) else title
                 published_raw = getattr(info, "published_at", None) or (info.get("published_at") if isinstance(info, dict) else None)
                 if published_raw:
-                    try:
-                        dt = datetime.fromisoformat(published_raw.replace("Z", "+00:00"))
-                        published = dt.strftime("%d %b %Y").lstrip("0")
-                    except Exception:
-                        published = published
+                    published = _human_date(str(published_raw), default=published)
             except Exception:
                 # ignore failures; we'll continue with best-effort metadata
                 pass
         videos = [YouTubeVideo(video_id=vid, title=str(title), url=f"https://youtu.be/{vid}", published=published)]
     else:
-        if not channel_id:
+        channel_ids = [c.strip() for c in channel_id.split(",") if c.strip()]
+        if not channel_ids:
             raise SystemExit("Missing channel id. Pass --channel UC... or set YOUTUBE_CHANNEL_ID in .env")
-        videos = fetch_latest_videos(channel_id, max_results=max(1, args.max_results))
+        # ETag/Last-Modified per channel, so an unchanged feed comes back as an empty 304
+        feed_cache_path = project_root / "app" / "youtube_feed_cache.json"
+        feed_cache = load_feed_cache(feed_cache_path)
+        videos = fetch_latest_videos_many(channel_ids, max_results=max(1, args.max_results), feed_cache=feed_cache)
+        if not args.dry_run:
+            save_feed_cache(feed_cache_path, feed_cache)
     if not videos:
         print("No videos found (RSS fetch failed).")
         return 0
 
+    # Settings read once; the per-video loop below only uses these locals
+    openai_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
+    openai_model = os.environ.get("OPENAI_MODEL") or OPENAI_MODEL_DEFAULT
+    slack_webhook = (os.environ.get("SLACK_WEBHOOK_URL") or "").strip()
+    min_words = int(os.environ.get("BLOG_MIN_WORDS", str(BLOG_MIN_WORDS_DEFAULT)))
+    publish_threshold = int(os.environ.get("BLOG_PUBLISH_THRESHOLD", str(BLOG_PUBLISH_THRESHOLD_DEFAULT)))
+
     created: list[dict[str, Any]] = []
+    # One index lookup per video ID; the set also drops a video listed by two polled channels
+    new_videos: list[YouTubeVideo] = []
+    pending_ids: set[str] = set()
     for v in videos:
-        if has_post_for_video(posts, v.video_id):
-            continue
-
-        try:
-            transcript = fetch_transcript(v.video_id)
-        except Exception as e:
+        if v.video_id not in pending_ids and not has_post_for_video(posts_index, v.video_id):
+            pending_ids.add(v.video_id)
+            new_videos.append(v)
+    transcripts: dict[str, str] = {}
+    transcript_errors: dict[str, Exception] = {}
+    batch_specs: dict[str, dict] = {}
+    if args.batch and (args.provider or "").strip().lower() == "openai" and new_videos:
+        if args.dry_run:
+            print(f"[dry-run] Would submit {len(new_videos)} video(s) to the OpenAI Batch API")
+        else:
+            # The batch drafts every new video (specs land in the spec cache for later runs), so it needs
+            # all their transcripts; fetch them concurrently up front
+            transcripts, transcript_errors = fetch_transcripts_batch([v.video_id for v in new_videos])
+            batch_specs = draft_specs_batch(new_videos, transcripts, timeout=max(0, args.batch_timeout))
+    for v in new_videos:
+        if v.video_id not in transcripts and v.video_id not in transcript_errors:
+            # Fetched per video: the run stops after the first published post, so prefetching the rest
+            # would pay the transcript provider for videos this run never uses
+            try:
+                transcripts[v.video_id] = fetch_transcript(v.video_id)
+            except Exception as e:  # noqa: BLE001
+                transcript_errors[v.video_id] = e
+        transcript = transcripts.get(v.video_id, "")
+        e = transcript_errors.get(v.video_id)
+        if e is not None:
             # If transcript isn't available, proceed with an empty transcript
             # so deterministic fallback drafts can still be created.
             msg = f"Transcript unavailable for {v.video_id}; continuing with empty transcript. ({type(e).__name__}: {e})"
@@ -899,20 +1611,24 @@ def main() -> int:
             else:
                 print(msg)
             transcript = ""
-        # Generate initial draft (prefer provider from args)
-        gen = generate_article_html(title=v.title, transcript=transcript, video_url=v.url, provider=args.provider)
+        # Generate initial draft (prefer provider from args; --batch results when the job returned one)
+        spec = batch_specs.get(v.video_id)
+        if spec is not None:
+            gen = _article_from_spec(spec, v.title)
+        else:
+            gen = generate_article_html(
+                title=v.title, transcript=transcript, video_url=v.url, provider=args.provider, dry_run=args.dry_run
+            )
 
         # If draft is thin, expand using OpenAI to >= BLOG_MIN_WORDS when possible
         article_html_candidate = gen.get("html") or ""
         wc = _word_count_html(article_html_candidate)
-        min_words = int(os.environ.get("BLOG_MIN_WORDS", str(BLOG_MIN_WORDS_DEFAULT)))
         if wc < min_words:
-            api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
-            if api_key:
+            if openai_key:
                 try:
                     if args.dry_run:
                         print(f"[dry-run] Draft {wc} words < {min_words}, requesting OpenAI expansion")
-                    expanded = expand_article_with_openai(title=v.title, transcript=transcript, existing_html=article_html_candidate, model=(os.environ.get("OPENAI_MODEL") or "gpt-4.1-mini"))
+                    expanded = expand_article_with_openai(title=v.title, transcript=transcript, existing_html=article_html_candidate, model=openai_model)
                     # merge expanded output
                     if isinstance(expanded, dict) and expanded.get("html"):
                         gen["html"] = expanded.get("html")
@@ -926,16 +1642,15 @@ def main() -> int:
                     if args.dry_run:
                         print(f"[dry-run] OpenAI expansion failed: {e}")
                     else:
-                        slack_notify((os.environ.get("SLACK_WEBHOOK_URL") or "").strip(), f"Auto-blog expansion failed for {v.video_id}: {e}")
+                        slack_notify(slack_webhook, f"Auto-blog expansion failed for {v.video_id}: {e}")
             else:
                 # No OpenAI key: fall back to deterministic enrichment or flag for review
                 if args.dry_run:
                     print(f"[dry-run] Draft {wc} words < {min_words} and no OpenAI key — will flag for review")
                 else:
-                    slack_notify((os.environ.get("SLACK_WEBHOOK_URL") or "").strip(), f"Auto-blog draft for {v.video_id} is {wc} words (<{min_words}) and needs human expansion.")
+                    slack_notify(slack_webhook, f"Auto-blog draft for {v.video_id} is {wc} words (<{min_words}) and needs human expansion.")
 
         # SEO scoring and optional rewrites (existing behavior)
-        publish_threshold = int(os.environ.get("BLOG_PUBLISH_THRESHOLD", str(BLOG_PUBLISH_THRESHOLD_DEFAULT)))
         force_publish = bool(args.force)
         # Derive primary keyword from title (naive: remove stopwords later if needed)
         primary_kw = re.sub(r"[^a-z0-9\s]", "", v.title.lower()).split()
@@ -945,14 +1660,22 @@ def main() -> int:
         attempts = 0
         used_provider = args.provider
         # If score below threshold and we have OpenAI available, try one rewrite with OpenAI
-        while score < publish_threshold and attempts < 2 and (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY")):
+        while score < publish_threshold and attempts < 2 and openai_key:
             attempts += 1
             if args.dry_run:
                 print(f"[dry-run] SEO score {score} below threshold {publish_threshold}; attempting rewrite with OpenAI (attempt {attempts})")
-            gen = generate_article_html(title=v.title, transcript=transcript, video_url=v.url, provider="openai")
+            scored = (article_html_candidate, gen.get("title"), gen.get("description"))
+            # A rewrite must ask the model again: the cached spec is the draft that just scored too low
+            gen = generate_article_html(
+                title=v.title, transcript=transcript, video_url=v.url, provider="openai", use_cache=False, dry_run=args.dry_run
+            )
             article_html_candidate = gen.get("html") or ""
-            score, breakdown = score_article(article_html_candidate, gen.get("title") or v.title, gen.get("description") or "", threshold_keyword=keyword)
             used_provider = "openai"
+            if (article_html_candidate, gen.get("title"), gen.get("description")) == scored:
+                # The fresh request returned exactly the draft just scored (e.g. the model fell back to the
+                # deterministic spec both times): the score can't change, so don't rescore or retry
+                break
+            score, breakdown = score_article(article_html_candidate, gen.get("title") or v.title, gen.get("description") or "", threshold_keyword=keyword)
 
         if not force_publish and score < publish_threshold:
             # Do not publish; notify Slack with report
@@ -967,7 +1690,9 @@ def main() -> int:
             if args.dry_run:
                 print("[dry-run] " + msg)
             else:
-                slack_notify((os.environ.get("SLACK_WEBHOOK_URL") or "").strip(), msg)
+                slack_notify(slack_webhook, msg)
+                # The cache only saves a re-run from paying for a draft again; a rejected draft is redrafted next run
+                _evict_cached_spec(v.title, transcript)
             # Skip publishing this video
             continue
 
@@ -976,7 +1701,7 @@ def main() -> int:
         template_path = templates_dir / template_name
 
         description = (gen.get("description") or "").strip()[:160]
-        reading_time = estimate_reading_time(transcript)
+        reading_time = estimate_reading_time(transcript, word_count=_summarize_text(transcript)[1])
         category = (gen.get("category") or "CRO").strip() or "CRO"
 
         post = {
@@ -994,16 +1719,19 @@ def main() -> int:
         }
 
         article_html = gen.get("html") or ""
-        # Indent nicely inside <article>
-        article_html = "\n".join("      " + line if line.strip() else "" for line in article_html.splitlines()).rstrip() + "\n"
+        # Indent nicely inside <article> (isspace tests for blank lines without allocating a stripped copy)
+        article_html = "\n".join(
+            "      " + line if line and not line.isspace() else "" for line in article_html.splitlines()
+        ).rstrip() + "\n"
         template = build_post_template(video_id=v.video_id, post=post, article_html=article_html)
 
         if args.dry_run:
             print(f"[dry-run] Would create {template_path} and append to {posts_path}: {slug}")
         else:
             template_path.write_text(template, encoding="utf-8")
+            posts = load_blog_posts(posts_path)
             posts.insert(0, post)  # newest first
-            save_blog_posts(posts_path, posts)
+            save_blog_posts(posts_path, posts)  # also refreshes the index
 
         created.append(post)
 
@@ -1012,14 +1740,13 @@ def main() -> int:
 
     if created:
         site_base = (os.environ.get("SITE_BASE_URL") or "https://sparksmetrics.com").rstrip("/")
-        webhook = (os.environ.get("SLACK_WEBHOOK_URL") or "").strip()
         for post in created:
             url = f"{site_base}/blog/{post['slug']}"
             text = f"New blog post created from YouTube upload: *{post['title']}*\\n{url}\\nVideo: {post.get('youtube_url')}"
             if args.dry_run:
                 print(f"[dry-run] Slack message: {text}")
             else:
-                slack_notify(webhook, text)
+                slack_notify(slack_webhook, text)
         return 0
 
     print("No new videos to post.")
@@ -9,6 +9,7 @@ This script:
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -17,31 +18,52 @@ INJECT_SNIPPET_PATTERN = re.compile(
     flags=re.I | re.S,
 )
 
+# clean_inner passes, compiled once for the whole run (applied in this order to every template)
+WHY_WITH_LIST_PATTERN = re.compile(r'<p>\s*<strong>\s*Why this matters\s*</strong>.*?</ul>\s*</p>', flags=re.I | re.S)
+WHY_PARAGRAPH_PATTERN = re.compile(r'<p>\s*<strong>\s*Why this matters\s*</strong>.*?</p>', flags=re.I | re.S)
+HOW_PARAGRAPH_PATTERN = re.compile(r'<p>\s*How to check:.*?</ul>\s*</p>', flags=re.I | re.S)
+HOW_TO_CHECK_PATTERN = re.compile(r'How to check:.*?</ul>', flags=re.I | re.S)
+DUP_QUICK_TESTS_PATTERN = re.compile(
+    r'(<ul>\s*<li>Quick test 1:.*?</li>\s*<li>Quick test 2:.*?</li>\s*<li>Quick test 3:.*?</li>\s*</ul>)(\s*\1)+',
+    flags=re.I | re.S,
+)
+REPEATED_WHY_PATTERN = re.compile(r'(<p>\s*<strong>\s*Why this matters.*?</ul>\s*</p>)+', flags=re.I | re.S)
+STRAY_O_TAG_PATTERN = re.compile(r"</?o\b[^>]*>")
+BLANK_LINES_PATTERN = re.compile(r"\n\s*\n\s*\n+")
+H2_PATTERN = re.compile(r"<h2\b[^>]*>.*?</h2>", flags=re.I | re.S)
+P_OPEN_PATTERN = re.compile(r"<p\b", flags=re.I)
+# The blog-prose <article> of a template: (opening tag, inner HTML, closing tag)
+ARTICLE_BLOCK_PATTERN = re.compile(
+    r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', flags=re.I | re.S
+)
+
 def clean_inner(inner: str) -> str:
-    # Aggressively remove injected "Why this matters" blocks in several forms
-    inner = re.sub(r'<p>\s*<strong>\s*Why this matters\s*</strong>.*?</ul>\s*</p>', '', inner, flags=re.I | re.S)
-    inner = re.sub(r'<p>\s*<strong>\s*Why this matters\s*</strong>.*?</p>', '', inner, flags=re.I | re.S)
-    inner = re.sub(r'<p>\s*How to check:.*?</ul>\s*</p>', '', inner, flags=re.I | re.S)
+    # Aggressively remove injected "Why this matters" blocks in several forms.
+    # Separate passes on purpose: each one sees the previous pass's output, so an earlier removal
+    # can't be swallowed by a later form's lazy match (one fused alternation changes the result).
+    inner = WHY_WITH_LIST_PATTERN.sub('', inner)
+    inner = WHY_PARAGRAPH_PATTERN.sub('', inner)
+    inner = HOW_PARAGRAPH_PATTERN.sub('', inner)
     inner = INJECT_SNIPPET_PATTERN.sub("", inner)
     # Remove any standalone "How to check:" followed by lists without enclosing closing p tags
-    inner = re.sub(r'How to check:.*?</ul>', '', inner, flags=re.I | re.S)
+    inner = HOW_TO_CHECK_PATTERN.sub('', inner)
     # Remove orphaned duplicated quick-test lists (two or more repeated identical ul blocks) — collapse to single
-    inner = re.sub(r'(<ul>\s*<li>Quick test 1:.*?</li>\s*<li>Quick test 2:.*?</li>\s*<li>Quick test 3:.*?</li>\s*</ul>)(\s*\1)+', r'\1', inner, flags=re.I | re.S)
+    inner = DUP_QUICK_TESTS_PATTERN.sub(r'\1', inner)
     # Remove accidental multiple insertions of the same checklist text anywhere
-    inner = re.sub(r'(<p>\s*<strong>\s*Why this matters.*?</ul>\s*</p>)+', '', inner, flags=re.I | re.S)
+    inner = REPEATED_WHY_PATTERN.sub('', inner)
 
     # Remove stray broken tokens like "</o" or "<o" left from truncation
-    inner = re.sub(r"</?o\b[^>]*>", "", inner)
+    inner = STRAY_O_TAG_PATTERN.sub("", inner)
 
     # Normalize multiple blank lines
-    inner = re.sub(r"\n\s*\n\s*\n+", "\n\n", inner)
+    inner = BLANK_LINES_PATTERN.sub("\n\n", inner)
 
     # For each H2, ensure the clean snippet is present once after the H2 if there are less than 2 paragraphs following
     def ensure_block(match):
         h2 = match.group(0)
         # Look ahead a little to see if there are two <p> after
         rest = match.string[match.end(): match.end() + 400]
-        paras = re.findall(r"<p\b", rest, flags=re.I)
+        paras = P_OPEN_PATTERN.findall(rest)
         if len(paras) >= 2:
             return h2
         block = (
@@ -53,7 +75,7 @@ def clean_inner(inner: str) -> str:
         )
         return h2 + "\n" + block
 
-    inner = re.sub(r"<h2\b[^>]*>.*?</h2>", ensure_block, inner, flags=re.I | re.S)
+    inner = H2_PATTERN.sub(ensure_block, inner)
 
     # Fix malformed list/ol fragments like "</o" or "l>" leftover
     inner = inner.replace("</o", "").replace("l>", "l>")
@@ -61,19 +83,26 @@ def clean_inner(inner: str) -> str:
     return inner
 
 
+def _process(f: Path) -> str:
+    """Clean one template in place; returns the log line."""
+    txt = f.read_text(encoding="utf-8")
+    m = ARTICLE_BLOCK_PATTERN.search(txt)
+    if not m:
+        return f"Skipping {f.name}: no article block"
+    before, inner, after = txt[: m.start(2)], m.group(2), txt[m.end(2) :]
+    new_inner = clean_inner(inner)
+    new_txt = before + new_inner + after
+    f.write_text(new_txt, encoding="utf-8")
+    return f"Cleaned {f.name}"
+
+
 def run():
     templates_dir = Path(__file__).resolve().parents[1] / "app" / "templates"
-    for f in sorted(templates_dir.glob("blog_*.html")):
-        txt = f.read_text(encoding="utf-8")
-        m = re.search(r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', txt, flags=re.I | re.S)
-        if not m:
-            print(f"Skipping {f.name}: no article block")
-            continue
-        before, inner, after = txt[: m.start(2)], m.group(2), txt[m.end(2) :]
-        new_inner = clean_inner(inner)
-        new_txt = before + new_inner + after
-        f.write_text(new_txt, encoding="utf-8")
-        print(f"Cleaned {f.name}")
+    files = sorted(templates_dir.glob("blog_*.html"))
+    # Each template is independent: overlap the reads/writes; map keeps the log in file order
+    with ThreadPoolExecutor() as ex:
+        for msg in ex.map(_process, files):
+            print(msg)
 
 
 if __name__ == "__main__":
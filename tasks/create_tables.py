@@ -1,40 +1,52 @@
 """Create database tables. Run from project root: python3 tasks/create_tables.py"""
+import importlib.util
 import os
 import sys
 from pathlib import Path
 
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
 _root = Path(__file__).resolve().parent.parent
 if str(_root) not in sys.path:
     sys.path.insert(0, str(_root))
 
-# Load .env from project root first (same pattern as Upwork run.mjs) so DATABASE_URL is set before app imports
+
+def _load_app_module(name: str):
+    """Load app/<name>.py on its own. "import app.<name>" would run app/__init__.py first, which pulls in
+    Flask, the routes, the YouTube feed code and their dependencies; config.py and models.py need none of it."""
+    spec = importlib.util.spec_from_file_location(f"_app_{name}", _root / "app" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# app/config.py layers its .env values over os.environ at lookup time, so it can load before the block below
+config = _load_app_module("config")
+
+# Load .env from project root first (same pattern as run.py) so DATABASE_URL is set before app imports.
+# override=True: the file wins over the shell, as with the app's own .env handling.
 _env_path = _root / ".env"
-if _env_path.exists():
-    raw = _env_path.read_text(encoding="utf-8", errors="replace")
-    for line in raw.splitlines():
-        line = line.strip().replace("\r", "").strip("\ufeff")  # BOM
-        if line and not line.startswith("#") and "=" in line:
-            key, _, value = line.partition("=")
-            k, v = key.strip(), value.strip().strip("'\"").replace("\r", "")
-            if k and v:
-                os.environ[k] = v
-    # Fallback: ensure DATABASE_URL from any line containing DATABASE_URL=
-    if not os.environ.get("DATABASE_URL"):
-        for line in raw.splitlines():
-            if "DATABASE_URL=" in line:
-                v = line.split("=", 1)[1].strip().strip("'\"").replace("\r", "")
-                if v:
-                    os.environ["DATABASE_URL"] = v
-                break
+if load_dotenv is not None:
+    load_dotenv(_env_path, override=True)
+elif _env_path.is_file():
+    # No python-dotenv: reuse the app's compiled single-pass parser
+    os.environ.update(config._read_env_file(_env_path))
 if not os.environ.get("DATABASE_URL"):
     print("ERROR: DATABASE_URL not set. Check that", _env_path, "exists and contains DATABASE_URL=postgresql://...")
     sys.exit(1)
 
-from app import create_app
-from app.models import db
+from sqlalchemy import create_engine
+
+models = _load_app_module("models")
 
-app = create_app()
-with app.app_context():
-    db.create_all()
-    print("Tables created.")
+# DDL only needs the table metadata and an engine: no app factory, blueprints, templates or app context
+engine = create_engine(config._get_sqlalchemy_uri())
+try:
+    models.db.metadata.create_all(engine)
+finally:
+    engine.dispose()
+print("Tables created.")
 
@@ -10,30 +10,47 @@ This script:
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Compiled once for the run; every template goes through the same checks
+TOC_PRESENT_PATTERN = re.compile(r"(Table of contents|<nav[^>]+toc|id=[\"']toc[\"'])", flags=re.I)
+H2_TEXT_PATTERN = re.compile(r"<h2[^>]*>(.*?)</h2>", flags=re.I | re.S)
+TAG_PATTERN = re.compile(r"<[^>]+>")
+FIRST_P_PATTERN = re.compile(r"(<p\b[^>]*>.*?</p>)", flags=re.I | re.S)
+H2_SECTION_PATTERN = re.compile(r"<h2\b[^>]*>.*?</h2>([\s\S]{0,400})", flags=re.I)
+LEADING_P_PATTERN = re.compile(r"^\s*<p\b", flags=re.I)
+# The blog-prose <article> of a template: (opening tag, inner HTML, closing tag)
+ARTICLE_BLOCK_PATTERN = re.compile(
+    r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', flags=re.I | re.S
+)
 
 def ensure_toc(html: str) -> str:
-    if re.search(r"(Table of contents|<nav[^>]+toc|id=[\"']toc[\"'])", html, flags=re.I):
-        return html
-    # Build TOC from H2 headings
-    headers = re.findall(r"<h2[^>]*>(.*?)</h2>", html, flags=re.I | re.S)
-    if not headers:
+    if TOC_PRESENT_PATTERN.search(html):
         return html
+    # Build TOC from H2 headings, tagging each heading with its anchor in the same left-to-right sweep
     toc_items = []
-    for i, h in enumerate(headers, 1):
-        text = re.sub(r"<[^>]+>", "", h).strip()
+
+    def add_anchor(match):
+        i = len(toc_items) + 1
         anchor = f"toc-{i}"
+        text = TAG_PATTERN.sub("", match.group(1)).strip()
         toc_items.append(f'<li><a href="#{anchor}">{text}</a></li>')
-        # add id to header
-        html = html.replace(h, f'{h}<span id="{anchor}"></span>', 1)
-    toc_html = "<nav id=\"toc\" class=\"mb-6 p-4 bg-primary/5 rounded-lg\"><strong>Table of contents</strong><ul class=\"ml-4 mt-2\">"
-    toc_html += "\n".join(toc_items)
-    toc_html += "</ul></nav>\n"
+        # add id to header (right after the heading text, inside the <h2>)
+        return f'{match.string[match.start():match.end(1)]}<span id="{anchor}"></span>{match.string[match.end(1):match.end()]}'
+
+    html = H2_TEXT_PATTERN.sub(add_anchor, html)
+    if not toc_items:
+        return html
+    toc_html = (
+        "<nav id=\"toc\" class=\"mb-6 p-4 bg-primary/5 rounded-lg\"><strong>Table of contents</strong><ul class=\"ml-4 mt-2\">"
+        + "\n".join(toc_items)
+        + "</ul></nav>\n"
+    )
     # Insert TOC after first <p> or at top
-    m = re.search(r"(<p\b[^>]*>.*?</p>)", html, flags=re.I | re.S)
+    m = FIRST_P_PATTERN.search(html)
     if m:
-        return html.replace(m.group(1), m.group(1) + "\n" + toc_html, 1)
+        return html[: m.end()] + "\n" + toc_html + html[m.end() :]
     return toc_html + html
 
 
@@ -42,7 +59,7 @@ def expand_h2_sections(html: str) -> str:
         h2 = match.group(0)
         content_after = match.group(1) or ""
         # If there are already 2 paragraphs right after, skip
-        paras = re.findall(r"^\s*<p\b", content_after, flags=re.I)
+        paras = LEADING_P_PATTERN.findall(content_after)
         if len(paras) >= 2:
             return h2
         # Build extra content
@@ -54,8 +71,7 @@ def expand_h2_sections(html: str) -> str:
         return h2 + "\n" + extra
 
     # Find each H2 and ensure content expanded
-    pattern = re.compile(r"<h2\b[^>]*>.*?</h2>([\s\S]{0,400})", flags=re.I)
-    new_html = pattern.sub(repl, html)
+    new_html = H2_SECTION_PATTERN.sub(repl, html)
     return new_html
 
 
@@ -74,23 +90,29 @@ def ensure_implementation_checklist(html: str) -> str:
     return html + checklist
 
 
+def _process(f: Path) -> str:
+    """Enrich one template in place; returns the log line."""
+    txt = f.read_text(encoding="utf-8")
+    m = ARTICLE_BLOCK_PATTERN.search(txt)
+    if not m:
+        return f"Skipping {f.name}: no article block"
+    before, inner, after = txt[: m.start(2)], m.group(2), txt[m.end(2) :]
+    new_inner = inner
+    new_inner = ensure_toc(new_inner)
+    new_inner = expand_h2_sections(new_inner)
+    new_inner = ensure_implementation_checklist(new_inner)
+    new_txt = before + new_inner + after
+    f.write_text(new_txt, encoding="utf-8")
+    return f"Enriched {f.name}"
+
+
 def run():
     templates_dir = Path(__file__).resolve().parents[1] / "app" / "templates"
     files = sorted(templates_dir.glob("blog_*.html"))
-    for f in files:
-        txt = f.read_text(encoding="utf-8")
-        m = re.search(r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', txt, flags=re.I | re.S)
-        if not m:
-            print(f"Skipping {f.name}: no article block")
-            continue
-        before, inner, after = txt[: m.start(2)], m.group(2), txt[m.end(2) :]
-        new_inner = inner
-        new_inner = ensure_toc(new_inner)
-        new_inner = expand_h2_sections(new_inner)
-        new_inner = ensure_implementation_checklist(new_inner)
-        new_txt = before + new_inner + after
-        f.write_text(new_txt, encoding="utf-8")
-        print(f"Enriched {f.name}")
+    # Each template is independent: overlap the reads/writes; map keeps the log in file order
+    with ThreadPoolExecutor() as ex:
+        for msg in ex.map(_process, files):
+            print(msg)
 
 
 if __name__ == "__main__":
@@ -17,7 +17,7 @@ _root = _Path(__file__).resolve().parents[1]
 if str(_root) not in _sys.path:
     _sys.path.insert(0, str(_root))
 
-from tasks.auto_blog_from_youtube import _load_env, expand_article_with_openai, build_post_template
+from tasks.auto_blog_from_youtube import _load_env, expand_article_with_openai, write_post_template
 
 
 def run(slug: str, transcript_file: Path, overwrite: bool = True):
@@ -51,9 +51,9 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True):
         "video_id": "",
     }
 
-    template_text = build_post_template(video_id=post.get("video_id") or "", post=post, article_html=html)
     if overwrite:
-        tpl_path.write_text(template_text, encoding="utf-8")
+        with tpl_path.open("w", encoding="utf-8") as out:
+            write_post_template(out, video_id=post.get("video_id") or "", post=post, article_html=html)
         print("Wrote template:", tpl_path)
     else:
         print("[dry-run] Would write template:", tpl_path)
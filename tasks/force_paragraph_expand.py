@@ -9,9 +9,9 @@ from __future__ import annotations
 
 import argparse
 import math
-import re
 from pathlib import Path
 from pathlib import Path as _Path
+from typing import Iterator
 import sys as _sys
 
 # Ensure imports path
@@ -19,34 +19,63 @@ _root = _Path(__file__).resolve().parents[1]
 if str(_root) not in _sys.path:
     _sys.path.insert(0, str(_root))
 
-from tasks.auto_blog_from_youtube import _load_env, build_post_template
+from tasks.auto_blog_from_youtube import _iter_sentences, _load_env, write_post_template
 
 
 def sentences(text: str) -> list[str]:
-    s = re.split(r'(?<=[.!?])\s+', text.strip())
-    return [seg.strip() for seg in s if seg.strip()]
+    return [seg.strip() for seg in _iter_sentences(text.strip()) if seg.strip()]
 
 
 def build_paragraphs_from_sentences(sents: list[str], target_words: int) -> list[str]:
     paras = []
-    cur = []
+    start = 0
     cur_words = 0
-    for sent in sents:
-        w = len(re.findall(r"\w+", sent))
-        cur.append(sent)
+    # Rough word counts (spaces + 1), computed in one pass: the ~120-word paragraph target is a heuristic
+    for i, w in enumerate([s.count(" ") + 1 for s in sents], 1):
         cur_words += w
         if cur_words >= 120:  # ~120 words per paragraph
-            paras.append(" ".join(cur))
-            cur = []
+            paras.append(" ".join(sents[start:i]))
+            start = i
             cur_words = 0
-    if cur:
-        paras.append(" ".join(cur))
+    if start < len(sents):
+        paras.append(" ".join(sents[start:]))
     # trim or extend to reach approximate target_words by number of paragraphs
     if not paras:
         return [ " ".join(sents) ]
     return paras
 
 
+# Fixed tail of every expanded article, one output line per item
+CLOSING_LINES = (
+    '<section class="mt-10 p-6 bg-light-base border border-gray-200 rounded-2xl"><h3>Implementation checklist</h3><ul>',
+    "<li>Run qualitative research (surveys, recordings, interviews)</li>",
+    "<li>Segment funnels by device and channel</li>",
+    "<li>Prioritize tests using ICE or RICE</li>",
+    "<li>Optimize copy: headlines, CTAs, guarantees</li>",
+    "</ul></section>",
+    "<section class='mt-8'><h3>FAQs</h3><h4>How long will this take?</h4><p>Small wins can appear within weeks; larger programs require months.</p><h4>Do I need developer help?</h4><p>Some tests are low-effort; others need dev resources.</p></section>",
+)
+TIP_BANNER_HTML = '<div class="tip-banner"><strong>Tip:</strong> Focus research on high-intent pages for fastest wins.</div>'
+
+
+def _article_lines(sections: list[dict]) -> Iterator[str]:
+    """Lines of the article body (TOC, sections, closing blocks), fed straight into one join."""
+    yield '<nav id="toc" class="mb-6 p-4 bg-primary/5 rounded-lg"><strong>Table of contents</strong><ul class="ml-4 mt-2">'
+    for i, sec in enumerate(sections, 1):
+        yield f'<li><a href="#sec-{i}">{sec["h2"]}</a></li>'
+    yield "</ul></nav>"
+
+    for i, sec in enumerate(sections, 1):
+        yield f'<h2 id="sec-{i}">{sec["h2"]}</h2>'
+        for p in sec["paragraphs"]:
+            yield f"<p>{p}</p>"
+        # add a tip banner occasionally
+        if i % 2 == 0:
+            yield TIP_BANNER_HTML
+
+    yield from CLOSING_LINES
+
+
 def run(slug: str, transcript_file: Path, overwrite: bool = True, target_words: int = 1200):
     project_root = Path(__file__).resolve().parents[1]
     _load_env(project_root)
@@ -55,7 +84,10 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True, target_words:
     tpl_path = templates_dir / tpl_name
 
     text = transcript_file.read_text(encoding="utf-8")
+    # Metadata only needs the opening of the transcript; after splitting, the full text is not needed again
+    description = (text[:157] + "...") if len(text) > 160 else text
     sents = sentences(text)
+    del text
     if not sents:
         raise SystemExit("Transcript has no sentences.")
 
@@ -71,33 +103,13 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True, target_words:
         sections.append({"h2": f"Section {i+1}", "paragraphs": paras})
 
     # assemble HTML
-    parts = []
-    parts.append('<nav id="toc" class="mb-6 p-4 bg-primary/5 rounded-lg"><strong>Table of contents</strong><ul class="ml-4 mt-2">')
-    for i, sec in enumerate(sections, 1):
-        parts.append(f'<li><a href="#sec-{i}">{sec["h2"]}</a></li>')
-    parts.append("</ul></nav>")
-
-    for i, sec in enumerate(sections, 1):
-        parts.append(f'<h2 id="sec-{i}">{sec["h2"]}</h2>')
-        for p in sec["paragraphs"]:
-            parts.append(f"<p>{p}</p>")
-        # add a tip banner occasionally
-        if i % 2 == 0:
-            parts.append(f'<div class="tip-banner"><strong>Tip:</strong> Focus research on high-intent pages for fastest wins.</div>')
-
-    parts.append('<section class="mt-10 p-6 bg-light-base border border-gray-200 rounded-2xl"><h3>Implementation checklist</h3><ul>')
-    parts += [ "<li>Run qualitative research (surveys, recordings, interviews)</li>", "<li>Segment funnels by device and channel</li>", "<li>Prioritize tests using ICE or RICE</li>", "<li>Optimize copy: headlines, CTAs, guarantees</li>" ]
-    parts.append("</ul></section>")
-
-    parts.append("<section class='mt-8'><h3>FAQs</h3><h4>How long will this take?</h4><p>Small wins can appear within weeks; larger programs require months.</p><h4>Do I need developer help?</h4><p>Some tests are low-effort; others need dev resources.</p></section>")
-
-    article_html = "\n".join(parts)
+    article_html = "\n".join(_article_lines(sections))
 
     # Build post metadata (simple)
     post = {
         "slug": slug,
         "title": slug.replace("-", " ").title(),
-        "description": (text[:157] + "...") if len(text) > 160 else text,
+        "description": description,
         "published_date": "11 Feb 2026",
         "updated_date": "11 Feb 2026",
         "reading_time": f"{max(4, target_words//200)} min read",
@@ -106,9 +118,9 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True, target_words:
         "video_id": "",
     }
 
-    template_text = build_post_template(video_id=post.get("video_id") or "", post=post, article_html=article_html)
     if overwrite:
-        tpl_path.write_text(template_text, encoding="utf-8")
+        with tpl_path.open("w", encoding="utf-8") as out:
+            write_post_template(out, video_id=post.get("video_id") or "", post=post, article_html=article_html)
         print("Wrote template:", tpl_path)
     else:
         print("[dry-run] Would write template:", tpl_path)
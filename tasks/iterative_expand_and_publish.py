@@ -13,26 +13,39 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import os
 import re
 from pathlib import Path
 from pathlib import Path as _Path
 import sys as _sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure imports
 _root = _Path(__file__).resolve().parents[1]
 if str(_root) not in _sys.path:
     _sys.path.insert(0, str(_root))
 
-from tasks.auto_blog_from_youtube import _load_env, expand_article_with_openai, build_post_template
+from tasks.auto_blog_from_youtube import _iter_sentences, _load_env, expand_article_with_openai, write_post_template
+
+# Compiled once; the splitters run over the whole transcript and again over every chunk
+_RE_PARA_SPLIT = re.compile(r"\n{1,}|\r\n{1,}")
+_RE_P_OPEN = re.compile(r"<p\b")
+# Above this size the sentence fallback in split_transcript_into_chunks switches to fixed windows
+_SENTENCE_SPLIT_MAX_CHARS = 200_000
+_FALLBACK_WINDOW_CHARS = 4000
 
 
 def split_transcript_into_chunks(transcript: str, n_chunks: int = 5) -> list[str]:
     # split by paragraphs roughly into n_chunks
-    paras = [p.strip() for p in re.split(r"\n{1,}|\r\n{1,}", transcript) if p.strip()]
+    paras = [p.strip() for p in _RE_PARA_SPLIT.split(transcript) if p.strip()]
     if not paras:
-        # fallback: split by sentences
-        paras = re.split(r"(?<=[.!?])\s+", transcript)
+        if len(transcript) > _SENTENCE_SPLIT_MAX_CHARS:
+            # too large to split sentence by sentence: fixed-size windows keep the work linear and bounded
+            paras = [transcript[i : i + _FALLBACK_WINDOW_CHARS] for i in range(0, len(transcript), _FALLBACK_WINDOW_CHARS)]
+        else:
+            # fallback: split by sentences
+            paras = list(_iter_sentences(transcript))
     total = len(paras)
     if total == 0:
         return []
@@ -45,7 +58,7 @@ def split_transcript_into_chunks(transcript: str, n_chunks: int = 5) -> list[str
 
 def deterministic_expand_chunk(chunk: str) -> str:
     # create 2-4 paragraphs from chunk by sentence grouping
-    sents = [s.strip() for s in re.split(r"(?<=[.!?])\s+", chunk) if s.strip()]
+    sents = [s.strip() for s in _iter_sentences(chunk) if s.strip()]
     if not sents:
         return f"<p>{chunk}</p>"
     per_para = max(1, math.ceil(len(sents) / 3))
@@ -68,21 +81,24 @@ def try_expand_with_openai(title: str, chunk: str, model: str = "gpt-4.1-mini")
     return None
 
 
+# Shown after every second section
+TIP_BANNER_HTML = '<div class="tip-banner"><strong>Tip:</strong> Prioritise tests by impact and ease to keep momentum.</div>'
+
+
 def assemble_full_html(title: str, description: str, sections_html: list[str]) -> str:
     parts = []
     # hero
     parts.append(f'<div class="article-hero"><div class="kicker">CRO</div><h2>{title}</h2><p class="lead">{description}</p><div class="mt-6 flex gap-3"><a class="btn btn-primary" href="/schedule-a-call/">Hire Sparksmetrics</a><button class="btn btn-outline" data-checklist-modal>Download free ebook</button><button class="btn btn-soft" data-audit-modal>Claim free CRO audit</button></div></div>')
     # toc
     parts.append('<nav id="toc" class="mb-6 p-4 bg-primary/5 rounded-lg"><strong>Table of contents</strong><ul class="ml-4 mt-2">')
-    for i in range(len(sections_html)):
-        parts.append(f'<li><a href="#sec-{i+1}">Section {i+1}</a></li>')
+    parts.extend(f'<li><a href="#sec-{i}">Section {i}</a></li>' for i in range(1, len(sections_html) + 1))
     parts.append("</ul></nav>")
     # sections
     for i, html in enumerate(sections_html, 1):
         parts.append(f'<h2 id="sec-{i}">Section {i}</h2>')
         parts.append(html)
         if i % 2 == 0:
-            parts.append('<div class="tip-banner"><strong>Tip:</strong> Prioritise tests by impact and ease to keep momentum.</div>')
+            parts.append(TIP_BANNER_HTML)
     # checklist + faqs
     parts.append('<section class="mt-10 p-6 bg-light-base border border-gray-200 rounded-2xl"><h3>Implementation checklist</h3><ul><li>Run qualitative research (surveys/recordings/interviews)</li><li>Segment funnels by device and channel</li><li>Prioritize tests using ICE or RICE</li><li>Optimize copy: headlines, CTAs</li></ul></section>')
     parts.append("<section class='mt-8'><h3>FAQs</h3><h4>How long will this take?</h4><p>Small wins can appear in weeks; programmatic CRO requires months.</p><h4>Do I need developer help?</h4><p>Some tests are low-effort; large changes need dev resources.</p></section>")
@@ -97,12 +113,18 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True):
     description = "Practical CRO research, prioritization, copy and testing guidance from a 90+ ecommerce study."
 
     chunks = split_transcript_into_chunks(transcript, n_chunks=5)
+    # Without a key every OpenAI attempt fails after its retry sleeps: go straight to the deterministic sections
+    has_key = bool(os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY"))
+    # Each expansion is a blocking API round trip; request all chunks at once (map keeps section order)
+    expanded: list[str | None] = [None] * len(chunks)
+    if chunks and has_key:
+        with ThreadPoolExecutor(max_workers=min(5, len(chunks))) as ex:
+            expanded = list(ex.map(lambda c: try_expand_with_openai(title=title, chunk=c), chunks))
     sections_html = []
-    for chunk in chunks:
-        html = try_expand_with_openai(title=title, chunk=chunk)
+    for chunk, html in zip(chunks, expanded):
         if html:
             # ensure paragraphs wrap
-            if not re.search(r"<p\b", html):
+            if not _RE_P_OPEN.search(html):
                 html = "<p>" + html.replace("\n", " ") + "</p>"
             sections_html.append(html)
         else:
@@ -122,10 +144,10 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True):
         "video_id": "",
     }
 
-    template_text = build_post_template(video_id=post["video_id"], post=post, article_html=full_html)
     tpl_path = project_root / "app" / "templates" / post["template"]
     if overwrite:
-        tpl_path.write_text(template_text, encoding="utf-8")
+        with tpl_path.open("w", encoding="utf-8") as out:
+            write_post_template(out, video_id=post["video_id"], post=post, article_html=full_html)
         print("Wrote template:", tpl_path)
     else:
         print("[dry-run] Would write template:", tpl_path)
@@ -3,7 +3,7 @@ Expand a single existing blog article to at least 1000 words using the OpenAI Re
 
 Requirements:
 - Set OPENAI_API_KEY or OPEN_AI_KEY in .env
-- This script uses urllib so it doesn't need 'requests'.
+- Uses a pooled 'requests' session when installed (keep-alive across calls); falls back to urllib otherwise.
 
 Usage:
   ./.venv/bin/python tasks/llm_expand_article.py --slug cro-audit-that-finds-real-leaks --dry-run
@@ -12,34 +12,58 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
 import os
 import re
 import ssl
+import sys
 import urllib.request
 from pathlib import Path
 from typing import Optional
 
-
-def load_env(root: Path) -> None:
-    env = root / ".env"
-    if not env.exists():
-        return
-    try:
-        from dotenv import load_dotenv  # type: ignore
-
-        load_dotenv(env)
-    except Exception:
-        for line in env.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            k, _, v = line.partition("=")
-            os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
+# Ensure package import works when running as script
+_root = Path(__file__).resolve().parents[1]
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
+from tasks.auto_blog_from_youtube import _load_env
+
+try:
+    import requests  # type: ignore
+except Exception:
+    requests = None
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+# Response decoding (orjson when installed; both accept str or bytes)
+_json_loads = orjson.loads if orjson is not None else json.loads
+try:
+    # Optional RE2 engine (google-re2) for the article-block search; inline flags keep the pattern valid for both
+    import re2  # type: ignore
+except Exception:
+    re2 = re
+
+# The <article class="blog-prose"> block of a post template; group 2 is the article body
+ARTICLE_BLOCK_PATTERN = re2.compile(r'(?is)(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)')
+H1_PATTERN = re.compile(r"<h1[^>]*>(.*?)</h1>", flags=re.I | re.S)
+
+# One keep-alive session for every call (no new TCP/TLS handshake per request); created on first use
+_SESSION = None
+# TLS context for the urllib fallback, built once
+_SSL_CTX = ssl.create_default_context()
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None and requests is not None:
+        _SESSION = requests.Session()
+    return _SESSION
 
 
 def extract_article_block(template_text: str) -> tuple[str, int, int]:
-    m = re.search(r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', template_text, flags=re.I | re.S)
+    m = ARTICLE_BLOCK_PATTERN.search(template_text)
     if not m:
         raise RuntimeError("No blog article block found")
     return m.group(2), m.start(2), m.end(2)
@@ -77,10 +101,19 @@ def call_openai(prompt: str, model: str, api_key: str, timeout: int = 120) -> di
         "text": {"format": {"type": "json_object"}},
     }
     data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}, method="POST")
-    ctx = ssl.create_default_context()
-    with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-        return json.load(resp)
+    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
+    session = _get_session()
+    if session is not None:
+        # requests negotiates and decodes gzip itself
+        resp = session.post(url, data=data, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+    req = urllib.request.Request(url, data=data, headers={**headers, "Accept-Encoding": "gzip"}, method="POST")
+    with urllib.request.urlopen(req, timeout=timeout, context=_SSL_CTX) as resp:
+        body = resp.read()
+        if resp.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+    return _json_loads(body)
 
 
 def parse_response(resp: dict) -> Optional[dict]:
@@ -89,7 +122,7 @@ def parse_response(resp: dict) -> Optional[dict]:
         return None
     if "output_text" in resp and resp["output_text"]:
         try:
-            return json.loads(resp["output_text"])
+            return _json_loads(resp["output_text"])
         except Exception:
             return {"title": None, "description": None, "html": resp["output_text"]}
     out = resp.get("output") or resp.get("choices") or []
@@ -111,7 +144,7 @@ def parse_response(resp: dict) -> Optional[dict]:
     if not joined:
         return None
     try:
-        return json.loads(joined)
+        return _json_loads(joined)
     except Exception:
         return {"title": None, "description": None, "html": joined}
 
@@ -124,7 +157,7 @@ def main():
     args = parser.parse_args()
 
     project_root = Path(__file__).resolve().parents[1]
-    load_env(project_root)
+    _load_env(project_root)
     api_key = os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY")
     if not api_key:
         raise SystemExit("OPENAI_API_KEY or OPEN_AI_KEY not set in .env")
@@ -138,7 +171,7 @@ def main():
         raise SystemExit(f"Template not found: {tpl}")
     txt = tpl.read_text(encoding="utf-8")
     inner, s, e = extract_article_block(txt)
-    title_m = re.search(r"<h1[^>]*>(.*?)</h1>", txt, flags=re.I | re.S)
+    title_m = H1_PATTERN.search(txt)
     title = title_m.group(1).strip() if title_m else args.slug
     prompt = build_prompt(title, inner)
     resp = call_openai(prompt, args.model, api_key)
@@ -148,12 +181,13 @@ def main():
     new_html = parsed["html"]
     # Ensure description
     description = parsed.get("description") or (inner.strip()[:157] + "...")
-    new_txt = txt[:s] + "\n" + new_html.strip() + "\n" + txt[e:]
     # Replace meta description block if present: look for block/meta in head — skip to be safe
     if args.dry_run:
         print(f"[dry-run] would overwrite {tpl}")
     else:
-        tpl.write_text(new_txt, encoding="utf-8")
+        # Write head, new body and tail straight to the file instead of concatenating a full copy first
+        with tpl.open("w", encoding="utf-8") as out:
+            out.writelines((txt[:s], "\n", new_html.strip(), "\n", txt[e:]))
         print(f"Wrote {tpl}")
 
 
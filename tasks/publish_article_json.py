@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 from pathlib import Path
 
 from pathlib import Path as _Path
@@ -23,9 +24,42 @@ from tasks.auto_blog_from_youtube import (
     _load_env,
     expand_article_to_json_spec,
     render_article_from_spec,
-    build_post_template,
+    write_post_template,
 )
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+try:
+    # Linear-time engine for the whole-file .*? scans (optional; same patterns and match API as re)
+    import re2  # type: ignore
+except Exception:
+    re2 = re
+
+# The <article class="blog-prose"> block of a post template; group 2 is the article body
+ARTICLE_BLOCK_PATTERN = re2.compile(r'(?is)(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)')
+# JSON-LD first, then any other script left in the extracted body
+LDJSON_SCRIPT_PATTERN = re2.compile(r'(?is)<script[^>]*type=["\']application/ld\+json["\'][^>]*>.*?</script>')
+SCRIPT_PATTERN = re2.compile(r'(?is)<script[^>]*>.*?</script>')
+# YouTube titles by video ID: a video's title is looked up through oEmbed once, then read from here
+OEMBED_CACHE_PATH = Path(__file__).resolve().parents[1] / ".cache" / "oembed_titles.json"
+
+
+def load_oembed_cache(cache_path: Path = OEMBED_CACHE_PATH) -> dict[str, str]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_oembed_cache(cache: dict[str, str], cache_path: Path = OEMBED_CACHE_PATH) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(cache_path)
+
 
 def run(slug: str, dry_run: bool = False):
     project_root = Path(__file__).resolve().parents[1]
@@ -44,14 +78,13 @@ def run(slug: str, dry_run: bool = False):
 
     txt = tpl.read_text(encoding="utf-8")
     # extract inner article
-    import re
-    m = re.search(r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', txt, flags=re.I | re.S)
+    m = ARTICLE_BLOCK_PATTERN.search(txt)
     if not m:
         raise SystemExit("No article block found")
     inner = m.group(2)
     # remove any JSON-LD script blocks or other scripts from the extracted inner HTML
-    inner = re.sub(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>.*?</script>', '', inner, flags=re.I | re.S)
-    inner = re.sub(r'<script[^>]*>.*?</script>', '', inner, flags=re.I | re.S)
+    inner = LDJSON_SCRIPT_PATTERN.sub("", inner)
+    inner = SCRIPT_PATTERN.sub("", inner)
 
     # load post metadata if present (needed to derive better title)
     posts = []
@@ -71,18 +104,25 @@ def run(slug: str, dry_run: bool = False):
     post_title = post_meta.get("title") or ""
     # if title is missing or looks like an id, try YouTube oEmbed to get the real title
     if _is_video_id_like(post_title) and post_meta.get("video_id"):
-        try:
-            import urllib.request as _ur
-            import json as _json
-
-            vid = post_meta.get("video_id")
-            oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={vid}&format=json"
-            with _ur.urlopen(_ur.Request(oembed_url, headers={"User-Agent": "SparksmetricsBot/1.0"}), timeout=10) as resp:
-                data = _json.load(resp)
-                post_title = data.get("title") or post_title
-        except Exception:
-            # ignore failures and keep existing title
-            pass
+        vid = post_meta.get("video_id")
+        oembed_cache = load_oembed_cache()
+        if oembed_cache.get(vid):
+            post_title = oembed_cache[vid]
+        else:
+            try:
+                import urllib.request as _ur
+
+                oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={vid}&format=json"
+                with _ur.urlopen(_ur.Request(oembed_url, headers={"User-Agent": "SparksmetricsBot/1.0"}), timeout=10) as resp:
+                    data = json.load(resp)
+                if data.get("title"):
+                    post_title = data["title"]
+                    if not dry_run:
+                        oembed_cache[vid] = post_title
+                        save_oembed_cache(oembed_cache)
+            except Exception:
+                # ignore failures and keep existing title
+                pass
 
     # (post_meta is now available)
 
@@ -95,7 +135,7 @@ def run(slug: str, dry_run: bool = False):
         existing_for_spec = ""
 
     try:
-        spec = expand_article_to_json_spec(title=post_title or slug.replace("-", " ").title(), transcript=post_meta.get("transcript", "") or "", existing_html=existing_for_spec)
+        spec = expand_article_to_json_spec(title=post_title or slug.replace("-", " ").title(), transcript=post_meta.get("transcript", "") or "", existing_html=existing_for_spec, dry_run=dry_run)
         rendered = render_article_from_spec(spec)
     except Exception as e:
         # If structured spec generation failed, use deterministic rich spec generator
@@ -110,7 +150,10 @@ def run(slug: str, dry_run: bool = False):
     # Show preview of the generated spec (JSON) before rendering/writing
     print("=== Generated JSON spec preview ===")
     try:
-        print(json.dumps(spec, indent=2, ensure_ascii=False))
+        if orjson is not None:
+            print(orjson.dumps(spec, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        else:
+            print(json.dumps(spec, indent=2, ensure_ascii=False))
     except Exception:
         print(str(spec))
     print("=== End spec preview ===")
@@ -128,12 +171,12 @@ def run(slug: str, dry_run: bool = False):
         "video_id": post_meta.get("video_id") or "",
     }
 
-    # Build full template and write
-    template_text = build_post_template(video_id=post.get("video_id") or "", post=post, article_html=rendered)
+    # Build full template and write (streamed into the file; a dry run doesn't build it at all)
     if dry_run:
         print("[dry-run] Would overwrite template:", tpl)
     else:
-        tpl.write_text(template_text, encoding="utf-8")
+        with tpl.open("w", encoding="utf-8") as out:
+            write_post_template(out, video_id=post.get("video_id") or "", post=post, article_html=rendered)
         print("Wrote template:", tpl)
 
 
@@ -10,93 +10,116 @@ This will:
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    # google-re2 when installed: the article-block scan runs in linear time on every template
+    import re2  # type: ignore
+except Exception:
+    re2 = re
+
+# Compiled once for the run; clean_text runs on every heading and paragraph of every template
+TAG_PATTERN = re.compile(r"<[^>]+>")
+WS_PATTERN = re.compile(r"\s+")
+H2_PATTERN = re.compile(r"<h2\b[^>]*>.*?</h2>", flags=re.I | re.S)
+FIRST_P_PATTERN = re.compile(r"<p\b[^>]*>(.*?)</p>", flags=re.I | re.S)
+ARTICLE_BLOCK_PATTERN = re2.compile(r'(?is)(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)')
+
 
 def clean_text(s: str) -> str:
-    s = re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", s)).strip()
-    return s
+    return WS_PATTERN.sub(" ", TAG_PATTERN.sub(" ", s)).strip()
 
 
 def extract_headings_and_paras(inner: str):
-    # Find all h2 and capture following up to next h2
-    parts = re.split(r"(<h2\b[^>]*>.*?</h2>)", inner, flags=re.I | re.S)
+    # Each section runs from the end of its h2 to the start of the next one (or the end of the article)
+    h2s = list(H2_PATTERN.finditer(inner))
+    ends = [m.start() for m in h2s[1:]]
+    ends.append(len(inner))
     headings = []
-    # parts alternates: before, h2, content, h2, content...
-    it = iter(parts)
-    pre = next(it, "")
-    for chunk in it:
-        h2 = chunk
-        content = next(it, "")
+    for m, end in zip(h2s, ends):
         # extract plain text h2
-        h2_text = re.sub(r"<[^>]+>", "", h2).strip()
-        # find first paragraph in content
-        m = re.search(r"<p\b[^>]*>(.*?)</p>", content, flags=re.I | re.S)
-        para = clean_text(m.group(1)) if m else ""
+        h2_text = TAG_PATTERN.sub("", m.group(0)).strip()
+        # find first paragraph in the section (pos/endpos bound the search without slicing the content out)
+        p = FIRST_P_PATTERN.search(inner, m.end(), end)
+        para = clean_text(p.group(1)) if p else ""
         headings.append((h2_text, para))
     return headings
 
 
+# Standard why/how/checklist block rendered after every section
+SECTION_BLOCK = (
+    '<div class="callout"><p class="callout-title">Why this matters</p>'
+    "<p>Brief explanation of the importance and impact for ecommerce teams.</p>"
+    "<p>How to check: run quick tests and check segmentation (mobile vs desktop) and session recordings.</p>"
+    "<ul><li>Quick test 1: reproduce the funnel step and log the dropoff.</li>"
+    "<li>Quick test 2: add a short survey to capture user hesitation.</li>"
+    "<li>Quick test 3: run a small A/B experiment for the proposed fix.</li></ul></div>\n"
+)
+
+
 def build_inner_from_sections(sections):
+    # Collect the pieces and join once at the end (repeated += on a growing str copies it every time)
+    parts = []
     # schema and byline
-    inner = '<script type="application/ld+json">{"@context":"https://schema.org","@type":"Article","headline":"{{ post.title }}","author":{"@type":"Person","name":"Sparksmetrics"}}</script>\n'
-    inner += '<p class="byline">By Sparksmetrics — CRO &amp; Analytics</p>\n'
+    parts.append('<script type="application/ld+json">{"@context":"https://schema.org","@type":"Article","headline":"{{ post.title }}","author":{"@type":"Person","name":"Sparksmetrics"}}</script>\n')
+    parts.append('<p class="byline">By Sparksmetrics — CRO &amp; Analytics</p>\n')
     # TOC
-    inner += '<nav id="toc" class="mb-6 p-4 bg-primary/5 rounded-lg"><strong>Table of contents</strong><ul class="ml-4 mt-2">\n'
+    parts.append('<nav id="toc" class="mb-6 p-4 bg-primary/5 rounded-lg"><strong>Table of contents</strong><ul class="ml-4 mt-2">\n')
     for i, (h, _) in enumerate(sections, 1):
         safe = h or f"Section {i}"
-        inner += f'<li><a href="#toc-{i}">{safe}</a></li>\n'
-    inner += "</ul></nav>\n\n"
+        parts.append(f'<li><a href="#toc-{i}">{safe}</a></li>\n')
+    parts.append("</ul></nav>\n\n")
 
     # sections
     for i, (h, p) in enumerate(sections, 1):
         safe_h = h or f"Section {i}"
-        inner += f'<h2>{safe_h}<span id="toc-{i}"></span></h2>\n'
+        parts.append(f'<h2>{safe_h}<span id="toc-{i}"></span></h2>\n')
         if p:
-            inner += f"<p>{p}</p>\n"
+            parts.append(f"<p>{p}</p>\n")
         else:
-            inner += "<p>Summary: key takeaway and what to check.</p>\n"
+            parts.append("<p>Summary: key takeaway and what to check.</p>\n")
         # standardized block
-        block = (
-            '<div class="callout"><p class="callout-title">Why this matters</p>'
-            "<p>Brief explanation of the importance and impact for ecommerce teams.</p>"
-            "<p>How to check: run quick tests and check segmentation (mobile vs desktop) and session recordings.</p>"
-            "<ul><li>Quick test 1: reproduce the funnel step and log the dropoff.</li>"
-            "<li>Quick test 2: add a short survey to capture user hesitation.</li>"
-            "<li>Quick test 3: run a small A/B experiment for the proposed fix.</li></ul></div>\n"
-        )
-        inner += block
+        parts.append(SECTION_BLOCK)
     # final CTA + checklist
-    inner += (
+    parts.append(
         '<hr /><div class="callout"><p class="callout-title">Want us to run the audit?</p>'
         '<p>We’ll audit your funnel, implement fixes, and turn the findings into a prioritized test plan. '
         '<a href="{{ url_for(\'main.schedule_a_call\') }}">Book a call</a>.</p></div>\n'
     )
-    inner += '<section class="mt-10 p-6 bg-light-base border border-gray-200 rounded-2xl"><h3>Implementation checklist</h3><ul>'
-    inner += "<li>Run qualitative research: surveys & recordings</li>"
-    inner += "<li>Validate tracking & events</li>"
-    inner += "<li>Prioritize using an objective framework</li>"
-    inner += "<li>Run tests and record results</li></ul></section>\n"
-    return inner
+    parts.append(
+        '<section class="mt-10 p-6 bg-light-base border border-gray-200 rounded-2xl"><h3>Implementation checklist</h3><ul>'
+        "<li>Run qualitative research: surveys & recordings</li>"
+        "<li>Validate tracking & events</li>"
+        "<li>Prioritize using an objective framework</li>"
+        "<li>Run tests and record results</li></ul></section>\n"
+    )
+    return "".join(parts)
+
+
+def _process(f: Path) -> str:
+    """Rebuild one template in place; returns the log line."""
+    txt = f.read_text(encoding="utf-8")
+    m = ARTICLE_BLOCK_PATTERN.search(txt)
+    if not m:
+        return f"Skipping {f.name}: no article block"
+    before, inner, after = txt[: m.start(2)], m.group(2), txt[m.end(2) :]
+    sections = extract_headings_and_paras(inner)
+    if not sections:
+        return f"Skipping {f.name}: no H2 headings found"
+    new_inner = build_inner_from_sections(sections)
+    new_txt = before + new_inner + after
+    f.write_text(new_txt, encoding="utf-8")
+    return f"Rebuilt {f.name}"
 
 
 def run():
     templates_dir = Path(__file__).resolve().parents[1] / "app" / "templates"
-    for f in sorted(templates_dir.glob("blog_*.html")):
-        txt = f.read_text(encoding="utf-8")
-        m = re.search(r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', txt, flags=re.I | re.S)
-        if not m:
-            print(f"Skipping {f.name}: no article block")
-            continue
-        before, inner, after = txt[: m.start(2)], m.group(2), txt[m.end(2) :]
-        sections = extract_headings_and_paras(inner)
-        if not sections:
-            print(f"Skipping {f.name}: no H2 headings found")
-            continue
-        new_inner = build_inner_from_sections(sections)
-        new_txt = before + new_inner + after
-        f.write_text(new_txt, encoding="utf-8")
-        print(f"Rebuilt {f.name}")
+    files = sorted(templates_dir.glob("blog_*.html"))
+    # Each template is independent: overlap the reads/writes; map keeps the log in file order
+    with ThreadPoolExecutor() as ex:
+        for msg in ex.map(_process, files):
+            print(msg)
 
 
 if __name__ == "__main__":
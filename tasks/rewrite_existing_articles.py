@@ -16,14 +16,56 @@ This script:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import os
 import re
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple
 
 import time
 
+# Ensure package import works when running as script
+_root = Path(__file__).resolve().parents[1]
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
+from tasks.auto_blog_from_youtube import _retry
+
+try:
+    import requests  # type: ignore
+except Exception:
+    requests = None
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+# Response and cache decoding (orjson when installed; both accept str or bytes)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Patterns for score_article, the fallback rewrite and template parsing, compiled once at import
+_RE_WS = re.compile(r"\s+")
+_RE_TAGS = re.compile(r"<[^>]+>")
+_RE_WORD = re.compile(r"\w+")
+_RE_INTERNAL_HREF = re.compile(r'href=["\'](/[^"\']+)["\']')
+_RE_EXTERNAL_HREF = re.compile(r'href=["\']https?://([^"\']+)["\']')
+_RE_P_CLOSE = re.compile(r"</p>", re.I)
+_RE_IMG_ALT = re.compile(r'\balt=["\'].*?["\']', re.I)
+_RE_ARTICLE_OPEN = re.compile(r'<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>', re.I)
+_RE_ARTICLE_BLOCK = re.compile(r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', re.I | re.S)
+_RE_H1 = re.compile(r"<h1[^>]*>(.*?)</h1>", re.I | re.S)
+_RE_H1_PARTS = re.compile(r"(<h1[^>]*>)(.*?)(</h1>)", re.I | re.S)
+# Word count at which score_article awards the full 15 word-count points
+_WORDS_FOR_FULL_POINTS = 700
+# Generic AI phrasing penalized by score_article. "as an ai language model" is left out: "as an ai" already covers it.
+# Checked as plain substrings of the lowercased HTML; for a handful of phrases that beats a multi-pattern automaton.
+_AI_PHRASES = ("as an ai", "in this article we will", "in this post i")
+
 
 def _load_env(project_root: Path) -> None:
     env_path = project_root / ".env"
@@ -40,9 +82,46 @@ def _load_env(project_root: Path) -> None:
 def score_article(html: str, title: str, description: str, threshold_keyword: str | None = None) -> Tuple[int, dict]:
     breakdown: dict[str, int] = {}
     total = 0
-
-    words = len(re.findall(r"\w+", re.sub(r"<[^>]+>", " ", html)))
-    wc_pts = min(15, int(15 * min(1.0, words / 700)))
+    # Literal markers (schema type, TOC heading, trust words, AI phrases) are substring checks on one lowercased copy
+    html_lower = html.lower()
+
+    # One walk over the tags: the text between them feeds the word count, the tags themselves the structure checks.
+    # (An lxml tree is no faster here, parse included, and would normalize the markup the checks are meant to see.)
+    words = h2_count = img_count = img_alt_count = 0
+    first_p_end = -1
+    has_internal = has_external = toc_markup = False
+    pos = 0
+    for m in _RE_TAGS.finditer(html):
+        start = m.start()
+        # Past 700 words the word-count points are maxed out: stop counting, keep walking for the other checks
+        if start > pos and words < _WORDS_FOR_FULL_POINTS:
+            words += len(_RE_WORD.findall(html, pos, start))
+        pos = m.end()
+        raw = m.group(0)
+        tag = raw.lower()
+        name = tag[1:].split(None, 1)[0].rstrip(">/")
+        if name == "h2":
+            h2_count += 1
+        elif name == "p":
+            if first_p_end < 0:
+                first_p_end = pos
+        elif name == "img":
+            img_count += 1
+            if _RE_IMG_ALT.search(tag):
+                img_alt_count += 1
+        elif tag.startswith("<nav") and tag.find("toc", 5) >= 0:
+            toc_markup = True
+        if "href=" in tag:
+            if not has_internal and _RE_INTERNAL_HREF.search(raw):
+                has_internal = True
+            if not has_external:
+                has_external = any("sparksmetrics" not in u.lower() for u in _RE_EXTERNAL_HREF.findall(raw))
+        if not toc_markup and ('id="toc"' in tag or "id='toc'" in tag):
+            toc_markup = True
+    if words < _WORDS_FOR_FULL_POINTS:
+        words += len(_RE_WORD.findall(html, pos))
+
+    wc_pts = min(15, int(15 * min(1.0, words / _WORDS_FOR_FULL_POINTS)))
     breakdown["word_count"] = wc_pts
     total += wc_pts
 
@@ -56,16 +135,16 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     breakdown["meta_description"] = meta_pts
     total += meta_pts
 
-    h2_count = len(re.findall(r"<h2\b", html, flags=re.I))
     h2_pts = 10 if h2_count >= 3 else (5 if h2_count == 2 else 0)
     breakdown["h2_count"] = h2_pts
     total += h2_pts
 
     kw = (threshold_keyword or "").strip().lower()
     first_para = ""
-    m = re.search(r"<p\b[^>]*>(.*?)</p>", html, flags=re.I | re.S)
-    if m:
-        first_para = re.sub(r"<[^>]+>", "", m.group(1) or "").strip().lower()
+    if first_p_end >= 0:
+        close = _RE_P_CLOSE.search(html, first_p_end)
+        if close:
+            first_para = _RE_TAGS.sub("", html[first_p_end : close.start()]).strip().lower()
     title_has = kw and kw in (title or "").lower()
     para_has = kw and kw in first_para
     kw_pts = 0
@@ -79,44 +158,39 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     breakdown["keyword_presence"] = kw_pts
     total += kw_pts
 
-    internal_links = re.findall(r'href=["\'](/[^"\']+)["\']', html)
-    int_pts = 10 if len(internal_links) >= 1 else 0
+    int_pts = 10 if has_internal else 0
     breakdown["internal_links"] = int_pts
     total += int_pts
 
-    external_links = re.findall(r'href=["\']https?://([^"\']+)["\']', html)
-    external_filtered = [u for u in external_links if "sparksmetrics" not in u.lower()]
-    ext_pts = 5 if len(external_filtered) >= 1 else 0
+    ext_pts = 5 if has_external else 0
     breakdown["external_links"] = ext_pts
     total += ext_pts
 
-    img_tags = re.findall(r"<img\b[^>]*>", html, flags=re.I)
-    img_with_alt = [t for t in img_tags if re.search(r'\balt=["\'].*?["\']', t, flags=re.I)]
     img_pts = 0
-    if img_tags:
-        img_pts = 5 if len(img_with_alt) == len(img_tags) else 2
+    if img_count:
+        img_pts = 5 if img_alt_count == img_count else 2
     breakdown["images_alt"] = img_pts
     total += img_pts
 
-    toc = 5 if re.search(r"(Table of contents|<nav[^>]+toc|id=[\"']toc[\"'])", html, flags=re.I) else 0
+    toc = 5 if toc_markup or "table of contents" in html_lower else 0
     breakdown["toc"] = toc
     total += toc
 
-    ai_phrases = ["as an ai", "as an ai language model", "in this article we will", "in this post i"]
-    ai_found = any(p in html.lower() for p in ai_phrases)
+    ai_found = any(p in html_lower for p in _AI_PHRASES)
     ai_pts = 0 if ai_found else 5
     breakdown["ai_phrases"] = ai_pts
     total += ai_pts
 
-    schema_pts = 5 if re.search(r"application/ld\+json", html, flags=re.I) else 0
+    schema_pts = 5 if "application/ld+json" in html_lower else 0
     breakdown["schema"] = schema_pts
     total += schema_pts
 
     breakdown["mobile"] = 5
     total += 5
 
-    author_found = bool(re.search(r'author|byline|class=["\']author', html, flags=re.I))
-    references_found = bool(re.search(r"references|sources|cite", html, flags=re.I))
+    # "class=author" implies "author", so two substring checks cover the author/byline pattern
+    author_found = "author" in html_lower or "byline" in html_lower
+    references_found = "references" in html_lower or "sources" in html_lower or "cite" in html_lower
     trust_pts = 10 if author_found and references_found else (5 if author_found or references_found else 0)
     breakdown["trust_signals"] = trust_pts
     total += trust_pts
@@ -125,28 +199,186 @@ def score_article(html: str, title: str, description: str, threshold_keyword: st
     return score, breakdown
 
 
-def _call_openai_rewrite(title: str, existing_html: str) -> dict:
-    """Call OpenAI Responses API to rewrite article following the SEO checklist.
-    Returns dict with keys: title, description, html
+# Articles sent per Responses call by run(); the checklist/system prompt is paid once per batch instead of per file
+REWRITE_BATCH_SIZE = 5
+# Concurrent Responses calls (one batch each); the requests are I/O-bound, so threads overlap the waits
+REWRITE_WORKERS = 4
+# Per-article budgets for one Responses call; a batch of n articles gets n times each (seconds / output tokens)
+REWRITE_TIMEOUT = 60
+REWRITE_MAX_OUTPUT_TOKENS = 8000
+# Rewrites returned by the model, keyed by a hash of model + system prompt + article (unchanged templates skip the API on re-runs)
+REWRITE_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "rewrites"
+
+# Per template: sha256 of the article block written by the last accepted rewrite, and its score
+REWRITE_STATE_PATH = Path(__file__).resolve().parents[1] / ".cache" / "rewrite_state.json"
+
+# Shared requests.Session for the Responses calls (see _get_session)
+_SESSION = None
+# Input tokens sent this run, and how many of them the API served from its prompt cache (reported by run())
+_USAGE = {"input": 0, "cached": 0}
+_USAGE_LOCK = threading.Lock()
+
+# Identical for every Responses call (single article or batch), so the API's automatic prompt caching can reuse it:
+# nothing per-article goes in here. The rubric mirrors score_article.
+_REWRITE_SYSTEM = (
+    "You are an expert SEO editor. Rewrite the provided HTML article to follow this checklist:\n"
+    "- Target one primary keyword (use the one in the current title)\n"
+    "- Satisfy dominant intent and cover the topic thoroughly\n"
+    "- Clear H1, H2/H3 structure, short paragraphs, bullets where helpful\n"
+    "- Title tag optimized for CTR, meta description <=160 chars\n"
+    "- Include at least one internal link to /schedule-a-call/ and one external authoritative link\n"
+    "- Ensure images have alt text (if images present) and add a small author byline\n"
+    "- Add schema.org Article JSON-LD at the top if appropriate\n"
+    "\n"
+    "Each rewrite is scored automatically out of 100 and only published above a threshold:\n"
+    "- 700+ words of body text (15 points)\n"
+    "- Title of 40-70 characters (10)\n"
+    "- Meta description of 120-160 characters (10)\n"
+    "- At least three <h2> sections (10)\n"
+    "- The primary keyword in both the title and the first paragraph (10)\n"
+    "- At least one internal link, i.e. an href starting with / (10)\n"
+    "- At least one external link to another domain (5)\n"
+    "- An alt attribute on every <img> (5)\n"
+    "- A table of contents: <nav id=\"toc\"> or a \"Table of contents\" heading (5)\n"
+    "- No generic AI phrasing such as \"as an AI\", \"in this article we will\" or \"in this post I\" (5)\n"
+    "- Article JSON-LD in a <script type=\"application/ld+json\"> (5)\n"
+    "- An author byline and a references/sources section (10)\n"
+    "\n"
+    "Output strictly as JSON. html is always an HTML fragment suitable for insertion inside <article class=\"blog-prose\">.\n"
+    "- One article: an object with keys title, description, html.\n"
+    '- Several articles, each marked "=== Article id: ... ===": rewrite every one of them independently and return '
+    '{"results": [{"id", "title", "description", "html"}, ...]} with one entry per article id.\n'
+)
+
+
+def _text_prefix(html: str, limit: int) -> str:
+    """First limit chars of html's text (tags as spaces, whitespace collapsed, stripped).
+
+    Stops at the first tag after limit non-space chars have been seen, instead of stripping the whole document;
+    everything after that point cannot change the first limit chars.
+    """
+    parts = []
+    seen = 0
+    pos = 0
+    for m in _RE_TAGS.finditer(html):
+        seg = html[pos : m.start()]
+        parts.append(seg)
+        parts.append(" ")
+        seen += sum(map(len, seg.split()))
+        pos = m.end()
+        if seen >= limit:
+            break
+    else:
+        parts.append(html[pos:])
+    return _RE_WS.sub(" ", "".join(parts)).strip()[:limit]
+
+
+def _fallback_rewrite(title: str, existing_html: str) -> dict:
+    """Naive rewrite (no external API). Try to improve structure slightly."""
+    desc = _text_prefix(existing_html, 157)
+    if len(desc) > 150:
+        desc = desc[:157] + "..."
+    # Ensure an author byline and internal CTA exist
+    author = '<p class="byline">By Sparksmetrics — CRO & Analytics</p>'
+    if "<p class=\"byline\">" not in existing_html:
+        new_html = author + "\n" + existing_html
+    else:
+        new_html = existing_html
+    # add internal CTA at the end if missing
+    if "/schedule-a-call/" not in new_html:
+        new_html = new_html + '\n<div class="callout"><p class="callout-title">Want help?</p><a class="btn btn-primary" href="/schedule-a-call/">Hire Sparksmetrics</a></div>'
+    # Add simple JSON-LD Article schema
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": title,
+        "author": {"@type": "Person", "name": "Sparksmetrics"},
+    }
+    schema_html = f'<script type="application/ld+json">{json.dumps(schema)}</script>\n'
+    final_html = schema_html + new_html
+    return {"title": title, "description": desc, "html": final_html}
+
+
+def _get_session():
+    """Keep-alive session shared by the worker threads (one TCP/TLS handshake per pooled connection, not per
+    request); created on first use, with a connection pool large enough for --workers."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_config() -> tuple[str, str, str, dict[str, str]]:
+    """(API key, Responses URL, model, request headers), read from the environment once instead of on every call.
+
+    run() clears it after loading .env. The key is "" when unset; callers raise.
     """
     api_key = (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY") or "").strip()
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY or OPEN_AI_KEY not set in env.")
     base = (os.environ.get("OPENAI_BASE_URL") or "https://api.openai.com/v1").rstrip("/")
     model = (os.environ.get("OPENAI_MODEL") or "gpt-4.1-mini").strip()
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    return api_key, f"{base}/responses", model, headers
+
 
-    system = (
-        "You are an expert SEO editor. Rewrite the provided HTML article to follow this checklist:\n"
-        "- Target one primary keyword (use the one in the current title)\n"
-        "- Satisfy dominant intent and cover the topic thoroughly\n"
-        "- Clear H1, H2/H3 structure, short paragraphs, bullets where helpful\n"
-        "- Title tag optimized for CTR, meta description <=160 chars\n"
-        "- Include at least one internal link to /schedule-a-call/ and one external authoritative link\n"
-        "- Ensure images have alt text (if images present) and add a small author byline\n"
-        "- Add schema.org Article JSON-LD at the top if appropriate\n        "
-        "Output strictly as JSON with keys: title, description, html (html is an HTML fragment suitable for insertion inside <article class=\"blog-prose\">).</n"
+def _responses_output_text(
+    system: str, prompt: str, timeout: int = REWRITE_TIMEOUT, max_output_tokens: int | None = None
+) -> str:
+    """POST one system+user exchange to the Responses API (JSON output mode) and return its output_text."""
+    api_key, url, model, headers = _openai_config()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY or OPEN_AI_KEY not set in env.")
+    payload = {
+        "model": model,
+        "input": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt},
+        ],
+        "text": {"format": {"type": "json_object"}},
+    }
+    if max_output_tokens:
+        payload["max_output_tokens"] = max_output_tokens
+    resp = _get_session().post(url, headers=headers, json=payload, timeout=timeout)
+    resp.raise_for_status()
+    # Decode the raw body directly (resp.json() decodes to str first)
+    data = _json_loads(resp.content)
+    usage = data.get("usage") or {}
+    with _USAGE_LOCK:
+        _USAGE["input"] += usage.get("input_tokens") or 0
+        _USAGE["cached"] += (usage.get("input_tokens_details") or {}).get("cached_tokens") or 0
+    return (data.get("output_text") or "").strip()
+
+
+def _is_rewrite(obj) -> bool:
+    """True when a parsed reply has the shape the prompt asks for: a non-empty html string, string title/description."""
+    return (
+        isinstance(obj, dict)
+        and isinstance(obj.get("html"), str)
+        and bool(obj["html"].strip())
+        and isinstance(obj.get("title", ""), str)
+        and isinstance(obj.get("description", ""), str)
     )
 
+
+def _call_openai_rewrite(title: str, existing_html: str) -> dict:
+    """Call OpenAI Responses API to rewrite article following the SEO checklist.
+    Returns dict with keys: title, description, html
+    """
+    return _rewrite_one(title, existing_html)[0]
+
+
+def _rewrite_one(title: str, existing_html: str) -> tuple[dict, bool]:
+    """_call_openai_rewrite's result, plus whether the reply parsed as a rewrite object.
+
+    False means html holds the model's raw reply (or a naive rewrite without requests), which must not be cached.
+    """
+    if not _openai_config()[0]:
+        raise RuntimeError("OPENAI_API_KEY or OPEN_AI_KEY not set in env.")
+
     prompt = f"""Rewrite the article below. Preserve factual content and examples. Improve clarity, add structure (h2/h3), add CTAs and internal/external links, and ensure it meets SEO checklist. Do NOT include <article> wrapper — only the inner HTML.
 
 Current title: {title}
@@ -154,60 +386,149 @@ Current title: {title}
 Article HTML:
 {existing_html[:12000]}
 """
+    if requests is None:
+        return _fallback_rewrite(title, existing_html), False
+
+    out = _retry(lambda: _responses_output_text(_REWRITE_SYSTEM, prompt))
     try:
-        import requests  # type: ignore
+        obj = _json_loads(out)
     except Exception:
-        # Fallback: naive rewrite (no external API). Try to improve structure slightly.
-        desc = re.sub(r"<[^>]+>", " ", existing_html)
-        desc = re.sub(r"\s+", " ", desc).strip()[:157]
-        if len(desc) > 150:
-            desc = desc[:157] + "..."
-        # Ensure an author byline and internal CTA exist
-        author = '<p class="byline">By Sparksmetrics — CRO & Analytics</p>'
-        if "<p class=\"byline\">" not in existing_html:
-            new_html = author + "\n" + existing_html
-        else:
-            new_html = existing_html
-        # add internal CTA at the end if missing
-        if "/schedule-a-call/" not in new_html:
-            new_html = new_html + '\n<div class="callout"><p class="callout-title">Want help?</p><a class="btn btn-primary" href="/schedule-a-call/">Hire Sparksmetrics</a></div>'
-        # Add simple JSON-LD Article schema
-        schema = {
-            "@context": "https://schema.org",
-            "@type": "Article",
-            "headline": title,
-            "author": {"@type": "Person", "name": "Sparksmetrics"},
-        }
-        schema_html = f'<script type="application/ld+json">{json.dumps(schema)}</script>\n'
-        final_html = schema_html + new_html
-        return {"title": title, "description": desc, "html": final_html}
-
-    resp = requests.post(
-        f"{base}/responses",
-        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-        json={
-            "model": model,
-            "input": [
-                {"role": "system", "content": system},
-                {"role": "user", "content": prompt},
-            ],
-            "text": {"format": {"type": "json_object"}},
-        },
-        timeout=60,
+        return {"title": title, "description": "", "html": out}, False
+    return obj, _is_rewrite(obj)
+
+
+def _request_rewrite_batch(items: list[tuple[str, str, str]]) -> dict[str, dict]:
+    """Rewrite several articles in one Responses call; ids the model left out are missing from the result."""
+    blocks = [
+        f"=== Article id: {item_id} ===\nCurrent title: {title}\n\nArticle HTML:\n{existing_html[:12000]}\n"
+        for item_id, title, existing_html in items
+    ]
+    prompt = (
+        "Rewrite each article below. Preserve factual content and examples. Improve clarity, add structure (h2/h3), "
+        "add CTAs and internal/external links, and ensure it meets SEO checklist. Do NOT include <article> wrapper — "
+        "only the inner HTML.\n\n" + "\n".join(blocks)
+    )
+    # n articles come back in one reply: scale the read timeout and output cap with the batch
+    n = len(items)
+    out = _retry(
+        lambda: _responses_output_text(
+            _REWRITE_SYSTEM, prompt, timeout=REWRITE_TIMEOUT * n, max_output_tokens=REWRITE_MAX_OUTPUT_TOKENS * n
+        )
     )
-    resp.raise_for_status()
-    data = resp.json()
-    out = (data.get("output_text") or "").strip()
     try:
-        obj = json.loads(out)
+        results = _json_loads(out).get("results") or []
     except Exception:
-        return {"title": title, "description": "", "html": out}
-    return obj
+        return {}
+    by_id = {}
+    for r in results:
+        if _is_rewrite(r) and str(r.get("id")) in {i for i, _, _ in items}:
+            by_id[str(r["id"])] = r
+    return by_id
+
+
+def _rewrite_cache_path(model: str, title: str, existing_html: str) -> Path:
+    h = hashlib.sha256()
+    # Only the first 12000 chars reach the prompt, so only they belong in the key
+    for part in (model, _REWRITE_SYSTEM, title, existing_html[:12000]):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return REWRITE_CACHE_DIR / f"{h.hexdigest()}.json"
+
+
+def _load_cached_rewrite(path: Path) -> dict | None:
+    try:
+        rewrite = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return rewrite if isinstance(rewrite, dict) else None
+
+
+def _store_cached_rewrite(path: Path, rewrite: dict) -> None:
+    """Write the rewrite atomically (temp file + rename); a failed write only costs a future cache miss."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{id(rewrite)}.tmp")
+        if orjson is not None:
+            tmp.write_bytes(orjson.dumps(rewrite))
+        else:
+            tmp.write_text(json.dumps(rewrite, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+    except (OSError, TypeError):
+        pass
+
+
+def _call_openai_rewrite_batch(
+    items: list[tuple[str, str, str]], use_cache: bool = True
+) -> tuple[dict[str, dict], dict[str, Path]]:
+    """Rewrite several articles, sending the ones not in the disk cache in one Responses call.
+
+    items are (id, title, existing_html). Returns ({id: {title, description, html}}, {id: cache path}).
+    Articles the batch reply left out (or a batch reply that isn't JSON) are retried one by one with
+    _call_openai_rewrite; ids whose retry also fails are missing from the result.
+
+    Nothing is written to the cache here: the second dict holds the cache path of every result that came
+    from the cache or parsed as a rewrite object, and the caller stores the ones it accepts
+    (_store_cached_rewrite) and drops the ones it rejects, so a rejected rewrite is never replayed.
+    """
+    api_key, _, model, _ = _openai_config()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY or OPEN_AI_KEY not set in env.")
+    if requests is None:
+        return {item_id: _fallback_rewrite(title, html) for item_id, title, html in items}, {}
+
+    results: dict[str, dict] = {}
+    cache_paths: dict[str, Path] = {}
+    if use_cache:
+        for item_id, title, existing_html in items:
+            path = _rewrite_cache_path(model, title, existing_html)
+            cache_paths[item_id] = path
+            cached = _load_cached_rewrite(path)
+            if cached is not None:
+                results[item_id] = cached
+    misses = [item for item in items if item[0] not in results]
+    # Only replies that parsed as rewrite objects may go to the cache; a raw non-JSON reply is used this run only
+    cacheable: set[str] = set(results)
+    if len(misses) == 1:
+        item_id, title, existing_html = misses[0]
+        rewrite, parsed = _rewrite_one(title, existing_html)
+        fresh = {item_id: rewrite}
+        if parsed:
+            cacheable.add(item_id)
+    elif misses:
+        fresh = _request_rewrite_batch(misses)
+        cacheable.update(fresh)
+        for item_id, title, existing_html in misses:
+            if item_id in fresh:
+                continue
+            try:
+                fresh[item_id], parsed = _rewrite_one(title, existing_html)
+            except Exception:
+                # Leave it out; _rewrite_batch logs "no result returned" for this article only
+                continue
+            if parsed:
+                cacheable.add(item_id)
+    else:
+        fresh = {}
+    results.update(fresh)
+    return results, {item_id: path for item_id, path in cache_paths.items() if item_id in cacheable}
 
 
 def extract_article_block(template_text: str) -> Tuple[str, Tuple[int, int]]:
     """Return inner HTML of <article class containing blog-prose>...</article> and (start,end) indices."""
-    m = re.search(r'(<article[^>]*class=["\'][^"\']*blog-prose[^"\']*["\'][^>]*>)(.*?)(</article>)', template_text, flags=re.I | re.S)
+    # Fast path: memchr-backed str.find for the lowercase tags every template uses; only each candidate
+    # open tag is checked with a regex, so nothing tracks a lazy body match across the file
+    i = template_text.find("<article")
+    while i >= 0:
+        m = _RE_ARTICLE_OPEN.match(template_text, i)
+        if m:
+            start = m.end()
+            end = template_text.find("</article>", start)
+            if end >= 0:
+                return template_text[start:end], (start, end)
+            break
+        i = template_text.find("<article", i + 8)
+    # Mixed-case markup: fall back to the case-insensitive block pattern
+    m = _RE_ARTICLE_BLOCK.search(template_text)
     if not m:
         raise RuntimeError("No <article class containing \"blog-prose\"> block found")
     inner = m.group(2)
@@ -216,30 +537,55 @@ def extract_article_block(template_text: str) -> Tuple[str, Tuple[int, int]]:
     return inner, (start, end)
 
 
-def run(dry_run: bool = True, force: bool = False, threshold: int = 70):
-    project_root = Path(__file__).resolve().parents[1]
-    _load_env(project_root)
-    templates_dir = project_root / "app" / "templates"
-    files = sorted(templates_dir.glob("blog_*.html"))
-    if not files:
-        print("No blog templates found.")
-        return
-    for f in files:
-        txt = f.read_text(encoding="utf-8")
-        # Extract title from template (Jinja uses {{ post.title }}) — try to find h1 content or placeholder
-        mtitle = re.search(r"<h1[^>]*>(.*?)</h1>", txt, flags=re.I | re.S)
-        title = mtitle.group(1).strip() if mtitle else f.stem
-        try:
-            inner, (s, e) = extract_article_block(txt)
-        except Exception as exc:
-            print(f"Skipping {f.name}: {exc}")
-            continue
+def _article_hash(inner: str) -> str:
+    return hashlib.sha256(inner.encode("utf-8")).hexdigest()
 
-        print(f"Processing {f.name} — title: {title}")
-        try:
-            rewritten = _call_openai_rewrite(title=title, existing_html=inner)
-        except Exception as exc:
-            print(f"Rewrite failed for {f.name}: {exc}")
+
+def _load_rewrite_state() -> dict:
+    try:
+        state = _json_loads(REWRITE_STATE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_rewrite_state(state: dict) -> None:
+    """Write the state atomically (temp file + rename); a failed write only means those files are rewritten again."""
+    try:
+        REWRITE_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = REWRITE_STATE_PATH.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(REWRITE_STATE_PATH)
+    except OSError:
+        pass
+
+
+def _rewrite_batch(
+    batch: list[tuple],
+    dry_run: bool,
+    force: bool,
+    threshold: int,
+    use_cache: bool = True,
+    state: dict | None = None,
+) -> list[str]:
+    """Rewrite, score and (unless dry_run) write one batch of extracted templates; returns the log lines.
+
+    Each written template's new article hash and score are recorded in state (keyed by file name).
+    """
+    log = [f"Processing {f.name} — title: {title}" for f, _, title, _, _, _ in batch]
+    try:
+        # file names are unique within the templates directory, so they serve as the batch ids
+        rewrites, cache_paths = _call_openai_rewrite_batch(
+            [(f.name, title, inner) for f, _, title, inner, _, _ in batch], use_cache=use_cache
+        )
+    except Exception as exc:
+        log.extend(f"Rewrite failed for {f.name}: {exc}" for f, *_ in batch)
+        return log
+
+    for f, txt, title, inner, s, e in batch:
+        rewritten = rewrites.get(f.name)
+        if rewritten is None:
+            log.append(f"Rewrite failed for {f.name}: no result returned for this article")
             continue
 
         new_html = rewritten.get("html") or ""
@@ -247,22 +593,122 @@ def run(dry_run: bool = True, force: bool = False, threshold: int = 70):
         new_description = rewritten.get("description") or ""
 
         score, breakdown = score_article(new_html, new_title, new_description, threshold_keyword=None)
-        print(f"SEO score for {f.name}: {score} — breakdown: {breakdown}")
+        log.append(f"SEO score for {f.name}: {score} — breakdown: {breakdown}")
 
+        cache_path = cache_paths.get(f.name)
         if score < threshold and not force:
-            print(f"Skipping overwrite for {f.name} (score {score} < {threshold}). Use --force to override.")
+            log.append(f"Skipping overwrite for {f.name} (score {score} < {threshold}). Use --force to override.")
+            if cache_path is not None:
+                # Don't cache a rejected rewrite (or keep one cached earlier): the next run asks the model again
+                try:
+                    cache_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
             continue
+        if cache_path is not None:
+            _store_cached_rewrite(cache_path, rewritten)
 
         # Build new template text: replace inner article block and update title/description placeholders if present
         new_txt = txt[:s] + "\n" + new_html.strip() + "\n" + txt[e:]
         # Replace static title occurrences if template hardcodes title (best-effort)
-        new_txt = re.sub(r'(<h1[^>]*>)(.*?)(</h1>)', r'\1' + new_title + r'\3', new_txt, count=1, flags=re.I | re.S)
+        new_txt = _RE_H1_PARTS.sub(r'\1' + new_title + r'\3', new_txt, count=1)
         # Replace meta description blocks (if template sets meta via block meta_description using post.description, skip)
         if dry_run:
-            print(f"[dry-run] Would overwrite {f.name} with new HTML (score {score}).")
+            log.append(f"[dry-run] Would overwrite {f.name} with new HTML (score {score}).")
         else:
-            f.write_text(new_txt, encoding="utf-8")
-            print(f"Wrote updated template: {f.name}")
+            # Each file belongs to exactly one batch, so concurrent workers never write the same template.
+            # Temp file + rename: an interrupted run leaves the old template, never a truncated one.
+            tmp = f.with_suffix(".html.tmp")
+            tmp.write_text(new_txt, encoding="utf-8")
+            tmp.replace(f)
+            log.append(f"Wrote updated template: {f.name}")
+            if state is not None:
+                # What extract_article_block will return for the written file; file names are unique per batch
+                state[f.name] = {"hash": _article_hash("\n" + new_html.strip() + "\n"), "score": score}
+    return log
+
+
+def _changed_template_names(project_root: Path, since: str) -> set[str] | None:
+    """Names of the blog templates that differ between git ref since and the working tree; None when git fails."""
+    try:
+        out = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", since, "--", "app/templates"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError) as exc:
+        print(f"Could not diff against {since} ({exc}); processing all templates.")
+        return None
+    return {Path(line).name for line in out.splitlines() if line}
+
+
+def run(
+    dry_run: bool = True,
+    force: bool = False,
+    threshold: int = 70,
+    batch_size: int = REWRITE_BATCH_SIZE,
+    workers: int = REWRITE_WORKERS,
+    use_cache: bool = True,
+    limit: int | None = None,
+    since: str | None = None,
+):
+    project_root = Path(__file__).resolve().parents[1]
+    _load_env(project_root)
+    _openai_config.cache_clear()
+    templates_dir = project_root / "app" / "templates"
+    # One scandir pass with plain prefix/suffix tests (no fnmatch); sorted by name, same order as the old glob
+    with os.scandir(templates_dir) as it:
+        files = sorted(
+            Path(e.path) for e in it if e.name.startswith("blog_") and e.name.endswith(".html") and e.is_file()
+        )
+    if not files:
+        print("No blog templates found.")
+        return
+    # Templates whose article is unchanged since an accepted rewrite are skipped (unless --no-cache)
+    state = _load_rewrite_state() if use_cache else {}
+    # Extract every article first, so the rewrites can go out batch_size articles per request
+    if since:
+        changed = _changed_template_names(project_root, since)
+        if changed is not None:
+            files = [f for f in files if f.name in changed]
+            print(f"{len(files)} template(s) changed since {since}.")
+    pending = []
+    for f in files:
+        if limit is not None and len(pending) >= limit:
+            # Enough work for this run; the remaining templates are not even read
+            break
+        # Decode the bytes directly (templates are LF-only, so read_text's newline translation is a no-op)
+        txt = f.read_bytes().decode("utf-8")
+        # Extract title from template (Jinja uses {{ post.title }}) — try to find h1 content or placeholder
+        mtitle = _RE_H1.search(txt)
+        title = mtitle.group(1).strip() if mtitle else f.stem
+        try:
+            inner, (s, e) = extract_article_block(txt)
+        except Exception as exc:
+            print(f"Skipping {f.name}: {exc}")
+            continue
+        prev = state.get(f.name)
+        if prev and prev.get("hash") == _article_hash(inner) and (prev.get("score") or 0) >= threshold:
+            print(f"Skipping {f.name}: unchanged since its last rewrite (score {prev['score']})")
+            continue
+        pending.append((f, txt, title, inner, s, e))
+    if not pending:
+        return
+
+    batch_size = max(1, batch_size)
+    batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+    # The pool size caps concurrent API requests; 429/5xx responses back off and retry inside each call.
+    # map keeps the log in file order.
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as ex:
+        for lines in ex.map(lambda b: _rewrite_batch(b, dry_run, force, threshold, use_cache, state), batches):
+            for line in lines:
+                print(line)
+    if not dry_run:
+        _save_rewrite_state(state)
+    if _USAGE["input"]:
+        print(f"Prompt tokens: {_USAGE['input']} ({_USAGE['cached']} served from the prompt cache)")
 
 
 if __name__ == "__main__":
@@ -270,6 +716,28 @@ if __name__ == "__main__":
     parser.add_argument("--dry-run", action="store_true", help="Don't write files")
     parser.add_argument("--force", action="store_true", help="Overwrite even if score below threshold")
     parser.add_argument("--threshold", type=int, default=70, help="Publish threshold (0-100)")
+    parser.add_argument("--batch-size", type=int, default=REWRITE_BATCH_SIZE, help="Articles per OpenAI request (1 = one request per article)")
+    parser.add_argument("--workers", type=int, default=REWRITE_WORKERS, help="Concurrent OpenAI requests")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached rewrites and the rewrite state: call the API for every article",
+    )
+    parser.add_argument("--limit", type=int, default=None, help="Process at most this many templates")
+    parser.add_argument(
+        "--since",
+        default=None,
+        help="Only tracked templates changed since this git ref (e.g. HEAD~1), including uncommitted edits",
+    )
     args = parser.parse_args()
-    run(dry_run=args.dry_run, force=args.force, threshold=args.threshold)
+    run(
+        dry_run=args.dry_run,
+        force=args.force,
+        threshold=args.threshold,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        limit=args.limit,
+        since=args.since,
+    )
 
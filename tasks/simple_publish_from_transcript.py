@@ -7,9 +7,10 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import re
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 
 from pathlib import Path as _Path
 import sys as _sys
@@ -19,7 +20,11 @@ _root = _Path(__file__).resolve().parents[1]
 if str(_root) not in _sys.path:
     _sys.path.insert(0, str(_root))
 
-from tasks.auto_blog_from_youtube import _load_env, build_post_template, slugify
+from tasks.auto_blog_from_youtube import _iter_sentences, _load_env, load_blog_posts, save_blog_posts, slugify, write_post_template
+
+_RE_LINE_SPLIT = re.compile(r"\n{1,}|\r\n{1,}")
+# Transcript lines that read like an instruction; these seed the implementation checklist
+_RE_ACTION_LINE = re.compile(r"^(?:You should|You can|Make sure|Run|Use|Ask)\b.*", re.I)
 
 
 def load_transcript(path: Path) -> str:
@@ -28,7 +33,7 @@ def load_transcript(path: Path) -> str:
 
 def split_into_sections(transcript: str, n: int = 5) -> list[str]:
     # naive split by sentences into roughly n chunks
-    sentences = re.split(r"(?<=[.!?])\s+", transcript)
+    sentences = list(_iter_sentences(transcript))
     if not sentences:
         return []
     chunk_size = max(1, len(sentences) // n)
@@ -37,14 +42,31 @@ def split_into_sections(transcript: str, n: int = 5) -> list[str]:
         sec = " ".join(sentences[i : i + chunk_size]).strip()
         if sec:
             sections.append(sec)
+            # Only the first n chunks are kept: stop instead of joining the remainder just to drop it
+            if len(sections) == n:
+                break
     return sections[:n]
 
 
-def paragraphs_from_text(text: str) -> list[str]:
-    paras = [p.strip() for p in re.split(r"\n{1,}|\r\n{1,}", text) if p.strip()]
+def _iter_line_paragraphs(text: str) -> Iterator[str]:
+    """Non-blank lines of text, stripped, produced lazily (same pieces as _RE_LINE_SPLIT.split)."""
+    start = 0
+    for m in _RE_LINE_SPLIT.finditer(text):
+        p = text[start : m.start()].strip()
+        if p:
+            yield p
+        start = m.end()
+    p = text[start:].strip()
+    if p:
+        yield p
+
+
+def paragraphs_from_text(text: str, limit: int | None = None) -> list[str]:
+    """Paragraphs of text (one per non-blank line); with limit, only the first limit lines are split off."""
+    paras = list(islice(_iter_line_paragraphs(text), limit))
     if not paras:
         # fallback: split by sentences into paragraphs of ~3 sentences
-        sents = re.split(r"(?<=[.!?])\s+", text)
+        sents = list(_iter_sentences(text))
         paras = []
         for i in range(0, len(sents), 3):
             paras.append(" ".join(sents[i : i + 3]).strip())
@@ -52,12 +74,11 @@ def paragraphs_from_text(text: str) -> list[str]:
 
 
 def build_article_html_from_transcript(transcript: str) -> str:
-    paras = paragraphs_from_text(transcript)
+    # Only the intro and the first 8 paragraphs (checklist candidates) are used: don't split the rest of the transcript
+    paras = paragraphs_from_text(transcript, limit=8)
     sections = split_into_sections(transcript, n=5)
-    parts = []
-    parts.append('<nav id="toc" class="mb-6 p-4 bg-primary/5 rounded-lg"><strong>Table of contents</strong><ul class="ml-4 mt-2">')
-    for i, s in enumerate(sections, 1):
-        parts.append(f'<li><a href="#sec-{i}">Section {i}</a></li>')
+    parts = ['<nav id="toc" class="mb-6 p-4 bg-primary/5 rounded-lg"><strong>Table of contents</strong><ul class="ml-4 mt-2">']
+    parts.extend(f'<li><a href="#sec-{i}">Section {i}</a></li>' for i in range(1, len(sections) + 1))
     parts.append("</ul></nav>")
 
     # intro
@@ -72,7 +93,7 @@ def build_article_html_from_transcript(transcript: str) -> str:
     # checklist: top actionable bullets extracted naively from transcript (first lines with verbs)
     checklist = []
     for p in paras[:8]:
-        m = re.match(r"^(?:You should|You can|Make sure|Run|Use|Ask)\b.*", p, flags=re.I)
+        m = _RE_ACTION_LINE.match(p)
         if m:
             checklist.append(p if len(p) < 220 else p[:217] + "...")
     if not checklist:
@@ -84,8 +105,7 @@ def build_article_html_from_transcript(transcript: str) -> str:
 
     parts.append('<section class="mt-10 p-6 bg-light-base border border-gray-200 rounded-2xl">')
     parts.append("<h3>Implementation checklist</h3><ul>")
-    for it in checklist:
-        parts.append(f"<li>{it}</li>")
+    parts.extend(f"<li>{it}</li>" for it in checklist)
     parts.append("</ul></section>")
 
     # FAQs simple
@@ -105,11 +125,9 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True):
     tpl_name = f"blog_{slug}.html"
     tpl_path = templates_dir / tpl_name
 
-    post_meta = {}
-    if posts_path.exists():
-        data = json.loads(posts_path.read_text(encoding="utf-8"))
-        posts = data.get("posts") if isinstance(data, dict) else data
-        post_meta = next((p for p in posts if p.get("slug") == slug), {}) if posts else {}
+    # Read the archive once: it supplies the existing post's metadata and is the base for the update below
+    posts = load_blog_posts(posts_path)
+    post_meta = next((p for p in posts if p.get("slug") == slug), {})
 
     transcript = load_transcript(transcript_file)
     article_html = build_article_html_from_transcript(transcript)
@@ -128,19 +146,15 @@ def run(slug: str, transcript_file: Path, overwrite: bool = True):
         "video_id": post_meta.get("video_id") or "",
     }
 
-    template_text = build_post_template(video_id=post["video_id"], post=post, article_html=article_html)
     if overwrite:
-        tpl_path.write_text(template_text, encoding="utf-8")
+        with tpl_path.open("w", encoding="utf-8") as out:
+            write_post_template(out, video_id=post["video_id"], post=post, article_html=article_html)
         print("Wrote template:", tpl_path)
-        # update posts JSON
-        posts = []
-        if posts_path.exists():
-            data = json.loads(posts_path.read_text(encoding="utf-8"))
-            posts = data.get("posts") if isinstance(data, dict) else data
-            # remove existing with same slug
-            posts = [p for p in posts if p.get("slug") != slug]
+        # update posts JSON: remove existing with same slug
+        posts = [p for p in posts if p.get("slug") != slug]
         posts.insert(0, post)
-        posts_path.write_text(json.dumps({"posts": posts}, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        # Temp file + rename (no torn archive on a crash); orjson when installed, same indent=2 layout
+        save_blog_posts(posts_path, posts)
         print("Updated posts json:", posts_path)
     else:
         print("[dry-run] Would write template:", tpl_path)